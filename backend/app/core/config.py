@@ -43,6 +43,12 @@ class Settings(BaseSettings):
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = 6379
     
+    # Vector Tiles
+    TILE_CACHE_TTL_SECONDS: int = 86400
+    TILE_HTTP_MAX_AGE: int = 300
+    TILE_EXTENT: int = 4096
+    TILE_BUFFER: int = 64
+    
     # MinIO/S3
     MINIO_ENDPOINT: str = "localhost:9000"
     MINIO_ACCESS_KEY: str = "minioadmin"
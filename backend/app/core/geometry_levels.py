@@ -0,0 +1,81 @@
+"""Precomputed, zoom-dependent simplifications of boundary polygons.
+
+Each boundary column has one generated column per level, e.g. ``boundary_l1`` ..
+``boundary_l4``. PostgreSQL recomputes them on every insert and update, so they cannot
+drift from the original. Geometry endpoints use ``level_for_zoom`` to choose the
+coarsest level that still looks exact at the requested zoom. Above the last level they
+serve the original column.
+"""
+import math
+from typing import Optional, Sequence, Tuple
+
+from geoalchemy2 import Geometry
+from sqlalchemy import Column, Computed, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import deferred
+
+# (level, tolerance in degrees, highest zoom served from it). Each tolerance is about
+# half a 256px-tile pixel at that zoom, so simplification stays invisible.
+GEOMETRY_LEVELS: Sequence[Tuple[int, float, int]] = (
+    (1, 0.01, 6),     # ~1.1 km: national and multi-state views
+    (2, 0.002, 8),    # ~220 m: state
+    (3, 0.0005, 10),  # ~55 m: district
+    (4, 0.0001, 12),  # ~11 m: block
+)
+
+# Boundary columns that carry levels, per table.
+LEVELLED_COLUMNS = {
+    "fra_claims": "claim_boundary",
+    "villages": "boundary",
+}
+
+
+def level_column(column: str, level: Optional[int]) -> str:
+    return column if level is None else f"{column}_l{level}"
+
+
+def level_for_zoom(zoom: float) -> Optional[int]:
+    """Level to serve at ``zoom``; None means full resolution."""
+    for level, _, max_zoom in GEOMETRY_LEVELS:
+        if zoom <= max_zoom:
+            return level
+    return None
+
+
+def zoom_for_bbox(min_lng: float, max_lng: float, viewport_px: int = 1024) -> float:
+    """Web-map zoom at which ``viewport_px`` pixels span the given longitude range."""
+    width = max(max_lng - min_lng, 1e-9)
+    return max(math.log2(360 * viewport_px / (256 * width)), 0.0)
+
+
+def _expression(column: str, tolerance: float) -> str:
+    return f"ST_SimplifyPreserveTopology({column}, {tolerance})"
+
+
+def simplified_column(column: str, level: int):
+    """Deferred generated column holding ``column`` simplified for ``level``."""
+    tolerance = dict((lvl, tol) for lvl, tol, _ in GEOMETRY_LEVELS)[level]
+    return deferred(
+        Column(
+            level_column(column, level),
+            # Simplification may turn a polygon into a multipolygon, so the type is left open.
+            Geometry("GEOMETRY", srid=4326, spatial_index=False),
+            Computed(_expression(column, tolerance), persisted=True),
+        )
+    )
+
+
+def add_missing_level_columns(engine: Engine) -> None:
+    """Add level columns to tables created before they existed.
+
+    PostgreSQL fills generated columns for existing rows as part of ADD COLUMN.
+    """
+    with engine.begin() as conn:
+        for table, column in LEVELLED_COLUMNS.items():
+            for level, tolerance, _ in GEOMETRY_LEVELS:
+                conn.execute(
+                    text(
+                        f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS {level_column(column, level)} "
+                        f"geometry(Geometry, 4326) GENERATED ALWAYS AS ({_expression(column, tolerance)}) STORED"
+                    )
+                )
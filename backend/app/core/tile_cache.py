@@ -0,0 +1,59 @@
+import logging
+from typing import Optional
+
+import redis
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class TileCache:
+    """Generated vector tiles, shared by all API workers through Redis.
+
+    Keys embed a per-layer generation number; writes that change a layer bump the
+    generation so every cached tile of that layer is bypassed at once and ages out via
+    its TTL. Redis being unavailable only disables caching, never tile serving.
+    """
+
+    def __init__(self, host: str, port: int, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self._client = redis.Redis(host=host, port=port, socket_timeout=0.25, socket_connect_timeout=0.25)
+
+    def generation(self, layer: str) -> Optional[int]:
+        """Current generation of ``layer``; None (caching off) if Redis is unavailable.
+
+        Read it once before querying and pass it to both ``get`` and ``set``: a tile
+        rendered before an ``invalidate`` then lands under the old, bypassed generation.
+        """
+        try:
+            return int(self._client.get(f"tiles:{layer}:generation") or 0)
+        except redis.RedisError as e:
+            logger.warning(f"Tile cache read failed: {e}")
+            return None
+
+    @staticmethod
+    def _key(layer: str, generation: int, z: int, x: int, y: int) -> str:
+        return f"tiles:{layer}:{generation}:{z}/{x}/{y}"
+
+    def get(self, layer: str, generation: int, z: int, x: int, y: int) -> Optional[bytes]:
+        try:
+            return self._client.get(self._key(layer, generation, z, x, y))
+        except redis.RedisError as e:
+            logger.warning(f"Tile cache read failed: {e}")
+            return None
+
+    def set(self, layer: str, generation: int, z: int, x: int, y: int, tile: bytes) -> None:
+        try:
+            self._client.set(self._key(layer, generation, z, x, y), tile, ex=self.ttl_seconds)
+        except redis.RedisError as e:
+            logger.warning(f"Tile cache write failed: {e}")
+
+    def invalidate(self, layer: str) -> None:
+        try:
+            self._client.incr(f"tiles:{layer}:generation")
+        except redis.RedisError as e:
+            logger.warning(f"Tile cache invalidation failed for {layer}: {e}")
+
+
+tile_cache = TileCache(settings.REDIS_HOST, settings.REDIS_PORT, settings.TILE_CACHE_TTL_SECONDS)
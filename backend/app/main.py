@@ -14,6 +14,7 @@ from app.routers import (
     analytics,
     ocr,
     schemes,
+    tiles,
 )
 
 
@@ -68,6 +69,7 @@ app.include_router(grievances.router, prefix="/api/grievances", tags=["Grievance
 app.include_router(analytics.router, prefix="/api/analytics", tags=["Analytics"])
 app.include_router(ocr.router, prefix="/api/ocr", tags=["OCR Digitization"])
 app.include_router(schemes.router, prefix="/api/schemes", tags=["Schemes"])
+app.include_router(tiles.router, prefix="/api/tiles", tags=["Vector Tiles"])
 
 
 @app.get("/")
@@ -8,6 +8,7 @@ from geoalchemy2 import Geometry
 import enum
 
 from app.core.database import Base
+from app.core.geometry_levels import simplified_column
 
 
 class ClaimStatus(str, enum.Enum):
@@ -49,6 +50,11 @@ class FRAClaim(Base):
     area_claimed_ha = Column(Float)
     area_verified_ha = Column(Float)
     claim_boundary = Column(Geometry("POLYGON", srid=4326))
+    # Simplified copies for low zooms, maintained by PostgreSQL (see app/core/geometry_levels.py)
+    claim_boundary_l1 = simplified_column("claim_boundary", 1)
+    claim_boundary_l2 = simplified_column("claim_boundary", 2)
+    claim_boundary_l3 = simplified_column("claim_boundary", 3)
+    claim_boundary_l4 = simplified_column("claim_boundary", 4)
     
     # Status & Timeline
     status = Column(Enum(ClaimStatus), default=ClaimStatus.received, index=True)
@@ -95,6 +101,10 @@ class Village(Base):
     
     # Geometry
     boundary = Column(Geometry("POLYGON", srid=4326))
+    boundary_l1 = simplified_column("boundary", 1)
+    boundary_l2 = simplified_column("boundary", 2)
+    boundary_l3 = simplified_column("boundary", 3)
+    boundary_l4 = simplified_column("boundary", 4)
     centroid = Column(Geometry("POINT", srid=4326))
     
     # Demographics
@@ -5,6 +5,7 @@ from typing import List, Optional
 from datetime import date
 
 from app.core.database import get_db
+from app.core.tile_cache import tile_cache
 from app.models.fra_models import FRAClaim, ClaimStatus, ClaimType
 from app.schemas.fra_schemas import (
     FRAClaim as FRAClaimSchema,
@@ -62,6 +63,7 @@ async def create_claim(claim: FRAClaimCreate, db: Session = Depends(get_db)):
     db.add(db_claim)
     db.commit()
     db.refresh(db_claim)
+    tile_cache.invalidate("claims")
     return db_claim
 
 
@@ -82,6 +84,7 @@ async def update_claim(
     
     db.commit()
     db.refresh(db_claim)
+    tile_cache.invalidate("claims")
     return db_claim
 
 
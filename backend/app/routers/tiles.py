@@ -0,0 +1,186 @@
+import json
+from dataclasses import dataclass
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import get_db
+from app.core.geometry_levels import GEOMETRY_LEVELS, level_column, level_for_zoom, zoom_for_bbox
+from app.core.tile_cache import tile_cache
+
+router = APIRouter()
+
+MVT_MEDIA_TYPE = "application/vnd.mapbox-vector-tile"
+MAX_ZOOM = 22
+MAX_GEOJSON_FEATURES = 5000
+
+
+@dataclass(frozen=True)
+class TileLayer:
+    table: str
+    geometry_column: str
+    # Only the attributes the atlas styles and labels with; details come from the REST API.
+    attributes: str
+    minzoom: int
+
+
+TILE_LAYERS = {
+    "claims": TileLayer(
+        table="fra_claims",
+        geometry_column="claim_boundary",
+        attributes="t.claim_id, t.status::text AS status, t.claim_type::text AS claim_type",
+        minzoom=10,
+    ),
+    "villages": TileLayer(
+        table="villages",
+        geometry_column="boundary",
+        attributes=(
+            "t.code, t.name, "
+            "CASE WHEN t.total_claims > 0 "
+            "THEN round(100.0 * t.granted_claims / t.total_claims, 1) ELSE 0 END AS saturation"
+        ),
+        minzoom=5,
+    ),
+}
+
+
+LEVELS = [None] + [level for level, _, _ in GEOMETRY_LEVELS]
+
+
+def _tile_sql(layer_name: str, layer: TileLayer, level: Optional[int]) -> str:
+    # The && test against the 4326 envelope lets PostGIS use the layer's GiST index on the
+    # original column; the geometry itself comes from the precomputed level for this zoom.
+    # ST_AsMVTGeom clips to the tile (plus buffer) and quantizes to the tile grid.
+    return f"""
+        WITH bounds AS (
+            SELECT ST_TileEnvelope(:z, :x, :y) AS tile,
+                   ST_Transform(ST_TileEnvelope(:z, :x, :y, margin => :margin), 4326) AS search
+        ),
+        features AS (
+            SELECT t.id, {layer.attributes},
+                   ST_AsMVTGeom(
+                       ST_Transform(t.{level_column(layer.geometry_column, level)}, 3857),
+                       bounds.tile, :extent, :buffer, true
+                   ) AS geom
+            FROM {layer.table} t, bounds
+            WHERE t.{layer.geometry_column} && bounds.search
+        )
+        SELECT ST_AsMVT(features.*, '{layer_name}', :extent, 'geom', 'id')
+        FROM features
+        WHERE geom IS NOT NULL
+    """
+
+
+def _geojson_sql(layer: TileLayer, level: Optional[int]) -> str:
+    return f"""
+        SELECT t.id, {layer.attributes},
+               ST_AsGeoJSON(t.{level_column(layer.geometry_column, level)}, 6) AS geometry
+        FROM {layer.table} t
+        WHERE t.{layer.geometry_column} && ST_MakeEnvelope(:min_lng, :min_lat, :max_lng, :max_lat, 4326)
+        LIMIT :limit
+    """
+
+
+TILE_SQL = {
+    (name, level): text(_tile_sql(name, layer, level)) for name, layer in TILE_LAYERS.items() for level in LEVELS
+}
+GEOJSON_SQL = {
+    (name, level): text(_geojson_sql(layer, level)) for name, layer in TILE_LAYERS.items() for level in LEVELS
+}
+
+
+def _get_layer(layer: str) -> TileLayer:
+    tile_layer = TILE_LAYERS.get(layer)
+    if tile_layer is None:
+        raise HTTPException(status_code=404, detail=f"Unknown tile layer '{layer}'")
+    return tile_layer
+
+
+def _tile_response(tile: bytes) -> Response:
+    headers = {"Cache-Control": f"public, max-age={settings.TILE_HTTP_MAX_AGE}"}
+    if not tile:
+        return Response(status_code=204, headers=headers)
+    return Response(content=tile, media_type=MVT_MEDIA_TYPE, headers=headers)
+
+
+@router.get("/{layer}/{z}/{x}/{y}.mvt")
+def get_tile(layer: str, z: int, x: int, y: int, db: Session = Depends(get_db)):
+    """Get one Mapbox Vector Tile of claim or village boundaries"""
+    tile_layer = _get_layer(layer)
+    if not 0 <= z <= MAX_ZOOM or not (0 <= x < 2 ** z and 0 <= y < 2 ** z):
+        raise HTTPException(status_code=400, detail="Tile coordinates out of range")
+    if z < tile_layer.minzoom:
+        return _tile_response(b"")
+
+    generation = tile_cache.generation(layer)
+    if generation is not None:
+        cached = tile_cache.get(layer, generation, z, x, y)
+        if cached is not None:
+            return _tile_response(cached)
+
+    tile = db.execute(
+        TILE_SQL[layer, level_for_zoom(z)],
+        {
+            "z": z,
+            "x": x,
+            "y": y,
+            "extent": settings.TILE_EXTENT,
+            "buffer": settings.TILE_BUFFER,
+            "margin": settings.TILE_BUFFER / settings.TILE_EXTENT,
+        },
+    ).scalar()
+    tile = bytes(tile or b"")
+    if generation is not None:
+        tile_cache.set(layer, generation, z, x, y, tile)
+    return _tile_response(tile)
+
+
+@router.get("/{layer}.geojson")
+def get_features(
+    layer: str,
+    bbox: str = Query(..., description="min_lng,min_lat,max_lng,max_lat in EPSG:4326"),
+    zoom: Optional[float] = Query(None, ge=0, le=MAX_ZOOM, description="Map zoom; derived from bbox if omitted"),
+    db: Session = Depends(get_db),
+):
+    """Get boundaries inside a bounding box as GeoJSON, simplified for the zoom level"""
+    tile_layer = _get_layer(layer)
+    try:
+        min_lng, min_lat, max_lng, max_lat = (float(value) for value in bbox.split(","))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="bbox must be min_lng,min_lat,max_lng,max_lat")
+    if min_lng >= max_lng or min_lat >= max_lat:
+        raise HTTPException(status_code=400, detail="bbox is empty")
+
+    if zoom is None:
+        zoom = zoom_for_bbox(min_lng, max_lng)
+    if zoom < tile_layer.minzoom:
+        return {"type": "FeatureCollection", "features": [], "truncated": False}
+
+    rows = db.execute(
+        GEOJSON_SQL[layer, level_for_zoom(zoom)],
+        {
+            "min_lng": min_lng,
+            "min_lat": min_lat,
+            "max_lng": max_lng,
+            "max_lat": max_lat,
+            "limit": MAX_GEOJSON_FEATURES + 1,
+        },
+    ).mappings().all()
+
+    features = [
+        {
+            "type": "Feature",
+            "id": row["id"],
+            "geometry": json.loads(row["geometry"]) if row["geometry"] else None,
+            "properties": {key: value for key, value in row.items() if key not in ("id", "geometry")},
+        }
+        for row in rows[:MAX_GEOJSON_FEATURES]
+    ]
+    return {
+        "type": "FeatureCollection",
+        "features": features,
+        "truncated": len(rows) > MAX_GEOJSON_FEATURES,
+    }
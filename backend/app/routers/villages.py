@@ -4,6 +4,7 @@ from sqlalchemy import func
 from typing import List, Optional
 
 from app.core.database import get_db
+from app.core.tile_cache import tile_cache
 from app.models.fra_models import Village
 from app.schemas.fra_schemas import Village as VillageSchema, VillageCreate
 
@@ -50,6 +51,7 @@ async def create_village(village: VillageCreate, db: Session = Depends(get_db)):
     db.add(db_village)
     db.commit()
     db.refresh(db_village)
+    tile_cache.invalidate("villages")
     return db_village
 
 
@@ -8,6 +8,7 @@ import random
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.core.database import SessionLocal, engine
+from app.core.geometry_levels import add_missing_level_columns
 from app.models.fra_models import (
     Base, FRAClaim, Village, Officer, DSSRecommendation,
     Grievance, SchemeEnrollment, ClaimStatus, ClaimType
@@ -18,6 +19,7 @@ def create_tables():
     """Create all database tables"""
     print("Creating database tables...")
     Base.metadata.create_all(bind=engine)
+    add_missing_level_columns(engine)
     print("✓ Tables created successfully")
 
 
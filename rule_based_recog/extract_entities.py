@@ -1,9 +1,32 @@
 import argparse
+import hashlib
 import json
+import pickle
 import re
 import unicodedata
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, List, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+# Bump when the compiled step format changes so stale on-disk indexes are ignored.
+INDEX_FORMAT_VERSION = 2
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent / ".template_cache"
+
+# A compiled template: ("lit", compiled literal regex) / ("ph", placeholder name) steps.
+CompiledSteps = Tuple[Tuple[str, object], ...]
+
+# Unicode blocks of the scripts we ship templates for.
+SCRIPT_BLOCKS: Dict[str, Tuple[int, int]] = {
+    "devanagari": (0x0900, 0x097F),
+    "bengali": (0x0980, 0x09FF),
+    "odia": (0x0B00, 0x0B7F),
+    "tamil": (0x0B80, 0x0BFF),
+    "telugu": (0x0C00, 0x0C7F),
+}
+SCRIPT_SAMPLE_CHARS = 4000
+SCRIPT_MIN_LETTERS = 20
+SCRIPT_MIN_SHARE = 0.6
+ANCHORS_PER_TEMPLATE = 4
 
 
 def load_templates_from_files(paths: Iterable[Path]) -> List[Tuple[str, str]]:
@@ -163,22 +186,77 @@ def _tokenize_template(template_body: str) -> List[Tuple[str, str]]:
     return tokens
 
 
-def _match_template(template_body: str, doc_text: str) -> Dict[str, str] | None:
-    """Sequentially match template literals against the document and capture entities."""
-    doc_text = unicodedata.normalize("NFC", doc_text)
+def detect_script(text: str, sample_chars: int = SCRIPT_SAMPLE_CHARS) -> Optional[str]:
+    """Return the dominant Indic script of ``text`` from a Unicode-block histogram.
+
+    Only the first ``sample_chars`` characters are inspected. Returns None when too few
+    script letters are present or no script clearly dominates (e.g. English/mixed text).
+    """
+    counts: Dict[str, int] = {}
+    total = 0
+    for ch in text[:sample_chars]:
+        code = ord(ch)
+        if code < 0x0900 or code > 0x0C7F:
+            continue
+        for script, (lo, hi) in SCRIPT_BLOCKS.items():
+            if lo <= code <= hi:
+                counts[script] = counts.get(script, 0) + 1
+                total += 1
+                break
+    if total < SCRIPT_MIN_LETTERS:
+        return None
+    script, count = max(counts.items(), key=lambda item: item[1])
+    return script if count / total >= SCRIPT_MIN_SHARE else None
+
+
+def _literal_anchors(template_body: str, limit: int = ANCHORS_PER_TEMPLATE) -> Tuple[str, ...]:
+    """Pick the longest word runs from a template's literals.
+
+    _normalize_literal keeps word runs verbatim, so every one of them must occur in any
+    document the template matches; checking a few with ``in`` rejects most non-matching
+    templates without running the sequential regex match.
+    """
     template_body = unicodedata.normalize("NFC", template_body)
-    tokens = _tokenize_template(template_body)
-    cursor = 0
-    pending_placeholder: str | None = None
-    entities: Dict[str, str] = {}
+    runs = set()
+    for typ, val in _tokenize_template(template_body):
+        if typ != "lit":
+            continue
+        current: List[str] = []
+        for ch in val + " ":
+            if ch.isspace() or unicodedata.category(ch).startswith(("P", "S")):
+                if len(current) > 1:
+                    runs.add("".join(current))
+                current = []
+            else:
+                current.append(ch)
+    return tuple(sorted(runs, key=lambda run: (-len(run), run))[:limit])
+
 
-    for typ, val in tokens:
+@lru_cache(maxsize=None)
+def compile_template(template_body: str) -> CompiledSteps:
+    """Tokenize a template once and compile each non-blank literal to its regex."""
+    template_body = unicodedata.normalize("NFC", template_body)
+    steps: List[Tuple[str, object]] = []
+    for typ, val in _tokenize_template(template_body):
         if typ == "lit":
             # Skip empty literals to avoid zero-length loops.
             if not val.strip():
                 continue
-            pattern = re.compile(_normalize_literal(val), re.MULTILINE)
-            match = pattern.search(doc_text, cursor)
+            steps.append(("lit", re.compile(_normalize_literal(val), re.MULTILINE)))
+        else:
+            steps.append(("ph", val))
+    return tuple(steps)
+
+
+def _match_compiled(steps: CompiledSteps, doc_text: str) -> Dict[str, str] | None:
+    """Sequentially match compiled literals against NFC-normalized text and capture entities."""
+    cursor = 0
+    pending_placeholder: str | None = None
+    entities: Dict[str, str] = {}
+
+    for typ, val in steps:
+        if typ == "lit":
+            match = val.search(doc_text, cursor)
             if not match:
                 return None
             if pending_placeholder is not None:
@@ -197,8 +275,142 @@ def _match_template(template_body: str, doc_text: str) -> Dict[str, str] | None:
     return entities
 
 
-def extract_entities(templates: List[Tuple[str, str]], doc_text: str) -> List[Dict[str, Dict[str, str]]]:
-    """Attempt to match each template; return list of matches with entities."""
+def _match_template(template_body: str, doc_text: str) -> Dict[str, str] | None:
+    """Sequentially match template literals against the document and capture entities."""
+    doc_text = unicodedata.normalize("NFC", doc_text)
+    return _match_compiled(compile_template(template_body), doc_text)
+
+
+class CompiledTemplate:
+    """A template with its full and title-less step sequences compiled up front."""
+
+    __slots__ = ("template_id", "steps", "trimmed_steps", "script", "anchors")
+
+    def __init__(self, template_id: str, body: str) -> None:
+        self.template_id = template_id
+        self.steps = compile_template(body)
+        # Retry variant after dropping the first line (title) in case it diverges.
+        trimmed_body = body.split("\n", 1)[1] if "\n" in body else None
+        self.trimmed_steps: Optional[CompiledSteps] = (
+            compile_template(trimmed_body) if trimmed_body is not None else None
+        )
+        self.script = detect_script(body)
+        # Anchors come from the weakest variant so the prefilter never rejects a retry match.
+        self.anchors = _literal_anchors(trimmed_body if trimmed_body is not None else body)
+
+    def could_match(self, doc_text: str) -> bool:
+        return all(anchor in doc_text for anchor in self.anchors)
+
+    def match(self, doc_text: str) -> Dict[str, str] | None:
+        entities = _match_compiled(self.steps, doc_text)
+        if entities is None and self.trimmed_steps is not None:
+            entities = _match_compiled(self.trimmed_steps, doc_text)
+        return entities
+
+
+@lru_cache(maxsize=None)
+def _compiled_template(template_id: str, body: str) -> CompiledTemplate:
+    return CompiledTemplate(template_id, body)
+
+
+class TemplateIndex:
+    """Precompiled templates, optionally persisted to disk keyed by template file hash."""
+
+    def __init__(self, templates: Sequence[CompiledTemplate]) -> None:
+        self.templates = list(templates)
+        self._index_scripts()
+
+    def _index_scripts(self) -> None:
+        self.by_script: Dict[Optional[str], List[CompiledTemplate]] = {}
+        for template in self.templates:
+            self.by_script.setdefault(template.script, []).append(template)
+
+    def candidates(self, doc_text: str, script: Optional[str] = None) -> List[CompiledTemplate]:
+        """Templates worth a full match: same script as the document and all anchors present.
+
+        Documents without a dominant script are checked against every template.
+        """
+        if script is None:
+            script = detect_script(doc_text)
+        if script is None:
+            pool = self.templates
+        else:
+            pool = self.by_script.get(script, []) + self.by_script.get(None, [])
+        return [template for template in pool if template.could_match(doc_text)]
+
+    @classmethod
+    def from_templates(cls, templates: Iterable[Tuple[str, str]]) -> "TemplateIndex":
+        return cls([_compiled_template(template_id, body) for template_id, body in templates])
+
+    @staticmethod
+    def fingerprint(paths: Iterable[Path]) -> str:
+        digest = hashlib.sha256(f"v{INDEX_FORMAT_VERSION}".encode())
+        for path in sorted(Path(p) for p in paths):
+            digest.update(path.name.encode("utf-8"))
+            digest.update(path.read_bytes())
+        return digest.hexdigest()
+
+    @classmethod
+    def load(cls, paths: Iterable[Path], cache_dir: Optional[Path] = DEFAULT_CACHE_DIR) -> "TemplateIndex":
+        """Build the index for ``paths``, reusing a pickled copy when the files are unchanged."""
+        paths = list(paths)
+        cache_file: Optional[Path] = None
+        if cache_dir is not None:
+            cache_file = Path(cache_dir) / f"template_index_{cls.fingerprint(paths)}.pkl"
+            if cache_file.exists():
+                try:
+                    # Only plain tuples are stored so the cache is readable however this
+                    # module was imported (CLI script or the backend's in-process engine).
+                    with cache_file.open("rb") as handle:
+                        state = pickle.load(handle)
+                    index = cls.__new__(cls)
+                    index.__setstate__(state)
+                    return index
+                except Exception:
+                    pass  # Corrupt or incompatible cache; rebuild below.
+
+        index = cls.from_templates(load_templates_from_files(paths))
+        if cache_file is not None:
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp_file = cache_file.with_suffix(".tmp")
+                with tmp_file.open("wb") as handle:
+                    pickle.dump(index.__getstate__(), handle, protocol=pickle.HIGHEST_PROTOCOL)
+                tmp_file.replace(cache_file)
+            except OSError:
+                pass  # Read-only deployments simply skip the disk cache.
+        return index
+
+    def __getstate__(self):
+        return [
+            (t.template_id, t.steps, t.trimmed_steps, t.script, t.anchors) for t in self.templates
+        ]
+
+    def __setstate__(self, state) -> None:
+        self.templates = []
+        for template_id, steps, trimmed_steps, script, anchors in state:
+            template = CompiledTemplate.__new__(CompiledTemplate)
+            template.template_id = template_id
+            template.steps = steps
+            template.trimmed_steps = trimmed_steps
+            template.script = script
+            template.anchors = anchors
+            self.templates.append(template)
+        self._index_scripts()
+
+
+def extract_entities(
+    templates: Union[List[Tuple[str, str]], TemplateIndex],
+    doc_text: str,
+    script: Optional[str] = None,
+) -> List[Dict[str, Dict[str, str]]]:
+    """Attempt to match each candidate template; return list of matches with entities.
+
+    ``templates`` may be raw (template_id, body) pairs or a prebuilt TemplateIndex;
+    raw bodies are compiled once per process and memoized. Candidates are narrowed to
+    the document's script (auto-detected unless ``script`` is given) and to templates
+    whose anchor literals all occur in the text before the sequential match runs.
+    """
     tamil_clipping_fixes = {
         "ராமசாம": "ராமசாமி",
         "அம்மாள": "அம்மாள்",
@@ -217,16 +429,16 @@ def extract_entities(templates: List[Tuple[str, str]], doc_text: str) -> List[Di
             fixed = fixed.replace(wrong, correct)
         return fixed
 
+    if not isinstance(templates, TemplateIndex):
+        templates = TemplateIndex.from_templates(templates)
+
+    doc_text = unicodedata.normalize("NFC", doc_text)
     results: List[Dict[str, Dict[str, str]]] = []
-    for template_id, body in templates:
-        entities = _match_template(body, doc_text)
-        if entities is None and "\n" in body:
-            # Retry once after dropping the first line (title) in case it diverges.
-            trimmed_body = body.split("\n", 1)[1]
-            entities = _match_template(trimmed_body, doc_text)
+    for template in templates.candidates(doc_text, script):
+        entities = template.match(doc_text)
         if entities is not None:
             entities = {k: apply_tamil_fixes(v) if isinstance(v, str) else v for k, v in entities.items()}
-            results.append({"template_id": template_id, "entities": entities})
+            results.append({"template_id": template.template_id, "entities": entities})
     return results
 
 
@@ -248,7 +460,7 @@ def main() -> None:
         if not template_paths:
             raise FileNotFoundError("No template files found (expected template_*.txt)")
 
-    templates = load_templates_from_files(template_paths)
+    templates = TemplateIndex.load(template_paths)
 
     matches = extract_entities(templates, doc_text)
     if args.first and matches:
@@ -4,10 +4,8 @@ import os
 from pathlib import Path
 from typing import List, Optional
 
-from google.cloud import vision
-from google.cloud import translate_v2 as translate
-
 import extract_entities
+import translation
 
 
 def run_ocr(image_path: Path, language_hints: Optional[List[str]] = None) -> str:
@@ -15,6 +13,8 @@ def run_ocr(image_path: Path, language_hints: Optional[List[str]] = None) -> str
     if image_path.suffix.lower() in {".txt"}:
         return image_path.read_text(encoding="utf-8")
 
+    from google.cloud import vision
+
     client = vision.ImageAnnotatorClient()
     content = image_path.read_bytes()
     image = vision.Image(content=content)
@@ -27,12 +27,6 @@ def run_ocr(image_path: Path, language_hints: Optional[List[str]] = None) -> str
     return response.full_text_annotation.text
 
 
-def translate_text(text: str, target_language: str = "en") -> str:
-    translator = translate.Client()
-    result = translator.translate(text, target_language=target_language)
-    return result["translatedText"]
-
-
 def main() -> None:
     parser = argparse.ArgumentParser(
         description=(
@@ -55,7 +49,24 @@ def main() -> None:
     parser.add_argument(
         "--translate",
         action="store_true",
-        help="Translate extracted entity values to English using Cloud Translation.",
+        help="Translate extracted entity values to English.",
+    )
+    parser.add_argument(
+        "--translation-backend",
+        choices=["google", "offline"],
+        default=None,
+        help="Translation backend (default: $TRANSLATION_BACKEND or google). 'offline' needs no network.",
+    )
+    parser.add_argument(
+        "--glossary",
+        type=Path,
+        help="JSON {source: translation} glossary for the offline backend.",
+    )
+    parser.add_argument(
+        "--translation-memo",
+        type=Path,
+        default=translation.DEFAULT_MEMO_PATH,
+        help="SQLite file memoizing translations across runs.",
     )
     parser.add_argument(
         "--output",
@@ -69,10 +80,13 @@ def main() -> None:
     )
     args = parser.parse_args()
 
+    backend = translation.get_backend(args.translation_backend, args.glossary) if args.translate else None
+    needs_google = args.input.suffix.lower() != ".txt" or isinstance(backend, translation.GoogleTranslateBackend)
+
     # Handle credentials: explicit flag > existing env > default known path
     if args.credentials:
         os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = str(args.credentials)
-    elif "GOOGLE_APPLICATION_CREDENTIALS" not in os.environ:
+    elif needs_google and "GOOGLE_APPLICATION_CREDENTIALS" not in os.environ:
         default_key = Path(r"D:\documents\ocr-project-471010-8ec72b217dc3.json")
         if default_key.exists():
             os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = str(default_key)
@@ -87,21 +101,15 @@ def main() -> None:
 
     # Load templates (supports multi-language template_*.txt auto-discovery)
     template_paths = args.templates if args.templates else list(Path.cwd().glob("template_*.txt"))
-    templates = extract_entities.load_templates_from_files(template_paths)
+    templates = extract_entities.TemplateIndex.load(template_paths)
 
     # Extract entities
     matches = extract_entities.extract_entities(templates, ocr_text)
 
-    # Optionally translate each entity value to English
-    if args.translate and matches:
-        translated_matches = []
-        for item in matches:
-            entities = {
-                k: (translate_text(v) if isinstance(v, str) and v else v)
-                for k, v in item["entities"].items()
-            }
-            translated_matches.append({"template_id": item["template_id"], "entities": entities})
-        matches = translated_matches
+    # Optionally translate entity values to English (memo first, one batched call for misses)
+    if backend is not None and matches:
+        translator = translation.Translator(backend, translation.TranslationMemo(args.translation_memo))
+        matches = translator.translate_matches(matches)
 
     payload = json.dumps(matches, ensure_ascii=False, indent=2)
 
@@ -0,0 +1,92 @@
+"""
+Translation layer tests - memo, batching and the offline backend
+
+Run from the repository root: pytest rule_based_recog/tests
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from translation import OfflineBackend, TranslationBackend, TranslationMemo, Translator  # noqa: E402
+
+
+class RecordingBackend(TranslationBackend):
+    name = "recording"
+
+    def __init__(self):
+        self.calls = []
+
+    def translate_batch(self, texts, target_language):
+        self.calls.append(list(texts))
+        return [f"{text}-{target_language}" for text in texts]
+
+
+class TestOfflineBackend:
+    def test_glossary_lookup_and_pass_through(self):
+        backend = OfflineBackend({"मंडला": "Mandla"})
+        assert backend.translate_batch(["मंडला", "अज्ञात"], "en") == ["Mandla", "अज्ञात"]
+
+    def test_from_file(self, tmp_path):
+        glossary = tmp_path / "glossary.json"
+        glossary.write_text('{"बस्तर": "Bastar"}', encoding="utf-8")
+        assert OfflineBackend.from_file(glossary).translate_batch(["बस्तर"], "en") == ["Bastar"]
+
+    def test_base_backend_is_abstract(self):
+        with pytest.raises(TypeError):
+            TranslationBackend()
+
+
+class TestTranslator:
+    def test_memo_hits_skip_the_backend(self):
+        backend = RecordingBackend()
+        translator = Translator(backend, TranslationMemo(None))
+
+        assert translator.translate_many(["a", "b", "a"]) == ["a-en", "b-en", "a-en"]
+        assert backend.calls == [["a", "b"]]
+
+        # "a" and "b" are memo hits now; only the miss goes to the backend.
+        assert translator.translate_many(["b", "c"]) == ["b-en", "c-en"]
+        assert backend.calls == [["a", "b"], ["c"]]
+
+        # Another target language is a miss.
+        assert translator.translate_many(["a"], "hi") == ["a-hi"]
+        assert backend.calls[-1] == ["a"]
+
+    def test_memo_persists_across_instances(self, tmp_path):
+        path = tmp_path / "memo.sqlite"
+        Translator(RecordingBackend(), TranslationMemo(path)).translate_many(["a"])
+
+        backend = RecordingBackend()
+        assert Translator(backend, TranslationMemo(path)).translate_many(["a"]) == ["a-en"]
+        assert backend.calls == []
+
+    def test_memo_is_keyed_by_backend(self):
+        memo = TranslationMemo(None)
+        # The offline backend passes unknown text through unchanged...
+        assert Translator(OfflineBackend(), memo).translate_many(["अज्ञात"]) == ["अज्ञात"]
+
+        # ...which must not be served as the translation once a real backend is used.
+        backend = RecordingBackend()
+        assert Translator(backend, memo).translate_many(["अज्ञात"]) == ["अज्ञात-en"]
+        assert backend.calls == [["अज्ञात"]]
+
+    def test_translate_matches_makes_one_backend_call_per_document(self):
+        backend = RecordingBackend()
+        translator = Translator(backend, TranslationMemo(None))
+        matches = [
+            {"template_id": "A", "entities": {"village": "x", "district": "y", "area": 2.5}},
+            {"template_id": "B", "entities": {"village": "x", "tribe": "z", "empty": ""}},
+        ]
+
+        result = translator.translate_matches(matches)
+
+        assert len(backend.calls) == 1
+        assert sorted(backend.calls[0]) == ["x", "y", "z"]
+        assert result == [
+            {"template_id": "A", "entities": {"village": "x-en", "district": "y-en", "area": 2.5}},
+            {"template_id": "B", "entities": {"village": "x-en", "tribe": "z-en", "empty": ""}},
+        ]
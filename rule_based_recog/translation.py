@@ -0,0 +1,176 @@
+"""Batched, memoized translation of extracted entity values.
+
+Entity values (village, district and tribe names, ...) repeat across documents, so every
+translation is memoized in a small SQLite file keyed by (backend, source text, target
+language). The backend is part of the key so pass-through results from ``offline`` are
+never served once a real backend is configured.
+Values not in the memo are sent to the backend in one batched call per document.
+
+Backends are pluggable: ``google`` uses the Cloud Translation v2 client (one client per
+process); ``offline`` needs no network and returns glossary entries or the source text
+unchanged, for tests and air-gapped deployments.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+DEFAULT_MEMO_PATH = Path(__file__).resolve().parent / ".translation_memo.sqlite"
+# Cloud Translation v2 accepts at most 128 segments per request.
+GOOGLE_MAX_SEGMENTS = 128
+
+
+class TranslationBackend(ABC):
+    """Translate a batch of texts; results are returned in input order."""
+
+    name = "base"
+
+    @abstractmethod
+    def translate_batch(self, texts: List[str], target_language: str) -> List[str]:
+        """Translate ``texts`` into ``target_language``."""
+
+
+class GoogleTranslateBackend(TranslationBackend):
+    name = "google"
+
+    def __init__(self) -> None:
+        self._client = None
+        self._lock = threading.Lock()
+
+    def _get_client(self):
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    from google.cloud import translate_v2 as translate
+
+                    self._client = translate.Client()
+        return self._client
+
+    def translate_batch(self, texts: List[str], target_language: str) -> List[str]:
+        client = self._get_client()
+        translated: List[str] = []
+        for start in range(0, len(texts), GOOGLE_MAX_SEGMENTS):
+            chunk = texts[start : start + GOOGLE_MAX_SEGMENTS]
+            results = client.translate(chunk, target_language=target_language)
+            translated.extend(result["translatedText"] for result in results)
+        return translated
+
+
+class OfflineBackend(TranslationBackend):
+    """Glossary lookup with pass-through for unknown text; never touches the network."""
+
+    name = "offline"
+
+    def __init__(self, glossary: Optional[Dict[str, str]] = None) -> None:
+        self.glossary = glossary or {}
+
+    @classmethod
+    def from_file(cls, path: Path) -> "OfflineBackend":
+        return cls(json.loads(Path(path).read_text(encoding="utf-8")))
+
+    def translate_batch(self, texts: List[str], target_language: str) -> List[str]:
+        return [self.glossary.get(text, text) for text in texts]
+
+
+class TranslationMemo:
+    """Persistent (backend, source, target_language) -> translation dictionary backed by SQLite."""
+
+    def __init__(self, path: Optional[Path] = DEFAULT_MEMO_PATH) -> None:
+        target = ":memory:" if path is None else str(path)
+        if path is not None:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(target, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS translations ("
+                " backend TEXT NOT NULL,"
+                " source TEXT NOT NULL,"
+                " target_language TEXT NOT NULL,"
+                " translated TEXT NOT NULL,"
+                " PRIMARY KEY (backend, source, target_language))"
+            )
+
+    def get_many(self, backend: str, texts: Iterable[str], target_language: str) -> Dict[str, str]:
+        texts = list(texts)
+        found: Dict[str, str] = {}
+        # Stay well under SQLite's bound-parameter limit.
+        for start in range(0, len(texts), 500):
+            chunk = texts[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT source, translated FROM translations"
+                    f" WHERE backend = ? AND target_language = ? AND source IN ({placeholders})",
+                    [backend, target_language, *chunk],
+                ).fetchall()
+            found.update(rows)
+        return found
+
+    def put_many(self, backend: str, pairs: Dict[str, str], target_language: str) -> None:
+        if not pairs:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO translations (backend, source, target_language, translated)"
+                " VALUES (?, ?, ?, ?)",
+                [(backend, source, target_language, translated) for source, translated in pairs.items()],
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class Translator:
+    """Memo-first translation with a single backend call for all misses."""
+
+    def __init__(self, backend: TranslationBackend, memo: Optional[TranslationMemo] = None) -> None:
+        self.backend = backend
+        self.memo = memo if memo is not None else TranslationMemo(None)
+
+    def translate_many(self, texts: Iterable[str], target_language: str = "en") -> List[str]:
+        texts = list(texts)
+        unique = list(dict.fromkeys(text for text in texts if text))
+        known = self.memo.get_many(self.backend.name, unique, target_language)
+        misses = [text for text in unique if text not in known]
+        if misses:
+            translated = dict(zip(misses, self.backend.translate_batch(misses, target_language)))
+            self.memo.put_many(self.backend.name, translated, target_language)
+            known.update(translated)
+        return [known.get(text, text) for text in texts]
+
+    def translate_matches(
+        self, matches: List[Dict[str, Dict[str, str]]], target_language: str = "en"
+    ) -> List[Dict[str, Dict[str, str]]]:
+        """Translate every string entity value across all matches of one document at once."""
+        values = [
+            value
+            for item in matches
+            for value in item["entities"].values()
+            if isinstance(value, str) and value
+        ]
+        lookup = dict(zip(values, self.translate_many(values, target_language)))
+        return [
+            {
+                "template_id": item["template_id"],
+                "entities": {
+                    k: (lookup[v] if isinstance(v, str) and v else v) for k, v in item["entities"].items()
+                },
+            }
+            for item in matches
+        ]
+
+
+def get_backend(name: Optional[str] = None, glossary_path: Optional[Path] = None) -> TranslationBackend:
+    """Build a backend by name; defaults to $TRANSLATION_BACKEND or ``google``."""
+    name = (name or os.environ.get("TRANSLATION_BACKEND") or "google").lower()
+    if name == "google":
+        return GoogleTranslateBackend()
+    if name == "offline":
+        return OfflineBackend.from_file(glossary_path) if glossary_path else OfflineBackend()
+    raise ValueError(f"Unknown translation backend: {name}")
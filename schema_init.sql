@@ -43,7 +43,8 @@ CREATE TABLE IF NOT EXISTS villages (
   updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
   UNIQUE KEY uk_code (code),
   INDEX idx_state (state),
-  INDEX idx_district (district)
+  INDEX idx_district (district),
+  INDEX idx_village_updated_at (updated_at)
 ) ENGINE=InnoDB;
 
 CREATE TABLE IF NOT EXISTS officers (
@@ -106,6 +107,7 @@ CREATE TABLE IF NOT EXISTS claims (
   INDEX idx_claim_village (village_code),
   INDEX idx_claim_status (status),
   INDEX idx_assigned_officer (assigned_officer_id),
+  INDEX idx_claim_updated_at (updated_at),
   FOREIGN KEY fk_officer (assigned_officer_id) REFERENCES officers(officer_id) ON DELETE SET NULL
 ) ENGINE=InnoDB;
 
@@ -146,7 +148,21 @@ CREATE TABLE IF NOT EXISTS data_blobs (
   `key` VARCHAR(128) NOT NULL UNIQUE,
   description VARCHAR(512),
   payload JSON NOT NULL,
+  version INT NOT NULL DEFAULT 1,
   created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
   updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
   INDEX idx_key (`key`)
 ) ENGINE=InnoDB;
+
+CREATE TABLE IF NOT EXISTS claim_rollups (
+  id BIGINT UNSIGNED PRIMARY KEY AUTO_INCREMENT,
+  state VARCHAR(8) NOT NULL,
+  district VARCHAR(255) NOT NULL,
+  status VARCHAR(32) NOT NULL,
+  claim_type VARCHAR(8) NOT NULL,
+  claim_count INT NOT NULL DEFAULT 0,
+  area_acres FLOAT NOT NULL DEFAULT 0,
+  created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+  updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  UNIQUE KEY uq_claim_rollup_key (state, district, status, claim_type)
+) ENGINE=InnoDB;
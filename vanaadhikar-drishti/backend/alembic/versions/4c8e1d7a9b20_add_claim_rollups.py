@@ -0,0 +1,49 @@
+"""add claim rollups
+
+Revision ID: 4c8e1d7a9b20
+Revises: 1b2f5a4f2dcb
+Create Date: 2026-10-18
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+# revision identifiers, used by Alembic.
+revision = "4c8e1d7a9b20"
+down_revision = "1b2f5a4f2dcb"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+  op.create_table(
+    "claim_rollups",
+    sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+    sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+    sa.Column("id", mysql.BIGINT(unsigned=True), primary_key=True),
+    sa.Column("state", sa.String(length=8), nullable=False),
+    sa.Column("district", sa.String(length=255), nullable=False),
+    sa.Column("status", sa.String(length=32), nullable=False),
+    sa.Column("claim_type", sa.String(length=8), nullable=False),
+    sa.Column("claim_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+    sa.Column("area_acres", sa.Float(), nullable=False, server_default=sa.text("0")),
+    sa.UniqueConstraint("state", "district", "status", "claim_type", name="uq_claim_rollup_key"),
+    mysql_charset="utf8mb4",
+  )
+
+  # Backfill from the existing fact table; later writes maintain it incrementally.
+  op.execute(
+    """
+    INSERT INTO claim_rollups (state, district, status, claim_type, claim_count, area_acres)
+    SELECT state, district, status, claim_type, COUNT(*), COALESCE(SUM(area_acres), 0)
+    FROM claims
+    GROUP BY state, district, status, claim_type
+    """
+  )
+
+
+def downgrade() -> None:
+  op.drop_table("claim_rollups")
@@ -0,0 +1,28 @@
+"""add data blob version
+
+Revision ID: 7d3f2a6c5e14
+Revises: 4c8e1d7a9b20
+Create Date: 2026-10-18
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "7d3f2a6c5e14"
+down_revision = "4c8e1d7a9b20"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+  op.add_column(
+    "data_blobs",
+    sa.Column("version", sa.Integer(), nullable=False, server_default=sa.text("1")),
+  )
+
+
+def downgrade() -> None:
+  op.drop_column("data_blobs", "version")
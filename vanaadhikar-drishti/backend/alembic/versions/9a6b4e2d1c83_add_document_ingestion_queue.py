@@ -0,0 +1,41 @@
+"""add document ingestion queue columns
+
+Revision ID: 9a6b4e2d1c83
+Revises: 7d3f2a6c5e14
+Create Date: 2026-10-18
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "9a6b4e2d1c83"
+down_revision = "7d3f2a6c5e14"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+  op.add_column(
+    "master_documents",
+    sa.Column("attempts", sa.Integer(), nullable=False, server_default=sa.text("0")),
+  )
+  op.add_column("master_documents", sa.Column("started_at", sa.DateTime(timezone=True), nullable=True))
+  op.add_column("master_documents", sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True))
+  op.add_column("master_documents", sa.Column("error_message", sa.Text(), nullable=True))
+  op.create_index(
+    op.f("ix_master_documents_processing_status"),
+    "master_documents",
+    ["processing_status"],
+    unique=False,
+  )
+
+
+def downgrade() -> None:
+  op.drop_index(op.f("ix_master_documents_processing_status"), table_name="master_documents")
+  op.drop_column("master_documents", "error_message")
+  op.drop_column("master_documents", "completed_at")
+  op.drop_column("master_documents", "started_at")
+  op.drop_column("master_documents", "attempts")
@@ -0,0 +1,36 @@
+"""add document content hash
+
+Revision ID: b3e7c1f05a92
+Revises: 9a6b4e2d1c83
+Create Date: 2026-10-18
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "b3e7c1f05a92"
+down_revision = "9a6b4e2d1c83"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+  op.add_column("master_documents", sa.Column("content_hash", sa.String(length=64), nullable=True))
+  op.add_column("master_documents", sa.Column("ocr_language", sa.String(length=50), nullable=True))
+  op.add_column("master_documents", sa.Column("template_version", sa.String(length=80), nullable=True))
+  op.create_index(
+    "ix_master_documents_content",
+    "master_documents",
+    ["content_hash", "ocr_language"],
+    unique=False,
+  )
+
+
+def downgrade() -> None:
+  op.drop_index("ix_master_documents_content", table_name="master_documents")
+  op.drop_column("master_documents", "template_version")
+  op.drop_column("master_documents", "ocr_language")
+  op.drop_column("master_documents", "content_hash")
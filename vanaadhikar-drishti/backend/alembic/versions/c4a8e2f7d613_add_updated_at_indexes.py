@@ -0,0 +1,27 @@
+"""add updated_at indexes on claims and villages
+
+Revision ID: c4a8e2f7d613
+Revises: b3e7c1f05a92
+Create Date: 2026-10-18
+"""
+from __future__ import annotations
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "c4a8e2f7d613"
+down_revision = "b3e7c1f05a92"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+  # The in-process spatial index polls for rows changed since its last refresh.
+  op.create_index("idx_claim_updated_at", "claims", ["updated_at"], unique=False)
+  op.create_index("idx_village_updated_at", "villages", ["updated_at"], unique=False)
+
+
+def downgrade() -> None:
+  op.drop_index("idx_village_updated_at", table_name="villages")
+  op.drop_index("idx_claim_updated_at", table_name="claims")
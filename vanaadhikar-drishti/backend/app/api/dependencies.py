@@ -40,17 +40,7 @@ async def get_current_user(
 ) -> UserResponse:
     """Dependency to get current authenticated user."""
     try:
-        user = AuthService.get_current_user(db, token)
-        return UserResponse(
-            id=user.id,
-            email=user.email,
-            name=user.name,
-            picture=user.picture,
-            provider=user.provider,
-            last_login=user.last_login,
-            created_at=user.created_at,
-            updated_at=user.updated_at,
-        )
+        return AuthService.get_current_user_profile(db, token)
     except ValueError as e:
         raise HTTPException(status_code=401, detail=str(e))
 
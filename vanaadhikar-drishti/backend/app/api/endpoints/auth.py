@@ -6,7 +6,7 @@ import json
 from urllib.parse import urlencode, urljoin
 
 import httpx
-from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi import APIRouter, Cookie, Depends, Header, HTTPException, Response
 from fastapi.responses import JSONResponse, RedirectResponse
 from sqlalchemy.orm import Session
 
@@ -142,7 +142,22 @@ def get_current_user_profile(current_user: CurrentUser) -> UserResponse:
 
 
 @router.post("/logout")
-def logout(response: Response) -> dict:
-    """Logout by clearing auth token cookie."""
+def logout(
+    response: Response,
+    authorization: Annotated[str | None, Header()] = None,
+    auth_token: Annotated[str | None, Cookie()] = None,
+) -> dict:
+    """Logout by clearing auth token cookie and evicting it from the token cache."""
+    token = auth_token
+    if not token and authorization:
+        token = authorization.split()[-1]
+    if token:
+        try:
+            user_id = AuthService.verify_token(token).get("sub")
+            if user_id:
+                AuthService.invalidate_user(int(user_id))
+        except ValueError:
+            pass
+        AuthService.invalidate_token(token)
     response.delete_cookie(key="auth_token", samesite="lax")
     return {"message": "Logout successful"}
\ No newline at end of file
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
-from typing import Annotated
+from typing import Annotated, Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.api.dependencies import CurrentUser
+from app.core.config import settings
 from app.db.session import get_db
 from app.models.claim import Claim
-from app.schemas.domain import ClaimRead
-from app.schemas.pagination import ClaimsPaginatedResponse
-from app.services.data_service import search_claims
+from app.schemas.domain import ClaimImportResult, ClaimRead
+from app.schemas.pagination import ClaimsPaginatedResponse, ClaimsWithinBboxResponse
+from app.services.change_events import ChangeEvent, ChangeEventBus
+from app.services.claim_rollup_service import ClaimRollupService
+from app.services.data_service import claims_within_bbox, export_claims, import_claims, search_claims
+from app.services.spatial_index import SpatialIndexService
 
 
 router = APIRouter(prefix="/claims", tags=["claims"])
@@ -23,6 +28,8 @@ def list_claims(
     status: Annotated[str | None, Query(description="Filter by status")] = None,
     page: Annotated[int, Query(ge=1, description="Page number")] = 1,
     limit: Annotated[int, Query(ge=1, le=100, description="Items per page")] = 20,
+    cursor: Annotated[str | None, Query(description="Keyset cursor; send an empty value to start cursor pagination")] = None,
+    fields: Annotated[str | None, Query(description="Comma-separated fields to return, e.g. claim_id,status,area_acres")] = None,
     db: Session = Depends(get_db),
 ):
     """Get all claims with pagination and filtering.
@@ -33,10 +40,85 @@ def list_claims(
     - status: Filter by claim status (PENDING, APPROVED, REJECTED)
     - page: Page number (default 1)
     - limit: Items per page (default 20, max 100)
+    - cursor: Opaque cursor from a previous response's next_cursor (empty to start)
+    - fields: Comma-separated fields to return (e.g. claim_id,status,area_acres); omitted fields are not read from the database
     
     Returns paginated list of claims with metadata.
     """
-    return search_claims(db, state=state, status=status, district=district, page=page, limit=limit)
+    return search_claims(
+        db, state=state, status=status, district=district, page=page, limit=limit, cursor=cursor, fields=fields
+    )
+
+
+@router.get("/export")
+def export_claims_stream(
+    current_user: CurrentUser,
+    state: Annotated[str | None, Query(description="Filter by state")] = None,
+    district: Annotated[str | None, Query(description="Filter by district")] = None,
+    status: Annotated[str | None, Query(description="Filter by status")] = None,
+    fmt: Annotated[Literal["ndjson", "csv"], Query(alias="format", description="ndjson or csv")] = "ndjson",
+    db: Session = Depends(get_db),
+):
+    """Stream every claim matching the filters (requires authentication).
+
+    Query Parameters:
+    - state, district, status: Same filters as GET /claims
+    - format: ndjson (default) or csv
+
+    Rows are streamed from a server-side cursor, so memory use is constant
+    regardless of how many claims match.
+    """
+    media_type = "text/csv" if fmt == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        export_claims(db, fmt=fmt, state=state, status=status, district=district),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="claims.{fmt}"'},
+    )
+
+
+@router.post("/bulk", response_model=ClaimImportResult)
+def bulk_import_claims(
+    current_user: CurrentUser,
+    file: UploadFile = File(..., description="NDJSON or CSV file of claims"),
+    fmt: Annotated[Literal["ndjson", "csv"] | None, Query(alias="format", description="ndjson or csv")] = None,
+    db: Session = Depends(get_db),
+):
+    """Import many claims at once (requires authentication).
+
+    Query Parameters:
+    - format: ndjson or csv; inferred from the file extension when omitted
+
+    Accepts the columns produced by GET /claims/export. Rows are validated and
+    inserted in chunks; invalid or duplicate rows are reported per row without
+    aborting the rest of the import.
+    """
+    if fmt is None:
+        fmt = "csv" if (file.filename or "").lower().endswith(".csv") else "ndjson"
+    return import_claims(db, file.file, fmt=fmt, chunk_size=settings.claim_import_chunk_size)
+
+
+@router.get("/within-bbox", response_model=ClaimsWithinBboxResponse)
+def get_claims_within_bbox(
+    min_lat: Annotated[float, Query(ge=-90, le=90)],
+    min_lng: Annotated[float, Query(ge=-180, le=180)],
+    max_lat: Annotated[float, Query(ge=-90, le=90)],
+    max_lng: Annotated[float, Query(ge=-180, le=180)],
+    limit: Annotated[int, Query(ge=1, le=1000, description="Maximum claims to return")] = 100,
+    db: Session = Depends(get_db),
+):
+    """Get claims whose GPS point lies inside a bounding box.
+
+    Query Parameters:
+    - min_lat, min_lng, max_lat, max_lng: Box corners (WGS84)
+    - limit: Maximum claims to return (default 100, max 1000)
+
+    truncated is true when more claims fall inside the box than were returned.
+    """
+    if min_lat > max_lat or min_lng > max_lng:
+        raise HTTPException(status_code=400, detail="min_lat/min_lng must not exceed max_lat/max_lng")
+    return claims_within_bbox(
+        db, min_lat=min_lat, min_lng=min_lng, max_lat=max_lat, max_lng=max_lng, limit=limit
+    )
 
 
 @router.get("/{claim_id}", response_model=ClaimRead)
@@ -58,6 +140,18 @@ def create_claim(
     # Only authenticated users can create claims
     claim = Claim(**claim_data)
     db.add(claim)
+    ClaimRollupService.record_claim(db, claim)
     db.commit()
     db.refresh(claim)
+    SpatialIndexService.record("claims", claim.id, claim.gps_lat, claim.gps_lng)
+    ChangeEventBus.publish(
+        db,
+        ChangeEvent(
+            entity="claim",
+            action="created",
+            state=claim.state,
+            district=claim.district,
+            after={"status": claim.status, "area_acres": claim.area_acres},
+        ),
+    )
     return ClaimRead.model_validate(claim)
@@ -1,21 +1,32 @@
 from __future__ import annotations
 
+from datetime import datetime, timezone
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response, status
 
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
 from app.services.aggregation_service import AggregationService
 from app.services.cache_service import CacheService
+from app.tasks.cache_refresher import CacheRefresher
 
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
 
+def _cached_json(request: Request, key: str, payload: Any) -> Response:
+    """Send a cached payload as pre-encoded (and, when accepted, pre-compressed) bytes."""
+    encoded = CacheService.encode(key, payload, request.headers.get("accept-encoding"))
+    headers = {"Vary": "Accept-Encoding"}
+    if encoded.encoding != "identity":
+        headers["Content-Encoding"] = encoded.encoding
+    return Response(content=encoded.body, media_type="application/json", headers=headers)
+
+
 @router.get("/summary", response_model=dict[str, Any])
-def get_dashboard_summary(db: Session = Depends(get_db)):
+def get_dashboard_summary(request: Request, db: Session = Depends(get_db)):
     """Get dashboard summary with aggregated statistics.
     
     Includes:
@@ -25,34 +36,34 @@ def get_dashboard_summary(db: Session = Depends(get_db)):
     - Officers statistics (total, by state, claims handled)
     - Timeline statistics (daily, weekly, monthly trends)
     
-    Results are cached and refreshed every 15 minutes automatically.
+    Results are cached, kept current on claim and grievance writes, and refreshed ahead of expiry.
     """
     try:
         summary = AggregationService.get_dashboard_summary(db)
-        return summary
+        return _cached_json(request, CacheService.CACHE_KEYS["dashboard_summary"], summary)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating dashboard summary: {str(e)}")
 
 
 @router.get("/state/{state}", response_model=dict[str, Any])
-def get_state_snapshot(state: str, db: Session = Depends(get_db)):
+def get_state_snapshot(state: str, request: Request, db: Session = Depends(get_db)):
     """Get state-specific snapshot with aggregated statistics.
     
     Path Parameters:
     - state: State code (e.g., 'MP', 'CG', 'MH')
     
     Returns aggregated data for the specified state.
-    Results are cached and refreshed every 15 minutes automatically.
+    Results are cached, kept current on claim and grievance writes, and refreshed ahead of expiry.
     """
     try:
         snapshot = AggregationService.get_state_snapshot(db, state)
-        return snapshot
+        return _cached_json(request, AggregationService.state_snapshot_key(state), snapshot)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating state snapshot: {str(e)}")
 
 
 @router.get("/district/{state}/{district}", response_model=dict[str, Any])
-def get_district_snapshot(state: str, district: str, db: Session = Depends(get_db)):
+def get_district_snapshot(state: str, district: str, request: Request, db: Session = Depends(get_db)):
     """Get district-specific snapshot with aggregated statistics.
     
     Path Parameters:
@@ -62,49 +73,8 @@ def get_district_snapshot(state: str, district: str, db: Session = Depends(get_d
     Returns aggregated data for the specified district.
     """
     try:
-        cache_key = f"district_snapshot_{state}_{district}"
-        cached = CacheService.get_with_ttl(db, cache_key, ttl_minutes=15)
-        if cached:
-            return cached
-
-        from app.models.claim import Claim
-        from app.models.grievance import Grievance
-        from app.models.village import Village
-        from sqlalchemy import func
-
-        claims_query = db.query(Claim).filter(Claim.state == state, Claim.district == district)
-        grievances_query = db.query(Grievance).filter(
-            Grievance.state == state, Grievance.district == district
-        )
-        villages_query = db.query(Village).filter(Village.state == state, Village.district == district)
-
-        snapshot = {
-            "state": state,
-            "district": district,
-            "claims": {
-                "total": claims_query.count(),
-                "approved": claims_query.filter(Claim.status == "APPROVED").count(),
-                "pending": claims_query.filter(Claim.status == "PENDING").count(),
-                "rejected": claims_query.filter(Claim.status == "REJECTED").count(),
-                "total_area": float(
-                    claims_query.with_entities(func.sum(Claim.area_acres)).scalar() or 0
-                ),
-            },
-            "villages": {
-                "total": villages_query.count(),
-                "population": int(
-                    villages_query.with_entities(func.sum(Village.population)).scalar() or 0
-                ),
-            },
-            "grievances": {
-                "total": grievances_query.count(),
-                "open": grievances_query.filter(Grievance.status == "OPEN").count(),
-                "resolved": grievances_query.filter(Grievance.status == "RESOLVED").count(),
-            },
-        }
-
-        CacheService.set(db, cache_key, snapshot)
-        return snapshot
+        snapshot = AggregationService.get_district_snapshot(db, state, district)
+        return _cached_json(request, AggregationService.district_snapshot_key(state, district), snapshot)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating district snapshot: {str(e)}")
 
@@ -125,31 +95,28 @@ def get_cache_stats(db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Error getting cache stats: {str(e)}")
 
 
-@router.post("/cache/refresh")
-def refresh_cache(db: Session = Depends(get_db)):
-    """Manually refresh all cache entries.
+@router.post("/cache/refresh", status_code=status.HTTP_202_ACCEPTED)
+def refresh_cache(background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
+    """Queue a refresh of all cache entries.
     
-    Triggers immediate refresh of all aggregated statistics.
-    Useful for manual cache update without waiting for scheduled refresh.
+    Discovers the dashboard summary and the snapshot of every state and district that
+    has claims, and recomputes them in the background once the response has been sent,
+    so the sweep does not hold the request. Keys another worker is already recomputing
+    are skipped. Useful for manual cache update without waiting for scheduled refresh.
     """
     try:
-        AggregationService.get_dashboard_summary(db)
-        
-        states = ["MP", "CG", "MH", "OD", "JH", "TS", "VN", "GJ"]
-        for state in states:
-            try:
-                AggregationService.get_state_snapshot(db, state)
-            except Exception:
-                pass
-
-        return {
-            "status": "success",
-            "message": "Cache refreshed successfully",
-            "refreshed_at": "2026-02-23T10:30:00Z",
-        }
+        targets = CacheRefresher.discover_targets(db)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error refreshing cache: {str(e)}")
 
+    background_tasks.add_task(CacheRefresher.refresh_all, targets, db.get_bind())
+    return {
+        "status": "accepted",
+        "message": "Cache refresh started",
+        "discovered_keys": len(targets),
+        "requested_at": datetime.now(timezone.utc).isoformat(),
+    }
+
 
 @router.delete("/cache/clear")
 def clear_cache(db: Session = Depends(get_db)):
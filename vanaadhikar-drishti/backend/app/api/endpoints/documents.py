@@ -1,17 +1,19 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
 from app.db.session import get_db
-from app.schemas.document import DocumentUploadResponse, DocumentMetadata
+from app.models.master_document import MasterDocument
+from app.schemas.document import DocumentMetadata, DocumentStatusResponse, DocumentUploadResponse, RuleBasedPayload
 from app.services.document_service import document_ingestion_service
+from app.tasks.ingestion_worker import IngestionWorkerPool
 
 router = APIRouter(tags=["documents"])
 
 
-@router.post("/upload-document", response_model=DocumentUploadResponse)
+@router.post("/upload-document", response_model=DocumentUploadResponse, status_code=status.HTTP_202_ACCEPTED)
 def upload_document(
   file: UploadFile = File(...),
   document_type: str | None = Form(default=None),
@@ -28,4 +30,21 @@ def upload_document(
       raise HTTPException(status_code=413, detail="File too large")
 
   metadata = DocumentMetadata(document_type=document_type, language=language)
-  return document_ingestion_service.ingest(db=db, file=file, metadata=metadata)
+  response = document_ingestion_service.enqueue(db=db, file=file, metadata=metadata)
+  IngestionWorkerPool.notify()
+  return response
+
+
+@router.get("/{document_id}", response_model=DocumentStatusResponse)
+def get_document_status(document_id: int, db: Session = Depends(get_db)):
+  """Poll ingestion progress: PENDING -> PROCESSING -> COMPLETED | FAILED."""
+  document = db.get(MasterDocument, document_id)
+  if document is None:
+    raise HTTPException(status_code=404, detail="Document not found")
+
+  response = DocumentStatusResponse.model_validate(document, from_attributes=True)
+  if document.extracted_payload:
+    response.payload = RuleBasedPayload.model_validate_json(document.extracted_payload)
+  if document.processing_status == "COMPLETED":
+    response.template_id = document.document_type
+  return response
@@ -10,6 +10,7 @@ from app.db.session import get_db
 from app.models.grievance import Grievance
 from app.schemas.domain import GrievanceCreate, GrievanceRead
 from app.schemas.pagination import GrievancesPaginatedResponse
+from app.services.change_events import ChangeEvent, ChangeEventBus
 from app.services.data_service import list_grievances
 
 
@@ -24,6 +25,8 @@ def get_grievances(
     priority: Annotated[str | None, Query(description="Filter by priority (LOW, MEDIUM, HIGH, CRITICAL)")] = None,
     page: Annotated[int, Query(ge=1, description="Page number")] = 1,
     limit: Annotated[int, Query(ge=1, le=100, description="Items per page")] = 20,
+    cursor: Annotated[str | None, Query(description="Keyset cursor; send an empty value to start cursor pagination")] = None,
+    fields: Annotated[str | None, Query(description="Comma-separated fields to return, e.g. grievance_id,status,priority")] = None,
     db: Session = Depends(get_db),
 ):
     """Get all grievances with pagination and filtering.
@@ -35,6 +38,8 @@ def get_grievances(
     - priority: Filter by priority (LOW, MEDIUM, HIGH, CRITICAL)
     - page: Page number (default 1)
     - limit: Items per page (default 20, max 100)
+    - cursor: Opaque cursor from a previous response's next_cursor (empty to start)
+    - fields: Comma-separated fields to return (e.g. grievance_id,status,priority); omitted fields are not read from the database
     
     Returns paginated list of grievances with metadata.
     """
@@ -46,6 +51,8 @@ def get_grievances(
         priority=priority,
         page=page,
         limit=limit,
+        cursor=cursor,
+        fields=fields,
     )
 
 
@@ -90,6 +97,16 @@ def create_grievance(payload: GrievanceCreate, db: Session = Depends(get_db)):
     db.add(grievance)
     db.commit()
     db.refresh(grievance)
+    ChangeEventBus.publish(
+        db,
+        ChangeEvent(
+            entity="grievance",
+            action="created",
+            state=grievance.state,
+            district=grievance.district,
+            after={"status": grievance.status},
+        ),
+    )
     return GrievanceRead.model_validate(grievance)
 
 
@@ -104,6 +121,8 @@ def update_grievance(
     if not grievance:
         raise HTTPException(status_code=404, detail="Grievance not found")
 
+    previous_status = grievance.status
+
     # Update allowed fields
     allowed_fields = {"status", "priority", "resolution", "assigned_officer_id", "assigned_to"}
     for field, value in payload.items():
@@ -112,4 +131,16 @@ def update_grievance(
 
     db.commit()
     db.refresh(grievance)
+    if grievance.status != previous_status:
+        ChangeEventBus.publish(
+            db,
+            ChangeEvent(
+                entity="grievance",
+                action="updated",
+                state=grievance.state,
+                district=grievance.district,
+                before={"status": previous_status},
+                after={"status": grievance.status},
+            ),
+        )
     return GrievanceRead.model_validate(grievance)
\ No newline at end of file
@@ -21,6 +21,8 @@ def get_officers(
     district: Annotated[str | None, Query(description="Filter by district")] = None,
     page: Annotated[int, Query(ge=1, description="Page number")] = 1,
     limit: Annotated[int, Query(ge=1, le=100, description="Items per page")] = 20,
+    cursor: Annotated[str | None, Query(description="Keyset cursor; send an empty value to start cursor pagination")] = None,
+    fields: Annotated[str | None, Query(description="Comma-separated fields to return, e.g. officer_id,name,pending_actions")] = None,
     db: Session = Depends(get_db),
 ):
     """Get all officers with pagination and filtering.
@@ -30,10 +32,14 @@ def get_officers(
     - district: Filter by district name
     - page: Page number (default 1)
     - limit: Items per page (default 20, max 100)
+    - cursor: Opaque cursor from a previous response's next_cursor (empty to start)
+    - fields: Comma-separated fields to return (e.g. officer_id,name,pending_actions); omitted fields are not read from the database
     
     Returns paginated list of officers with metadata.
     """
-    return list_officers(db, state=state, district=district, page=page, limit=limit)
+    return list_officers(
+        db, state=state, district=district, page=page, limit=limit, cursor=cursor, fields=fields
+    )
 
 
 @router.get("/{officer_id}", response_model=OfficerRead)
@@ -8,8 +8,8 @@ from sqlalchemy.orm import Session
 from app.db.session import get_db
 from app.models.village import Village
 from app.schemas.domain import VillageRead
-from app.schemas.pagination import VillagesPaginatedResponse
-from app.services.data_service import list_villages
+from app.schemas.pagination import NearbyVillagesResponse, VillagesPaginatedResponse
+from app.services.data_service import list_villages, nearby_villages
 
 
 router = APIRouter(prefix="/villages", tags=["villages"])
@@ -21,6 +21,8 @@ def get_villages(
     district: Annotated[str | None, Query(description="Filter by district")] = None,
     page: Annotated[int, Query(ge=1, description="Page number")] = 1,
     limit: Annotated[int, Query(ge=1, le=100, description="Items per page")] = 20,
+    cursor: Annotated[str | None, Query(description="Keyset cursor; send an empty value to start cursor pagination")] = None,
+    fields: Annotated[str | None, Query(description="Comma-separated fields to return, e.g. code,name,total_claims")] = None,
     db: Session = Depends(get_db),
 ):
     """Get all villages with pagination and filtering.
@@ -30,10 +32,34 @@ def get_villages(
     - district: Filter by district name
     - page: Page number (default 1)
     - limit: Items per page (default 20, max 100)
+    - cursor: Opaque cursor from a previous response's next_cursor (empty to start)
+    - fields: Comma-separated fields to return (e.g. code,name,total_claims); omitted fields are not read from the database
     
     Returns paginated list of villages with metadata.
     """
-    return list_villages(db, state=state, district=district, page=page, limit=limit)
+    return list_villages(
+        db, state=state, district=district, page=page, limit=limit, cursor=cursor, fields=fields
+    )
+
+
+@router.get("/nearby", response_model=NearbyVillagesResponse)
+def get_nearby_villages(
+    lat: Annotated[float, Query(ge=-90, le=90, description="Latitude of the query point")],
+    lng: Annotated[float, Query(ge=-180, le=180, description="Longitude of the query point")],
+    k: Annotated[int, Query(ge=1, le=100, description="Maximum villages to return")] = 10,
+    radius_km: Annotated[float, Query(gt=0, le=200, description="Search radius in km")] = 25.0,
+    db: Session = Depends(get_db),
+):
+    """Get the villages nearest to a point.
+
+    Query Parameters:
+    - lat, lng: Query point (WGS84)
+    - k: Maximum villages to return (default 10, max 100)
+    - radius_km: Only villages within this distance (default 25, max 200)
+
+    Returns villages with GPS coordinates, nearest first, each with distanceKm.
+    """
+    return nearby_villages(db, lat=lat, lng=lng, k=k, radius_km=radius_km)
 
 
 @router.get("/{code}", response_model=VillageRead)
@@ -22,9 +22,13 @@ class Settings(BaseSettings):
   )
   upload_dir: Path = Path("uploads")
   enable_translation: bool = True
+  translation_backend: Literal["google", "offline"] = "google"
+  translation_memo_path: Path | None = None  # default: <rule_based_recog_dir>/.translation_memo.sqlite
   max_upload_mb: int = 25
   rule_based_recog_dir: Path = Path("../rule_based_recog")
   ocr_language_hint: str = "eng+hin"
+  ocr_workers: int = 0  # 0 = one OCR process per CPU core
+  ocr_dpi: int = 300
   storage_public_base: str = "/uploads"
   google_client_id: str = ""
   google_client_secret: str = ""
@@ -34,6 +38,34 @@ class Settings(BaseSettings):
   jwt_private_key_path: Path = Field(default=Path(__file__).resolve().parent / "keys" / "jwt_private.pem")
   jwt_public_key_path: Path = Field(default=Path(__file__).resolve().parent / "keys" / "jwt_public.pem")
   frontend_base_url: str = "http://localhost:3000"
+  auth_token_cache_seconds: int = 300
+  auth_token_cache_max_entries: int = 10000
+  auth_user_cache_seconds: int = 30
+  # Dashboard caches are patched or expired on writes (app/services/change_events.py), so the TTL
+  # only bounds drift from time-relative figures and writes that bypass the API.
+  dashboard_cache_ttl_minutes: int = 60
+  cache_l1_max_entries: int = 512
+  cache_memo_max_entries: int = 256
+  cache_l1_revalidate_seconds: float = 5.0
+  cache_lease_seconds: int = 120
+  cache_lease_poll_seconds: float = 0.25
+  cache_access_half_life_seconds: float = 3600.0
+  cache_access_max_keys: int = 4096
+  cache_warm_interval_seconds: int = 60
+  cache_warm_top_k: int = 50
+  cache_warm_concurrency: int = 4
+  list_count_cache_seconds: int = 60
+  spatial_index_cell_degrees: float = 0.05  # ~5.5 km grid cells
+  spatial_index_refresh_seconds: int = 30
+  claim_import_chunk_size: int = 1000
+  claim_rollup_reconcile_minutes: int = 15
+  metrics_enabled: bool = True
+  slow_request_ms: float = 1000.0
+  slow_request_top_statements: int = 5
+  ingestion_workers: int = 2
+  ingestion_poll_seconds: float = 2.0
+  ingestion_job_timeout_seconds: int = 900
+  ingestion_max_attempts: int = 3
 
   @property
   def sql_alchemy_database_uri(self) -> str:
@@ -0,0 +1,214 @@
+"""In-process request, SQL and cache metrics with Prometheus text exposition.
+
+``MetricsMiddleware`` times every request and attributes SQL statements to it via
+engine cursor events (see ``instrument_engine``). Counters live in the ``metrics``
+registry of each worker process and are rendered by the ``/metrics`` endpoint.
+"""
+from __future__ import annotations
+
+import heapq
+import logging
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SQL_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 250)
+
+
+@dataclass
+class RequestStats:
+  """SQL accounting for the request currently being served."""
+
+  statements: int = 0
+  db_seconds: float = 0.0
+  slowest: list[tuple[float, int, str]] = field(default_factory=list)
+
+  def add(self, statement: str, seconds: float) -> None:
+    self.statements += 1
+    self.db_seconds += seconds
+    item = (seconds, self.statements, statement)
+    if len(self.slowest) < settings.slow_request_top_statements:
+      heapq.heappush(self.slowest, item)
+    elif self.slowest and seconds > self.slowest[0][0]:
+      heapq.heapreplace(self.slowest, item)
+
+  def top_statements(self) -> list[tuple[float, str]]:
+    return [(seconds, statement) for seconds, _, statement in sorted(self.slowest, reverse=True)]
+
+
+_current_request: ContextVar[RequestStats | None] = ContextVar("metrics_request", default=None)
+
+
+class _Histogram:
+  def __init__(self, buckets: tuple[float, ...]) -> None:
+    self.buckets = buckets
+    self.counts = [0] * (len(buckets) + 1)
+    self.total = 0.0
+    self.count = 0
+
+  def observe(self, value: float) -> None:
+    self.counts[bisect_left(self.buckets, value)] += 1
+    self.total += value
+    self.count += 1
+
+
+def _labels(**labels: Any) -> str:
+  parts = []
+  for name, value in labels.items():
+    escaped = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    parts.append(f'{name}="{escaped}"')
+  return "{" + ",".join(parts) + "}"
+
+
+class MetricsRegistry:
+  """Thread-safe counters and histograms keyed by label tuples."""
+
+  def __init__(self) -> None:
+    self._lock = threading.Lock()
+    self.reset()
+
+  def reset(self) -> None:
+    with self._lock:
+      self._requests: dict[tuple[str, str, str], int] = {}
+      self._latency: dict[tuple[str, str], _Histogram] = {}
+      self._sql_count: dict[tuple[str, str], _Histogram] = {}
+      self._sql_seconds: dict[tuple[str, str], float] = {}
+      self._cache: dict[str, int] = {}
+
+  def observe_request(self, method: str, route: str, status: int, seconds: float, stats: RequestStats) -> None:
+    key = (method, route)
+    with self._lock:
+      request_key = (method, route, str(status))
+      self._requests[request_key] = self._requests.get(request_key, 0) + 1
+      self._latency.setdefault(key, _Histogram(LATENCY_BUCKETS)).observe(seconds)
+      self._sql_count.setdefault(key, _Histogram(SQL_COUNT_BUCKETS)).observe(stats.statements)
+      self._sql_seconds[key] = self._sql_seconds.get(key, 0.0) + stats.db_seconds
+
+  def record_cache(self, result: str) -> None:
+    with self._lock:
+      self._cache[result] = self._cache.get(result, 0) + 1
+
+  def cache_counts(self) -> dict[str, int]:
+    with self._lock:
+      return dict(self._cache)
+
+  def render(self) -> str:
+    """Render everything in the Prometheus text exposition format."""
+    lines: list[str] = []
+    with self._lock:
+      lines += ["# HELP http_requests_total Requests served.", "# TYPE http_requests_total counter"]
+      for (method, route, status), value in sorted(self._requests.items()):
+        lines.append(f"http_requests_total{_labels(method=method, route=route, status=status)} {value}")
+
+      for name, help_text, histograms in (
+        ("http_request_duration_seconds", "Request latency.", self._latency),
+        ("http_request_sql_statements", "SQL statements issued per request.", self._sql_count),
+      ):
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+        for (method, route), histogram in sorted(histograms.items()):
+          cumulative = 0
+          for bound, count in zip((*histogram.buckets, "+Inf"), histogram.counts):
+            cumulative += count
+            labels = _labels(method=method, route=route, le=bound)
+            lines.append(f"{name}_bucket{labels} {cumulative}")
+          labels = _labels(method=method, route=route)
+          lines.append(f"{name}_sum{labels} {histogram.total}")
+          lines.append(f"{name}_count{labels} {histogram.count}")
+
+      lines += [
+        "# HELP http_request_sql_seconds_total Time spent in SQL per route.",
+        "# TYPE http_request_sql_seconds_total counter",
+      ]
+      for (method, route), value in sorted(self._sql_seconds.items()):
+        lines.append(f"http_request_sql_seconds_total{_labels(method=method, route=route)} {value}")
+
+      lines += ["# HELP cache_lookups_total CacheService lookups by outcome.", "# TYPE cache_lookups_total counter"]
+      for result, value in sorted(self._cache.items()):
+        lines.append(f"cache_lookups_total{_labels(result=result)} {value}")
+    return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+
+
+def record_cache(result: str) -> None:
+  """Count a CacheService outcome (local_hit, revalidated_hit, db_hit, miss, stale_served, recompute,
+  and memo_hit/memo_miss for values memoized with ``get_local``)."""
+  if settings.metrics_enabled:
+    metrics.record_cache(result)
+
+
+def instrument_engine(engine: Engine) -> None:
+  """Attribute every statement run on ``engine`` to the active request, if any."""
+
+  @event.listens_for(engine, "before_cursor_execute")
+  def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_request.get() is not None:
+      conn.info.setdefault("metrics_query_start", []).append(time.perf_counter())
+
+  @event.listens_for(engine, "after_cursor_execute")
+  def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_request.get()
+    starts = conn.info.get("metrics_query_start")
+    if stats is None or not starts:
+      return
+    stats.add(statement, time.perf_counter() - starts.pop())
+
+
+def _route_template(scope: dict[str, Any]) -> str:
+  """Label requests by route template, never the raw path, to keep cardinality bounded."""
+  route = scope.get("route")
+  if route is None:
+    return "unmatched"
+  # FastAPI releases that include routers lazily leave the router-relative path on the
+  # route and record the full template on the matched route context instead.
+  context = scope.get("fastapi", {}).get("effective_route_context")
+  return getattr(context, "path", None) or route.path
+
+
+class MetricsMiddleware:
+  """Pure ASGI middleware: per-route latency, SQL accounting and slow-request logging."""
+
+  def __init__(self, app: Any) -> None:
+    self.app = app
+
+  async def __call__(self, scope, receive, send):
+    if scope["type"] != "http" or not settings.metrics_enabled:
+      await self.app(scope, receive, send)
+      return
+
+    stats = RequestStats()
+    token = _current_request.set(stats)
+    status_code = 500
+    started = time.perf_counter()
+
+    async def send_wrapper(message):
+      nonlocal status_code
+      if message["type"] == "http.response.start":
+        status_code = message["status"]
+      await send(message)
+
+    try:
+      await self.app(scope, receive, send_wrapper)
+    finally:
+      elapsed = time.perf_counter() - started
+      _current_request.reset(token)
+      route_path = _route_template(scope)
+      metrics.observe_request(scope["method"], route_path, status_code, elapsed, stats)
+      if elapsed * 1000 >= settings.slow_request_ms:
+        top = "; ".join(f"{seconds * 1000:.1f}ms {' '.join(sql.split())[:200]}" for seconds, sql in stats.top_statements())
+        logger.warning(
+          f"Slow request {scope['method']} {scope['path']} -> {status_code} in {elapsed * 1000:.0f}ms, "
+          f"{stats.statements} SQL statements ({stats.db_seconds * 1000:.0f}ms). Slowest: {top}"
+        )
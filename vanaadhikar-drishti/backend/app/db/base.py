@@ -16,3 +16,4 @@ from app.models.officer import Officer  # noqa
 from app.models.grievance import Grievance  # noqa
 from app.models.user import User  # noqa
 from app.models.data_blob import DataBlob  # noqa
+from app.models.claim_rollup import ClaimRollup  # noqa
@@ -4,6 +4,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
+from app.core.metrics import instrument_engine
 
 engine = create_engine(
   settings.sql_alchemy_database_uri,
@@ -11,6 +12,8 @@ engine = create_engine(
   pool_recycle=3600,
 )
 
+instrument_engine(engine)
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
@@ -2,10 +2,15 @@ from __future__ import annotations
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 
 from app.api.router import api_router
 from app.core.config import settings
+from app.core.metrics import MetricsMiddleware, metrics
+from app.services.document_service import shutdown_ocr_executor
+from app.services.rule_based_engine import rule_based_engine
 from app.tasks.cache_refresher import CacheRefresher
+from app.tasks.ingestion_worker import IngestionWorkerPool
 
 app = FastAPI(title="Vanaadhikar Document Processor", version="1.0.0")
 
@@ -18,6 +23,7 @@ app.add_middleware(
   allow_headers=["*"],
   allow_credentials=True,
 )
+app.add_middleware(MetricsMiddleware)
 
 
 @app.get("/health", tags=["health"])
@@ -25,19 +31,38 @@ def health_check():
   return {"status": "ok"}
 
 
+@app.get("/metrics", include_in_schema=False)
+def metrics_endpoint():
+  """Prometheus scrape endpoint for this worker's request, SQL and cache metrics."""
+  return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+
 @app.on_event("startup")
 async def startup_event():
-  """Start background cache refresh scheduler on app startup."""
+  """Start background cache refresh, rule-based templates and ingestion workers on app startup."""
   try:
     CacheRefresher.start()
   except Exception as e:
     print(f"Warning: Failed to start cache refresher: {str(e)}")
+  try:
+    rule_based_engine.warm()
+  except Exception as e:
+    print(f"Warning: Failed to load rule-based templates: {str(e)}")
+  try:
+    IngestionWorkerPool.start()
+  except Exception as e:
+    print(f"Warning: Failed to start ingestion workers: {str(e)}")
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
-  """Stop background cache refresh scheduler on app shutdown."""
+  """Stop background cache refresh scheduler and ingestion workers on app shutdown."""
   try:
     CacheRefresher.stop()
   except Exception as e:
     print(f"Warning: Failed to stop cache refresher: {str(e)}")
+  try:
+    IngestionWorkerPool.stop()
+  except Exception as e:
+    print(f"Warning: Failed to stop ingestion workers: {str(e)}")
+  shutdown_ocr_executor()
@@ -18,6 +18,7 @@ class Claim(TimestampMixin, Base):
     Index("idx_claim_district", "district"),
     Index("idx_claim_village", "village_code"),
     Index("idx_claim_status", "status"),
+    Index("idx_claim_updated_at", "updated_at"),
   )
 
   id: Mapped[int] = mapped_column(BIGINT(unsigned=True), primary_key=True)
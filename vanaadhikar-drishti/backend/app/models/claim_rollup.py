@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from sqlalchemy import Float, Integer, String, UniqueConstraint
+from sqlalchemy.dialects.mysql import BIGINT
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base_class import Base
+from app.models.mixins import TimestampMixin
+
+
+class ClaimRollup(TimestampMixin, Base):
+  __tablename__ = "claim_rollups"
+  __table_args__ = (
+    UniqueConstraint("state", "district", "status", "claim_type", name="uq_claim_rollup_key"),
+  )
+
+  id: Mapped[int] = mapped_column(BIGINT(unsigned=True), primary_key=True)
+  state: Mapped[str] = mapped_column(String(8), nullable=False)
+  district: Mapped[str] = mapped_column(String(255), nullable=False)
+  status: Mapped[str] = mapped_column(String(32), nullable=False)
+  claim_type: Mapped[str] = mapped_column(String(8), nullable=False)
+  claim_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+  area_acres: Mapped[float] = mapped_column(Float, default=0, nullable=False)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, String
+from sqlalchemy import DateTime, Integer, String
 from sqlalchemy.dialects.mysql import BIGINT, JSON
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -16,5 +16,6 @@ class DataBlob(Base):
   key: Mapped[str] = mapped_column(String(128), unique=True, nullable=False, index=True)
   description: Mapped[str | None] = mapped_column(String(512))
   payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+  version: Mapped[int] = mapped_column(Integer, default=1, nullable=False)
   created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
   updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
\ No newline at end of file
@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from datetime import datetime
 
-from sqlalchemy import DateTime, String, Text
+from sqlalchemy import DateTime, Index, Integer, String, Text
 from sqlalchemy.dialects.mysql import BIGINT, LONGTEXT
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -20,6 +20,7 @@ if TYPE_CHECKING:
 
 class MasterDocument(Base):
   __tablename__ = "master_documents"
+  __table_args__ = (Index("ix_master_documents_content", "content_hash", "ocr_language"),)
 
   id: Mapped[int] = mapped_column(BIGINT(unsigned=True), primary_key=True, index=True)
   file_name: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -29,9 +30,18 @@ class MasterDocument(Base):
   upload_timestamp: Mapped[datetime] = mapped_column(
     DateTime(timezone=True), default=datetime.utcnow, nullable=False
   )
-  processing_status: Mapped[str] = mapped_column(String(50), default="PENDING", nullable=False)
+  processing_status: Mapped[str] = mapped_column(String(50), default="PENDING", nullable=False, index=True)
   raw_text: Mapped[str | None] = mapped_column(LONGTEXT)
   extracted_payload: Mapped[str | None] = mapped_column(LONGTEXT)
+  # Ingestion queue bookkeeping (see app/tasks/ingestion_worker.py)
+  attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+  started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+  completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+  error_message: Mapped[str | None] = mapped_column(Text)
+  # Content-addressed reuse: identical uploads share OCR text and extraction results
+  content_hash: Mapped[str | None] = mapped_column(String(64))
+  ocr_language: Mapped[str | None] = mapped_column(String(50))
+  template_version: Mapped[str | None] = mapped_column(String(80))
 
   claim_forest_land: Mapped["DocClaimForestLand"] = relationship(back_populates="document")
   claim_community_rights: Mapped["DocClaimCommunityRights"] = relationship(back_populates="document")
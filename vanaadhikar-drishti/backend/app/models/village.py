@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from sqlalchemy import Boolean, Float, Integer, String
+from sqlalchemy import Boolean, Float, Index, Integer, String
 from sqlalchemy.dialects.mysql import BIGINT, JSON
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -10,6 +10,9 @@ from app.models.mixins import TimestampMixin
 
 class Village(TimestampMixin, Base):
   __tablename__ = "villages"
+  __table_args__ = (
+    Index("idx_village_updated_at", "updated_at"),
+  )
 
   id: Mapped[int] = mapped_column(BIGINT(unsigned=True), primary_key=True)
   code: Mapped[str] = mapped_column(String(64), unique=True, nullable=False, index=True)
@@ -35,3 +35,12 @@ class MasterDocumentRead(BaseModel):
 
   class Config:
     from_attributes = True
+
+
+class DocumentStatusResponse(MasterDocumentRead):
+  template_id: str | None = None
+  attempts: int
+  started_at: datetime | None
+  completed_at: datetime | None
+  error_message: str | None
+  payload: RuleBasedPayload | None = None
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import json
 from datetime import date, datetime
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field, computed_field
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, computed_field, field_validator
 
 
 class ORMModel(BaseModel):
@@ -87,6 +88,10 @@ class VillageRead(ORMModel):
     return {"lat": self.gpsLat, "lng": self.gpsLng}
 
 
+class NearbyVillage(VillageRead):
+  distanceKm: float = 0.0
+
+
 class OfficerRead(ORMModel):
   id: str = Field(alias="officer_id")
   name: str
@@ -144,4 +149,67 @@ class GrievanceCreate(BaseModel):
   mobile: str | None = None
   source: str | None = None
   assigned_officer_id: str | None = None
-  filed_date: date | None = None
\ No newline at end of file
+  filed_date: date | None = None
+
+
+class ClaimCreate(BaseModel):
+  """One row of a bulk claim import (NDJSON object or CSV record)."""
+
+  model_config = ConfigDict(extra="ignore")
+
+  claim_id: str = Field(max_length=64)
+  claimant_name: str = Field(max_length=255)
+  claimant_aadhaar: str | None = Field(default=None, max_length=32)
+  village_name: str = Field(max_length=255)
+  village_code: str = Field(max_length=64)
+  gram_panchayat: str | None = Field(default=None, max_length=255)
+  block: str | None = Field(default=None, max_length=255)
+  district: str = Field(max_length=255)
+  state: str = Field(max_length=8)
+  claim_type: str = Field(max_length=8)
+  form_number: str | None = Field(default=None, max_length=32)
+  area_acres: float
+  survey_khasra_no: str | None = Field(default=None, max_length=64)
+  claim_date: date
+  verification_date: date | None = None
+  decision_date: date | None = None
+  status: str = Field(max_length=32)
+  rejection_reason: str | None = Field(default=None, max_length=1000)
+  patte_number: str | None = Field(default=None, max_length=128)
+  patte_issued_date: date | None = None
+  tribal_group: str | None = Field(default=None, max_length=128)
+  is_pvtg: bool = False
+  notes: str | None = Field(default=None, max_length=512)
+  gps_lat: float | None = None
+  gps_lng: float | None = None
+  boundary_geojson: dict[str, Any] | None = None
+  scanned_doc_url: str | None = Field(default=None, max_length=512)
+  ocr_data: dict[str, Any] | None = None
+  assigned_officer_id: str | None = Field(default=None, max_length=64)
+
+  @field_validator("*", mode="before")
+  @classmethod
+  def _blank_as_default(cls, value: Any, info: ValidationInfo) -> Any:
+    # CSV has no null: empty cells mean "not provided".
+    if value == "":
+      return False if info.field_name == "is_pvtg" else None
+    return value
+
+  @field_validator("boundary_geojson", "ocr_data", mode="before")
+  @classmethod
+  def _decode_json(cls, value: Any) -> Any:
+    return json.loads(value) if isinstance(value, str) and value else value
+
+
+class ClaimImportError(BaseModel):
+  row: int
+  claimId: str | None = None
+  errors: list[str]
+
+
+class ClaimImportResult(BaseModel):
+  received: int
+  inserted: int
+  failed: int
+  errors: list[ClaimImportError]
+  errorsTruncated: bool = False
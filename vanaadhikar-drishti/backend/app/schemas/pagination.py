@@ -37,6 +37,7 @@ class ClaimsPaginatedResponse(BaseModel):
     limit: int
     pages: int
     filters: dict = Field(description="Applied filters")
+    next_cursor: str | None = Field(default=None, description="Cursor for the next page (cursor mode only)")
 
 
 class VillagesPaginatedResponse(BaseModel):
@@ -47,6 +48,7 @@ class VillagesPaginatedResponse(BaseModel):
     limit: int
     pages: int
     filters: dict = Field(description="Applied filters")
+    next_cursor: str | None = Field(default=None, description="Cursor for the next page (cursor mode only)")
 
 
 class OfficersPaginatedResponse(BaseModel):
@@ -57,6 +59,7 @@ class OfficersPaginatedResponse(BaseModel):
     limit: int
     pages: int
     filters: dict = Field(description="Applied filters")
+    next_cursor: str | None = Field(default=None, description="Cursor for the next page (cursor mode only)")
 
 
 class GrievancesPaginatedResponse(BaseModel):
@@ -67,3 +70,20 @@ class GrievancesPaginatedResponse(BaseModel):
     limit: int
     pages: int
     filters: dict = Field(description="Applied filters")
+    next_cursor: str | None = Field(default=None, description="Cursor for the next page (cursor mode only)")
+
+
+class NearbyVillagesResponse(BaseModel):
+    """Villages closest to a point, nearest first."""
+    data: list
+    center: dict = Field(description="Query point as {lat, lng}")
+    radius_km: float
+    k: int
+
+
+class ClaimsWithinBboxResponse(BaseModel):
+    """Claims whose GPS point lies inside a bounding box."""
+    data: list
+    bbox: dict = Field(description="Query box as {min_lat, min_lng, max_lat, max_lng}")
+    limit: int
+    truncated: bool = Field(description="More claims matched than were returned")
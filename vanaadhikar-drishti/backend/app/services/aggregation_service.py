@@ -7,12 +7,15 @@ from typing import Any
 from sqlalchemy import case, func
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.models.claim import Claim
+from app.models.claim_rollup import ClaimRollup
 from app.models.grievance import Grievance
 from app.models.officer import Officer
 from app.models.village import Village
 from app.schemas.domain import ClaimRead, GrievanceRead, OfficerRead, VillageRead
 from app.services.cache_service import CacheService
+from app.services.claim_rollup_service import ClaimRollupService
 
 STATE_METADATA = {
     "MP": {"name": "Madhya Pradesh", "slug": "madhya-pradesh", "color": "#1E88E5"},
@@ -59,6 +62,12 @@ PIPELINE_STEPS = [
     },
 ]
 
+TIME_BUCKETS = {
+    "day": (timedelta(days=1), "%d %b %Y"),
+    "week": (timedelta(weeks=1), "%d %b %Y"),
+    "month": (timedelta(days=30), "%B %Y"),
+}
+
 
 class AggregationService:
     """Service for aggregating data from multiple tables."""
@@ -66,19 +75,26 @@ class AggregationService:
     @staticmethod
     def get_dashboard_summary(db: Session) -> dict[str, Any]:
         """Get dashboard summary shaped to the frontend DashboardSummary contract."""
-        cached = CacheService.get_with_ttl(db, CacheService.CACHE_KEYS["dashboard_summary"], ttl_minutes=15)
-        if cached:
-            return cached
+        return CacheService.get_or_compute(
+            db,
+            CacheService.CACHE_KEYS["dashboard_summary"],
+            lambda: AggregationService._compute_dashboard_summary(db),
+            ttl_minutes=settings.dashboard_cache_ttl_minutes,
+        )
 
+    @staticmethod
+    def _compute_dashboard_summary(db: Session) -> dict[str, Any]:
         claims_stats = AggregationService._aggregate_claims(db)
         villages_stats = AggregationService._aggregate_villages(db)
         timeline = AggregationService._get_timeline_stats(db)
+        rollups = ClaimRollupService.fetch(db)
+        district_stats = AggregationService._build_district_stats(db, rollups)
 
-        summary = {
+        return {
             "generated_at": datetime.now(timezone.utc).isoformat(),
             "nationalStats": AggregationService._build_national_stats(db, claims_stats, villages_stats),
-            "stateStats": AggregationService._build_state_stats(db),
-            "districtStats": AggregationService._build_district_stats(db),
+            "stateStats": AggregationService._build_state_stats(db, rollups, district_stats),
+            "districtStats": district_stats,
             "claims": AggregationService._serialize_claims(db),
             "villages": AggregationService._serialize_villages(db),
             "officers": AggregationService._serialize_officers(db),
@@ -87,9 +103,6 @@ class AggregationService:
             "timeline": timeline,
         }
 
-        CacheService.set(db, CacheService.CACHE_KEYS["dashboard_summary"], summary)
-        return summary
-
     @staticmethod
     def _build_national_stats(db: Session, claim_stats: dict[str, Any], village_stats: dict[str, Any]) -> dict[str, Any]:
         total_ifr = claim_stats["by_type"].get("IFR", 0)
@@ -129,26 +142,15 @@ class AggregationService:
         }
 
     @staticmethod
-    def _build_state_stats(db: Session) -> list[dict[str, Any]]:
-        district_map = AggregationService._build_district_stats(db)
-
-        claim_rows = (
-            db.query(
-                Claim.state,
-                func.count(Claim.id).label("total"),
-                func.sum(case((Claim.status == "APPROVED", 1), else_=0)).label("approved"),
-                func.sum(case((Claim.status == "PENDING", 1), else_=0)).label("pending"),
-                func.sum(case((Claim.status == "REJECTED", 1), else_=0)).label("rejected"),
-                func.sum(case((Claim.claim_type == "IFR", Claim.area_acres), else_=0)).label("ifr_area"),
-                func.sum(case((Claim.claim_type == "CFR", Claim.area_acres), else_=0)).label("cfr_area"),
-                func.sum(case((Claim.claim_type == "CR", Claim.area_acres), else_=0)).label("cr_area"),
-                func.sum(case((Claim.claim_type == "CR", 1), else_=0)).label("cr_count"),
-                func.sum(case((Claim.claim_type == "IFR", 1), else_=0)).label("ifr_count"),
-                func.sum(case((Claim.claim_type == "CFR", 1), else_=0)).label("cfr_count"),
-            )
-            .group_by(Claim.state)
-            .all()
-        )
+    def _build_state_stats(
+        db: Session,
+        rollups: list[ClaimRollup] | None = None,
+        district_map: dict[str, list[dict[str, Any]]] | None = None,
+    ) -> list[dict[str, Any]]:
+        if rollups is None:
+            rollups = ClaimRollupService.fetch(db)
+        if district_map is None:
+            district_map = AggregationService._build_district_stats(db, rollups)
 
         villages_rows = (
             db.query(
@@ -168,25 +170,39 @@ class AggregationService:
         )
 
         claim_stats: dict[str, Any] = {}
-        for row in claim_rows:
+        for row in rollups:
             state_code = row.state
             if not state_code:
                 continue
-            claim_stats[state_code] = {
-                "total": int(row.total or 0),
-                "approved": int(row.approved or 0),
-                "pending": int(row.pending or 0),
-                "rejected": int(row.rejected or 0),
-                "ifr_area": round(row.ifr_area or 0, 2),
-                "cfr_area": round(row.cfr_area or 0, 2),
-                "cr_area": round(row.cr_area or 0, 2),
-                "cr_count": int(row.cr_count or 0),
-                "by_type": {
-                    "IFR": int(row.ifr_count or 0),
-                    "CFR": int(row.cfr_count or 0),
-                    "CR": int(row.cr_count or 0),
+            stats = claim_stats.setdefault(
+                state_code,
+                {
+                    "total": 0,
+                    "approved": 0,
+                    "pending": 0,
+                    "rejected": 0,
+                    "ifr_area": 0.0,
+                    "cfr_area": 0.0,
+                    "cr_area": 0.0,
+                    "cr_count": 0,
+                    "by_type": {"IFR": 0, "CFR": 0, "CR": 0},
                 },
-            }
+            )
+            count = int(row.claim_count or 0)
+            stats["total"] += count
+            if row.status == "APPROVED":
+                stats["approved"] += count
+            elif row.status == "PENDING":
+                stats["pending"] += count
+            elif row.status == "REJECTED":
+                stats["rejected"] += count
+            if row.claim_type in stats["by_type"]:
+                stats["by_type"][row.claim_type] += count
+                stats[f"{row.claim_type.lower()}_area"] += row.area_acres or 0
+        for stats in claim_stats.values():
+            stats["cr_count"] = stats["by_type"]["CR"]
+            for area_key in ("ifr_area", "cfr_area", "cr_area"):
+                stats[area_key] = round(stats[area_key], 2)
 
         villages_map = {
             row.state: {
@@ -262,30 +278,36 @@ class AggregationService:
         return sorted(result, key=lambda entry: entry["totalClaims"], reverse=True)
 
     @staticmethod
-    def _build_district_stats(db: Session) -> dict[str, list[dict[str, Any]]]:
-        district_rows = (
-            db.query(
-                Claim.state,
-                Claim.district,
-                func.count(Claim.id).label("total"),
-                func.sum(case((Claim.status == "APPROVED", 1), else_=0)).label("approved"),
-                func.sum(case((Claim.status == "PENDING", 1), else_=0)).label("pending"),
-                func.sum(case((Claim.status == "REJECTED", 1), else_=0)).label("rejected"),
+    def _build_district_stats(
+        db: Session, rollups: list[ClaimRollup] | None = None
+    ) -> dict[str, list[dict[str, Any]]]:
+        if rollups is None:
+            rollups = ClaimRollupService.fetch(db)
+
+        totals: dict[tuple[str, str], dict[str, int]] = {}
+        for row in rollups:
+            entry = totals.setdefault(
+                (row.state, row.district),
+                {"total": 0, "approved": 0, "pending": 0, "rejected": 0},
             )
-            .group_by(Claim.state, Claim.district)
-            .all()
-        )
+            count = int(row.claim_count or 0)
+            entry["total"] += count
+            if row.status == "APPROVED":
+                entry["approved"] += count
+            elif row.status == "PENDING":
+                entry["pending"] += count
+            elif row.status == "REJECTED":
+                entry["rejected"] += count
 
         district_map: dict[str, list[dict[str, Any]]] = defaultdict(list)
-        for row in district_rows:
-            state_code = row.state
+        for (state_code, district), entry in totals.items():
             if not state_code:
                 continue
-            district_name = row.district or "Unknown"
-            total = int(row.total or 0)
-            approved = int(row.approved or 0)
-            pending = int(row.pending or 0)
-            rejected = int(row.rejected or 0)
+            district_name = district or "Unknown"
+            total = entry["total"]
+            approved = entry["approved"]
+            pending = entry["pending"]
+            rejected = entry["rejected"]
             saturation = round((approved / total * 100), 2) if total > 0 else 0
 
             district_map[state_code].append(
@@ -450,72 +472,86 @@ class AggregationService:
 
     @staticmethod
     def _aggregate_claims(db: Session) -> dict[str, Any]:
-        """Aggregate claim statistics."""
-        total = db.query(Claim).count()
-        approved = db.query(Claim).filter(Claim.status == "APPROVED").count()
-        pending = db.query(Claim).filter(Claim.status == "PENDING").count()
-        rejected = db.query(Claim).filter(Claim.status == "REJECTED").count()
-
-        ifr = db.query(Claim).filter(Claim.claim_type == "IFR").count()
-        cfr = db.query(Claim).filter(Claim.claim_type == "CFR").count()
-        cr = db.query(Claim).filter(Claim.claim_type == "CR").count()
-
-        total_area = db.query(func.sum(Claim.area_acres)).scalar() or 0
-        approved_area = (
-            db.query(func.sum(Claim.area_acres))
-            .filter(Claim.status == "APPROVED")
-            .scalar()
-            or 0
-        )
-
-        ifr_area = (
-            db.query(func.sum(case((Claim.claim_type == "IFR", Claim.area_acres), else_=0))).scalar()
-            or 0
-        )
-        cfr_area = (
-            db.query(func.sum(case((Claim.claim_type == "CFR", Claim.area_acres), else_=0))).scalar()
-            or 0
-        )
-        cr_area = (
-            db.query(func.sum(case((Claim.claim_type == "CR", Claim.area_acres), else_=0))).scalar()
-            or 0
+        """Aggregate claim statistics in a single grouped pass over claims."""
+        rows = (
+            db.query(
+                Claim.status,
+                Claim.claim_type,
+                Claim.is_pvtg,
+                func.count(Claim.id).label("count"),
+                func.sum(Claim.area_acres).label("area"),
+            )
+            .group_by(Claim.status, Claim.claim_type, Claim.is_pvtg)
+            .all()
         )
 
-        pvtg = db.query(Claim).filter(Claim.is_pvtg == True).count()
-
+        total = 0
+        by_status: dict[str, int] = defaultdict(int)
+        by_type: dict[str, int] = defaultdict(int)
+        area_by_type: dict[str, float] = defaultdict(float)
+        total_area = 0.0
+        approved_area = 0.0
+        pvtg = 0
+        for row in rows:
+            count = int(row.count or 0)
+            area = float(row.area or 0)
+            total += count
+            total_area += area
+            by_status[row.status] += count
+            by_type[row.claim_type] += count
+            area_by_type[row.claim_type] += area
+            if row.status == "APPROVED":
+                approved_area += area
+            if row.is_pvtg:
+                pvtg += count
+
+        approved = by_status["APPROVED"]
         return {
             "total": total,
             "approved": approved,
-            "pending": pending,
-            "rejected": rejected,
+            "pending": by_status["PENDING"],
+            "rejected": by_status["REJECTED"],
             "approval_rate": round((approved / total * 100) if total > 0 else 0, 2),
-            "by_type": {"IFR": ifr, "CFR": cfr, "CR": cr},
+            "by_type": {"IFR": by_type["IFR"], "CFR": by_type["CFR"], "CR": by_type["CR"]},
             "total_area_acres": round(total_area, 2),
             "approved_area_acres": round(approved_area, 2),
-            "ifr_area_acres": round(ifr_area, 2),
-            "cfr_area_acres": round(cfr_area, 2),
-            "cr_area_acres": round(cr_area, 2),
+            "ifr_area_acres": round(area_by_type["IFR"], 2),
+            "cfr_area_acres": round(area_by_type["CFR"], 2),
+            "cr_area_acres": round(area_by_type["CR"], 2),
             "pvtg_claims": pvtg,
         }
 
     @staticmethod
     def _aggregate_villages(db: Session) -> dict[str, Any]:
-        """Aggregate village statistics."""
-        total = db.query(Village).count()
-        total_population = db.query(func.sum(Village.population)).scalar() or 0
-        st_population = db.query(func.sum(Village.st_population)).scalar() or 0
-        households = db.query(func.sum(Village.total_households)).scalar() or 0
-        total_claims = db.query(func.sum(Village.total_claims)).scalar() or 0
-        granted_claims = db.query(func.sum(Village.granted_claims)).scalar() or 0
-        pending_claims = db.query(func.sum(Village.pending_claims)).scalar() or 0
-        ifr_area = db.query(func.sum(Village.ifr_granted_area)).scalar() or 0
-        cfr_area = db.query(func.sum(Village.cfr_granted_area)).scalar() or 0
-        state_stats = (
-            db.query(Village.state, func.count(Village.id).label("count"))
+        """Aggregate village statistics in a single grouped pass over villages."""
+        rows = (
+            db.query(
+                Village.state,
+                func.count(Village.id).label("count"),
+                func.sum(Village.population).label("population"),
+                func.sum(Village.st_population).label("st_population"),
+                func.sum(Village.total_households).label("households"),
+                func.sum(Village.total_claims).label("total_claims"),
+                func.sum(Village.granted_claims).label("granted_claims"),
+                func.sum(Village.pending_claims).label("pending_claims"),
+                func.sum(Village.ifr_granted_area).label("ifr_area"),
+                func.sum(Village.cfr_granted_area).label("cfr_area"),
+                func.sum(case((Village.pvtg_present == True, 1), else_=0)).label("pvtg_present"),
+            )
             .group_by(Village.state)
             .all()
         )
-        pvtg_present = db.query(Village).filter(Village.pvtg_present == True).count()
+
+        total = sum(int(row.count or 0) for row in rows)
+        total_population = sum(row.population or 0 for row in rows)
+        st_population = sum(row.st_population or 0 for row in rows)
+        households = sum(row.households or 0 for row in rows)
+        total_claims = sum(row.total_claims or 0 for row in rows)
+        granted_claims = sum(row.granted_claims or 0 for row in rows)
+        pending_claims = sum(row.pending_claims or 0 for row in rows)
+        ifr_area = sum(row.ifr_area or 0 for row in rows)
+        cfr_area = sum(row.cfr_area or 0 for row in rows)
+        pvtg_present = sum(int(row.pvtg_present or 0) for row in rows)
 
         return {
             "total": total,
@@ -530,71 +566,90 @@ class AggregationService:
             "ifr_granted_area": round(ifr_area, 2),
             "cfr_granted_area": round(cfr_area, 2),
             "total_granted_area": round(ifr_area + cfr_area, 2),
-            "by_state": {state: count for state, count in state_stats},
+            "by_state": {row.state: int(row.count or 0) for row in rows},
             "pvtg_villages": pvtg_present,
             "pvtg_percentage": round((pvtg_present / total * 100) if total > 0 else 0, 2),
         }
 
     @staticmethod
     def _aggregate_grievances(db: Session) -> dict[str, Any]:
-        """Aggregate grievance statistics."""
-        total = db.query(Grievance).count()
-        open_grievances = db.query(Grievance).filter(Grievance.status == "OPEN").count()
-        pending = db.query(Grievance).filter(Grievance.status == "PENDING").count()
-        resolved = db.query(Grievance).filter(Grievance.status == "RESOLVED").count()
-        critical = db.query(Grievance).filter(Grievance.priority == "CRITICAL").count()
-        high = db.query(Grievance).filter(Grievance.priority == "HIGH").count()
-        medium = db.query(Grievance).filter(Grievance.priority == "MEDIUM").count()
-        low = db.query(Grievance).filter(Grievance.priority == "LOW").count()
-        category_stats = (
-            db.query(Grievance.category, func.count(Grievance.id).label("count"))
-            .group_by(Grievance.category)
-            .all()
-        )
-        resolved_grievances = (
-            db.query(Grievance)
-            .filter(Grievance.status == "RESOLVED", Grievance.days_open.isnot(None))
+        """Aggregate grievance statistics in a single grouped pass over grievances."""
+        rows = (
+            db.query(
+                Grievance.status,
+                Grievance.priority,
+                Grievance.category,
+                func.count(Grievance.id).label("count"),
+                func.sum(Grievance.days_open).label("days_open"),
+                func.count(Grievance.days_open).label("days_open_count"),
+            )
+            .group_by(Grievance.status, Grievance.priority, Grievance.category)
             .all()
         )
+
+        total = 0
+        by_status: dict[str, int] = defaultdict(int)
+        by_priority: dict[str, int] = defaultdict(int)
+        by_category: dict[str, int] = defaultdict(int)
+        resolved_days = 0
+        resolved_with_days = 0
+        for row in rows:
+            count = int(row.count or 0)
+            total += count
+            by_status[row.status] += count
+            by_priority[row.priority] += count
+            by_category[row.category] += count
+            if row.status == "RESOLVED":
+                resolved_days += int(row.days_open or 0)
+                resolved_with_days += int(row.days_open_count or 0)
+
+        resolved = by_status["RESOLVED"]
         avg_resolution_days = (
-            round(sum(g.days_open for g in resolved_grievances) / len(resolved_grievances), 1)
-            if resolved_grievances
+            round(resolved_days / resolved_with_days, 1)
+            if resolved_with_days
             else 0
         )
 
         return {
             "total": total,
-            "open": open_grievances,
-            "pending": pending,
+            "open": by_status["OPEN"],
+            "pending": by_status["PENDING"],
             "resolved": resolved,
             "resolution_rate": round((resolved / total * 100) if total > 0 else 0, 2),
             "by_priority": {
-                "CRITICAL": critical,
-                "HIGH": high,
-                "MEDIUM": medium,
-                "LOW": low,
+                "CRITICAL": by_priority["CRITICAL"],
+                "HIGH": by_priority["HIGH"],
+                "MEDIUM": by_priority["MEDIUM"],
+                "LOW": by_priority["LOW"],
             },
-            "by_category": {cat: count for cat, count in category_stats},
+            "by_category": dict(by_category),
             "avg_resolution_days": avg_resolution_days,
         }
 
     @staticmethod
     def _aggregate_officers(db: Session) -> dict[str, Any]:
-        """Aggregate officer statistics."""
-        total = db.query(Officer).count()
-        state_stats = (
-            db.query(Officer.state, func.count(Officer.id).label("count"))
+        """Aggregate officer statistics in a single grouped pass over officers."""
+        recent_threshold = datetime.now(timezone.utc) - timedelta(hours=24)
+        rows = (
+            db.query(
+                Officer.state,
+                func.count(Officer.id).label("count"),
+                func.sum(Officer.total_claims_handled).label("claims_handled"),
+                func.sum(Officer.pending_actions).label("pending_actions"),
+                func.sum(case((Officer.last_active >= recent_threshold, 1), else_=0)).label("recently_active"),
+            )
             .group_by(Officer.state)
             .all()
         )
-        total_claims_handled = db.query(func.sum(Officer.total_claims_handled)).scalar() or 0
-        pending_actions = db.query(func.sum(Officer.pending_actions)).scalar() or 0
-        recent_threshold = datetime.now(timezone.utc) - timedelta(hours=24)
-        recently_active = db.query(Officer).filter(Officer.last_active >= recent_threshold).count()
+
+        total = sum(int(row.count or 0) for row in rows)
+        total_claims_handled = sum(row.claims_handled or 0 for row in rows)
+        pending_actions = sum(row.pending_actions or 0 for row in rows)
+        recently_active = sum(int(row.recently_active or 0) for row in rows)
 
         return {
             "total": total,
-            "by_state": {state: count for state, count in state_stats},
+            "by_state": {row.state: int(row.count or 0) for row in rows},
             "total_claims_handled": int(total_claims_handled),
             "total_pending_actions": int(pending_actions),
             "recently_active": recently_active,
@@ -602,55 +657,123 @@ class AggregationService:
         }
 
     @staticmethod
-    def _get_timeline_stats(db: Session) -> dict[str, Any]:
+    def _get_timeline_stats(db: Session, bucket: str = "month", periods: int = 6) -> dict[str, Any]:
         """Get timeline statistics (monthly/weekly trends)."""
-        week_ago = datetime.now(timezone.utc) - timedelta(days=7)
-        last_week_claims = db.query(Claim).filter(Claim.created_at >= week_ago).count()
-        last_week_grievances = db.query(Grievance).filter(Grievance.created_at >= week_ago).count()
-        month_ago = datetime.now(timezone.utc) - timedelta(days=30)
-        last_month_claims = db.query(Claim).filter(Claim.created_at >= month_ago).count()
-        last_month_grievances = db.query(Grievance).filter(Grievance.created_at >= month_ago).count()
-        monthly_stats: list[dict[str, Any]] = []
-        for i in range(5, -1, -1):
-            month_start = datetime.now(timezone.utc) - timedelta(days=30 * (i + 1))
-            month_end = datetime.now(timezone.utc) - timedelta(days=30 * i)
-            month_claims = (
-                db.query(Claim)
-                .filter(Claim.created_at >= month_start, Claim.created_at < month_end)
-                .count()
-            )
-            month_grievances = (
-                db.query(Grievance)
-                .filter(Grievance.created_at >= month_start, Grievance.created_at < month_end)
-                .count()
-            )
-            monthly_stats.append(
+        series = AggregationService.get_time_series(db, bucket=bucket, periods=periods, windows_days=(7, 30))
+        windows = series["windows"]
+
+        return {
+            "last_7_days": windows[7],
+            "last_30_days": windows[30],
+            "monthly_breakdown": [
+                {
+                    "month": entry["label"],
+                    "claims": entry["claims"],
+                    "grievances": entry["grievances"],
+                }
+                for entry in series["buckets"]
+            ],
+        }
+
+    @staticmethod
+    def get_time_series(
+        db: Session,
+        *,
+        bucket: str = "month",
+        periods: int = 6,
+        windows_days: tuple[int, ...] = (),
+        now: datetime | None = None,
+    ) -> dict[str, Any]:
+        """Bucket claim and grievance ``created_at`` into trailing windows.
+
+        Issues one query per table. Rolling totals for ``windows_days`` are
+        derived from the same scan, so they cost no extra round trips.
+        """
+        if bucket not in TIME_BUCKETS:
+            raise ValueError(f"Unsupported bucket size: {bucket}")
+        size, label_format = TIME_BUCKETS[bucket]
+        now = now or datetime.now(timezone.utc)
+
+        bucket_starts = [now - size * (i + 1) for i in range(periods)]
+        window_starts = {days: now - timedelta(days=days) for days in windows_days}
+        edges = sorted({now, *bucket_starts, *window_starts.values()}, reverse=True)
+
+        counts = {
+            "claims": AggregationService._count_segments(db, Claim.created_at, edges),
+            "grievances": AggregationService._count_segments(db, Grievance.created_at, edges),
+        }
+
+        def total_between(segments: dict[int, int], start: datetime, end: datetime | None) -> int:
+            total = 0
+            for idx, count in segments.items():
+                if idx < 0:
+                    if end is None:
+                        total += count
+                    continue
+                if edges[idx + 1] >= start and (end is None or edges[idx] <= end):
+                    total += count
+            return total
+
+        buckets: list[dict[str, Any]] = []
+        for i in range(periods - 1, -1, -1):
+            start = now - size * (i + 1)
+            end = now - size * i
+            buckets.append(
                 {
-                    "month": month_start.strftime("%B %Y"),
-                    "claims": month_claims,
-                    "grievances": month_grievances,
+                    "label": start.strftime(label_format),
+                    "start": start.isoformat(),
+                    "end": end.isoformat(),
+                    **{name: total_between(segments, start, end) for name, segments in counts.items()},
                 }
             )
 
-        return {
-            "last_7_days": {
-                "claims": last_week_claims,
-                "grievances": last_week_grievances,
-            },
-            "last_30_days": {
-                "claims": last_month_claims,
-                "grievances": last_month_grievances,
-            },
-            "monthly_breakdown": monthly_stats,
+        windows = {
+            days: {name: total_between(segments, start, None) for name, segments in counts.items()}
+            for days, start in window_starts.items()
         }
 
+        return {"bucket": bucket, "buckets": buckets, "windows": windows}
+
+    @staticmethod
+    def _count_segments(db: Session, column: Any, edges: list[datetime]) -> dict[int, int]:
+        """Count rows per ``[edges[i + 1], edges[i])`` segment in a single grouped query.
+
+        ``edges`` must be sorted newest first. Rows at or after ``edges[0]`` land in
+        segment ``-1``.
+        """
+        segment = case(
+            (column >= edges[0], -1),
+            *((column >= edges[idx + 1], idx) for idx in range(len(edges) - 1)),
+            else_=None,
+        ).label("segment")
+        rows = (
+            db.query(segment, func.count().label("count"))
+            .filter(column >= edges[-1])
+            .group_by(segment)
+            .all()
+        )
+        return {int(row.segment): int(row.count or 0) for row in rows if row.segment is not None}
+
+    @staticmethod
+    def state_snapshot_key(state: str) -> str:
+        return f"state_snapshot_{state}"
+
+    @staticmethod
+    def district_snapshot_key(state: str, district: str) -> str:
+        return f"district_snapshot_{state}_{district}"
+
     @staticmethod
     def get_state_snapshot(db: Session, state: str) -> dict[str, Any]:
-        cached = CacheService.get_with_ttl(db, f"state_snapshot_{state}", ttl_minutes=15)
-        if cached:
-            return cached
+        return CacheService.get_or_compute(
+            db,
+            AggregationService.state_snapshot_key(state),
+            lambda: AggregationService._compute_state_snapshot(db, state),
+            ttl_minutes=settings.dashboard_cache_ttl_minutes,
+        )
 
-        snapshot = {
+    @staticmethod
+    def _compute_state_snapshot(db: Session, state: str) -> dict[str, Any]:
+        return {
             "state": state,
             "generated_at": datetime.now(timezone.utc).isoformat(),
             "claims": AggregationService._aggregate_claims_by_state(db, state),
@@ -659,8 +782,57 @@ class AggregationService:
             "officers": AggregationService._aggregate_officers_by_state(db, state),
         }
 
-        CacheService.set(db, f"state_snapshot_{state}", snapshot)
-        return snapshot
+    @staticmethod
+    def get_district_snapshot(db: Session, state: str, district: str) -> dict[str, Any]:
+        return CacheService.get_or_compute(
+            db,
+            AggregationService.district_snapshot_key(state, district),
+            lambda: AggregationService._compute_district_snapshot(db, state, district),
+            ttl_minutes=settings.dashboard_cache_ttl_minutes,
+        )
+
+    @staticmethod
+    def _compute_district_snapshot(db: Session, state: str, district: str) -> dict[str, Any]:
+        """One grouped pass each over the district's claims, villages and grievances."""
+        claim_rows = (
+            db.query(Claim.status, func.count(Claim.id).label("count"), func.sum(Claim.area_acres).label("area"))
+            .filter(Claim.state == state, Claim.district == district)
+            .group_by(Claim.status)
+            .all()
+        )
+        claims_by_status = {row.status: int(row.count or 0) for row in claim_rows}
+        villages = (
+            db.query(func.count(Village.id).label("count"), func.sum(Village.population).label("population"))
+            .filter(Village.state == state, Village.district == district)
+            .one()
+        )
+        grievances_by_status = dict(
+            db.query(Grievance.status, func.count(Grievance.id))
+            .filter(Grievance.state == state, Grievance.district == district)
+            .group_by(Grievance.status)
+            .all()
+        )
+
+        return {
+            "state": state,
+            "district": district,
+            "claims": {
+                "total": sum(claims_by_status.values()),
+                "approved": claims_by_status.get("APPROVED", 0),
+                "pending": claims_by_status.get("PENDING", 0),
+                "rejected": claims_by_status.get("REJECTED", 0),
+                "total_area": float(sum(row.area or 0 for row in claim_rows)),
+            },
+            "villages": {
+                "total": int(villages.count or 0),
+                "population": int(villages.population or 0),
+            },
+            "grievances": {
+                "total": sum(grievances_by_status.values()),
+                "open": grievances_by_status.get("OPEN", 0),
+                "resolved": grievances_by_status.get("RESOLVED", 0),
+            },
+        }
 
     @staticmethod
     def _aggregate_claims_by_state(db: Session, state: str) -> dict[str, Any]:
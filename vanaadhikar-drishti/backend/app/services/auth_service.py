@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any
 
-from jose import jwt
+from jose import jwk, jwt
+from jose.backends.base import Key
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
@@ -10,7 +16,82 @@ from app.models.user import User
 from app.schemas.auth import UserCreate, UserResponse
 
 
+class _TTLCache:
+    """Bounded, thread-safe LRU whose entries each carry their own expiry (monotonic)."""
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Any, tuple[Any, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any | None:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            value, expires_at = item
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Any, value: Any, ttl_seconds: float) -> None:
+        if ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Any) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@lru_cache(maxsize=8)
+def _construct_key(kind: str, algorithm: str, source: str) -> Key:
+    """Parse signing/verification key material once per (algorithm, key file or secret)."""
+    material = settings.jwt_private_key if kind == "private" else settings.jwt_public_key
+    return jwk.construct(material, algorithm)
+
+
 class AuthService:
+    """Google-login users and JWT handling.
+
+    Parsed key objects are built once. Verified tokens are cached (never past their
+    ``exp``) and user profiles briefly, so repeat requests with the same bearer token
+    skip signature checks and the users lookup. Logout and user writes evict entries.
+    """
+
+    _token_cache = _TTLCache(settings.auth_token_cache_max_entries)
+    _user_cache = _TTLCache(settings.auth_token_cache_max_entries)
+
+    @staticmethod
+    def _key(kind: str) -> Key:
+        algorithm = settings.jwt_algorithm
+        if algorithm.startswith("HS"):
+            source = settings.jwt_secret_key
+        else:
+            source = str(settings.jwt_private_key_path if kind == "private" else settings.jwt_public_key_path)
+        return _construct_key(kind, algorithm, source)
+
+    @staticmethod
+    def invalidate_token(token: str) -> None:
+        AuthService._token_cache.pop(token)
+
+    @staticmethod
+    def invalidate_user(user_id: int) -> None:
+        AuthService._user_cache.pop(int(user_id))
+
     @staticmethod
     def get_or_create_user(db: Session, email: str, name: str, picture: str | None = None) -> User:
         """Get existing user or create new one on first login."""
@@ -26,6 +107,7 @@ class AuthService:
             db.add(user)
             db.commit()
             db.refresh(user)
+            AuthService.invalidate_user(user.id)
         return user
 
     @staticmethod
@@ -34,6 +116,7 @@ class AuthService:
         user.last_login = datetime.now(timezone.utc)
         db.commit()
         db.refresh(user)
+        AuthService.invalidate_user(user.id)
         return user
 
     @staticmethod
@@ -51,7 +134,7 @@ class AuthService:
         }
         encoded_jwt = jwt.encode(
             to_encode,
-            settings.jwt_private_key,
+            AuthService._key("private"),
             algorithm=settings.jwt_algorithm,
         )
         return encoded_jwt, int(expires_delta.total_seconds())
@@ -59,16 +142,26 @@ class AuthService:
     @staticmethod
     def verify_token(token: str) -> dict:
         """Verify JWT token and return payload."""
+        cached = AuthService._token_cache.get(token)
+        if cached is not None:
+            return dict(cached)
+
         try:
             payload = jwt.decode(
                 token,
-                settings.jwt_public_key,
+                AuthService._key("public"),
                 algorithms=[settings.jwt_algorithm],
             )
-            return payload
         except Exception as e:
             raise ValueError(f"Invalid token: {str(e)}")
 
+        ttl = float(settings.auth_token_cache_seconds)
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            ttl = min(ttl, exp - time.time())
+        AuthService._token_cache.put(token, dict(payload), ttl)
+        return payload
+
     @staticmethod
     def get_current_user(db: Session, token: str) -> User:
         """Get current user from valid token."""
@@ -86,3 +179,22 @@ class AuthService:
             raise ValueError("User not found")
 
         return user
+
+    @staticmethod
+    def get_current_user_profile(db: Session, token: str) -> UserResponse:
+        """Like get_current_user, but served from a short-lived profile cache."""
+        try:
+            payload = AuthService.verify_token(token)
+        except ValueError:
+            raise ValueError("Invalid or expired token")
+
+        user_id = payload.get("sub")
+        if not user_id:
+            raise ValueError("Invalid token payload")
+
+        profile = AuthService._user_cache.get(int(user_id))
+        if profile is None:
+            user = AuthService.get_current_user(db, token)
+            profile = UserResponse.model_validate(user)
+            AuthService._user_cache.put(user.id, profile, settings.auth_user_cache_seconds)
+        return profile.model_copy()
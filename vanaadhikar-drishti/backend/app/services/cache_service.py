@@ -1,16 +1,178 @@
 from __future__ import annotations
 
+import copy
+import gzip
 import json
-from datetime import datetime, timezone
-from typing import Any
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+from uuid import uuid4
 
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
+from app.core.metrics import metrics, record_cache
 from app.models.data_blob import DataBlob
 
+try:
+    import brotli
+except ImportError:  # optional: without it responses fall back to gzip
+    brotli = None
+
+
+# Content-Encodings we can produce, most preferred first.
+ENCODERS: dict[str, Callable[[bytes], bytes]] = {
+    **({"br": lambda raw: brotli.compress(raw, quality=5)} if brotli is not None else {}),
+    "gzip": lambda raw: gzip.compress(raw, compresslevel=6),
+}
+
+
+@dataclass
+class _LocalEntry:
+    payload: Any
+    version: int
+    updated_at: datetime
+    checked_at: float
+    # Response bodies for ``payload`` by Content-Encoding ("identity" = plain JSON), built on first use.
+    encoded: dict[str, bytes] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class EncodedPayload:
+    body: bytes
+    encoding: str
+
+
+def negotiate_encoding(accept_encoding: str | None) -> str:
+    """The preferred encoding in ``ENCODERS`` that the Accept-Encoding header allows, else "identity"."""
+    accepted: dict[str, float] = {}
+    for part in (accept_encoding or "").split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            accepted[name.strip().lower()] = quality
+    for encoding in ENCODERS:
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return "identity"
+
+
+def _encode_json(payload: Any) -> bytes:
+    # Same bytes FastAPI's JSONResponse would produce for this payload.
+    return json.dumps(
+        payload,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+        default=jsonable_encoder,
+    ).encode("utf-8")
+
+
+class _LocalCache:
+    """Bounded, thread-safe LRU of already-parsed payloads for this process."""
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, _LocalEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> _LocalEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, entry: _LocalEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class _AccessTracker:
+    """Exponentially decayed read counts per cache key, so "hot" means recently popular."""
+
+    def __init__(self, half_life_seconds: float, max_keys: int) -> None:
+        self.half_life_seconds = half_life_seconds
+        self.max_keys = max_keys
+        self._scores: dict[str, tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def _decayed(self, score: float, seen_at: float, now: float) -> float:
+        return score * 0.5 ** ((now - seen_at) / self.half_life_seconds)
+
+    def record(self, key: str) -> None:
+        now = time.monotonic()
+        with self._lock:
+            score, seen_at = self._scores.get(key, (0.0, now))
+            self._scores[key] = (self._decayed(score, seen_at, now) + 1.0, now)
+            if len(self._scores) > self.max_keys:
+                # Forget the coldest half rather than evicting one key per insert.
+                ranked = sorted(self._scores, key=lambda k: self._decayed(*self._scores[k], now))
+                for cold in ranked[: len(ranked) // 2]:
+                    del self._scores[cold]
+
+    def scores(self) -> dict[str, float]:
+        now = time.monotonic()
+        with self._lock:
+            return {key: self._decayed(score, seen_at, now) for key, (score, seen_at) in self._scores.items()}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._scores.clear()
+
+
+# data_blobs rows with this key prefix are recompute leases, not cached payloads.
+LEASE_PREFIX = "lease:"
+
+# updated_at given to expired entries: older than any TTL, so the next read recomputes.
+EXPIRED_AT = datetime(1970, 1, 1)
+
+
+def _as_utc(value: datetime) -> datetime:
+    """data_blobs timestamps are stored naive in UTC; make them comparable."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
 
 class CacheService:
-    """Caching service using data_blobs table."""
+    """Caching service using data_blobs table.
+
+    Reads go through an in-process LRU of parsed payloads first. A local entry
+    is trusted for ``cache_l1_revalidate_seconds``; after that its version is
+    compared against ``data_blobs.version`` so writes from other workers
+    invalidate it. Payloads returned from the cache are shared and must be
+    treated as read-only.
+
+    ``get_or_compute`` adds stale-while-revalidate with a cross-process lease
+    (a ``lease:<key>`` row in data_blobs) so only one worker recomputes an
+    expired entry at a time.
+    """
 
     CACHE_KEYS = {
         "dashboard_summary": "dashboard_summary",
@@ -23,40 +185,112 @@ class CacheService:
         "claim_pipeline": "claim_pipeline",
     }
 
+    _local = _LocalCache(settings.cache_l1_max_entries)
+    _memo = _LocalCache(settings.cache_memo_max_entries)
+    _access = _AccessTracker(settings.cache_access_half_life_seconds, settings.cache_access_max_keys)
+
+    @staticmethod
+    def _parse_payload(payload: Any) -> Any:
+        if isinstance(payload, str):
+            return json.loads(payload)
+        return payload
+
+    @staticmethod
+    def _load(db: Session, key: str) -> _LocalEntry | None:
+        """Load a blob from the database and remember it locally."""
+        blob = db.query(DataBlob).filter(DataBlob.key == key).first()
+        if not blob:
+            CacheService._local.pop(key)
+            return None
+        entry = _LocalEntry(
+            payload=CacheService._parse_payload(blob.payload),
+            version=blob.version,
+            updated_at=_as_utc(blob.updated_at),
+            checked_at=time.monotonic(),
+        )
+        CacheService._local.put(key, entry)
+        return entry
+
+    @staticmethod
+    def _lookup(db: Session, key: str) -> _LocalEntry | None:
+        """Return the local entry for ``key``, revalidating it or reloading as needed."""
+        entry = CacheService._local.get(key)
+        if entry is not None:
+            if time.monotonic() - entry.checked_at <= settings.cache_l1_revalidate_seconds:
+                record_cache("local_hit")
+                return entry
+            version = db.query(DataBlob.version).filter(DataBlob.key == key).scalar()
+            if version == entry.version:
+                entry.checked_at = time.monotonic()
+                record_cache("revalidated_hit")
+                return entry
+            CacheService._local.pop(key)
+        entry = CacheService._load(db, key)
+        record_cache("db_hit" if entry is not None else "miss")
+        return entry
+
+    @staticmethod
+    def _age_seconds(entry: _LocalEntry) -> float:
+        return (datetime.now(timezone.utc) - entry.updated_at).total_seconds()
+
     @staticmethod
     def get(db: Session, key: str) -> dict[str, Any] | None:
         """Get cached data by key."""
         try:
-            blob = db.query(DataBlob).filter(DataBlob.key == key).first()
-            if not blob:
-                return None
-            if isinstance(blob.payload, dict):
-                return blob.payload
-            if isinstance(blob.payload, str):
-                return json.loads(blob.payload)
-            return blob.payload
+            entry = CacheService._lookup(db, key)
+            return entry.payload if entry else None
         except Exception:
             return None
 
     @staticmethod
-    def set(db: Session, key: str, data: dict[str, Any] | list) -> DataBlob:
-        """Set cached data, creating or updating as needed."""
+    def set(
+        db: Session, key: str, data: dict[str, Any] | list, lease_token: str | None = None
+    ) -> DataBlob | None:
+        """Set cached data, creating or updating as needed.
+
+        With ``lease_token`` the payload is stored only while that recompute lease is still
+        held. ``expire`` revokes leases, so a payload computed before a write is dropped
+        (returning None) instead of overwriting the write's expiry for a whole TTL.
+        """
+        if lease_token is not None:
+            # Lock the lease row until commit: a concurrent expire() revokes it first or waits.
+            held = (
+                db.query(DataBlob.id)
+                .filter(DataBlob.key == f"{LEASE_PREFIX}{key}", DataBlob.description == lease_token)
+                .with_for_update()
+                .first()
+            )
+            if held is None:
+                db.rollback()
+                return None
         existing = db.query(DataBlob).filter(DataBlob.key == key).first()
+        now = datetime.now(timezone.utc)
 
         if existing:
             existing.payload = data
-            existing.updated_at = datetime.now(timezone.utc)
+            existing.updated_at = now
+            existing.version = (existing.version or 0) + 1
         else:
-            existing = DataBlob(key=key, payload=data, created_at=datetime.now(timezone.utc))
+            existing = DataBlob(key=key, payload=data, created_at=now, updated_at=now, version=1)
             db.add(existing)
 
         db.commit()
         db.refresh(existing)
+        CacheService._local.put(
+            key,
+            _LocalEntry(
+                payload=data,
+                version=existing.version,
+                updated_at=_as_utc(existing.updated_at),
+                checked_at=time.monotonic(),
+            ),
+        )
         return existing
 
     @staticmethod
     def delete(db: Session, key: str) -> bool:
         """Delete cached data by key."""
+        CacheService._local.pop(key)
         blob = db.query(DataBlob).filter(DataBlob.key == key).first()
         if blob:
             db.delete(blob)
@@ -64,6 +298,64 @@ class CacheService:
             return True
         return False
 
+    @staticmethod
+    def expire(db: Session, keys: list[str]) -> int:
+        """Mark ``keys`` stale without dropping them.
+
+        The next ``get_or_compute`` recomputes under the lease while concurrent readers
+        keep getting the old payload, instead of all waiting on an empty key. The version
+        bump makes other workers' local copies revalidate. Leases on ``keys`` are revoked,
+        so a recompute already in flight does not store a payload that may predate the
+        write. Returns the number of keys expired.
+        """
+        if not keys:
+            return 0
+        for key in keys:
+            CacheService._local.pop(key)
+        # Leases first: set() locks the lease before the payload, so both lock in the same order.
+        db.query(DataBlob).filter(DataBlob.key.in_([f"{LEASE_PREFIX}{key}" for key in keys])).delete(
+            synchronize_session=False
+        )
+        count = (
+            db.query(DataBlob)
+            .filter(DataBlob.key.in_(keys))
+            .update(
+                {DataBlob.updated_at: EXPIRED_AT, DataBlob.version: DataBlob.version + 1},
+                synchronize_session=False,
+            )
+        )
+        db.commit()
+        return count
+
+    @staticmethod
+    def patch(db: Session, key: str, mutate: Callable[[Any], None]) -> bool:
+        """Apply ``mutate`` to the stored payload in place, keeping its age.
+
+        Returns True when the key was patched or is not cached at all, and False when
+        another writer changed it first or a recompute holds its lease (its payload may or
+        may not include the write); callers should then ``expire`` it.
+        """
+        if CacheService.exists(db, f"{LEASE_PREFIX}{key}"):
+            return False
+        row = db.query(DataBlob.payload, DataBlob.version, DataBlob.updated_at).filter(DataBlob.key == key).first()
+        if row is None:
+            CacheService._local.pop(key)
+            return True
+        payload = copy.deepcopy(CacheService._parse_payload(row.payload))
+        mutate(payload)
+        updated = (
+            db.query(DataBlob)
+            .filter(DataBlob.key == key, DataBlob.version == row.version)
+            .update(
+                # updated_at is set explicitly so its onupdate hook does not extend the TTL.
+                {DataBlob.payload: payload, DataBlob.version: row.version + 1, DataBlob.updated_at: row.updated_at},
+                synchronize_session=False,
+            )
+        )
+        db.commit()
+        CacheService._local.pop(key)
+        return bool(updated)
+
     @staticmethod
     def exists(db: Session, key: str) -> bool:
         """Check if key exists in cache."""
@@ -72,39 +364,217 @@ class CacheService:
     @staticmethod
     def is_expired(db: Session, key: str, ttl_minutes: int = 15) -> bool:
         """Check if cached data is expired."""
-        blob = db.query(DataBlob).filter(DataBlob.key == key).first()
-        if not blob:
+        entry = CacheService._lookup(db, key)
+        if not entry:
             return True
-        
-        age_seconds = (datetime.now(timezone.utc) - blob.updated_at).total_seconds()
-        return age_seconds > (ttl_minutes * 60)
+        return CacheService._age_seconds(entry) > (ttl_minutes * 60)
 
     @staticmethod
     def get_with_ttl(
         db: Session, key: str, ttl_minutes: int = 15
     ) -> dict[str, Any] | list | None:
         """Get cached data if not expired."""
-        if CacheService.is_expired(db, key, ttl_minutes):
+        entry = CacheService._lookup(db, key)
+        if not entry or CacheService._age_seconds(entry) > (ttl_minutes * 60):
             return None
-        return CacheService.get(db, key)
+        return entry.payload
+
+    @staticmethod
+    def get_local(key: str, ttl_seconds: float, compute: Callable[[], Any]) -> Any:
+        """Memoize ``compute`` in this process only; nothing is written to data_blobs.
+
+        Memoized values have their own small LRU and metric labels (``memo_hit``/``memo_miss``),
+        so they neither evict cached payloads nor skew the data_blobs hit rate.
+        """
+        entry = CacheService._memo.get(key)
+        if entry is not None and time.monotonic() - entry.checked_at <= ttl_seconds:
+            record_cache("memo_hit")
+            return entry.payload
+        record_cache("memo_miss")
+        value = compute()
+        now = datetime.now(timezone.utc)
+        CacheService._memo.put(
+            key,
+            _LocalEntry(payload=value, version=0, updated_at=now, checked_at=time.monotonic()),
+        )
+        return value
+
+    @staticmethod
+    def get_or_compute(
+        db: Session,
+        key: str,
+        compute: Callable[[], dict[str, Any] | list],
+        ttl_minutes: int = 15,
+    ) -> dict[str, Any] | list:
+        """Return cached data, recomputing it at most once across workers when expired.
+
+        The caller that wins the lease recomputes and stores the payload while
+        everyone else keeps serving the stale copy. With nothing cached yet,
+        the others wait for the winner's result instead of piling on.
+        """
+        CacheService._access.record(key)
+        ttl_seconds = ttl_minutes * 60
+        entry = CacheService._lookup(db, key)
+        if entry and CacheService._age_seconds(entry) <= ttl_seconds:
+            return entry.payload
+
+        token = CacheService.acquire_lease(db, key)
+        if token:
+            try:
+                record_cache("recompute")
+                data = compute()
+                CacheService.set(db, key, data, lease_token=token)
+                return data
+            except Exception:
+                db.rollback()
+                raise
+            finally:
+                CacheService.release_lease(db, key, token)
+
+        if entry is not None:
+            record_cache("stale_served")
+            return entry.payload
+
+        deadline = time.monotonic() + settings.cache_lease_seconds
+        while time.monotonic() < deadline:
+            time.sleep(settings.cache_lease_poll_seconds)
+            # End the current transaction so the winner's commit becomes visible.
+            db.rollback()
+            entry = CacheService._load(db, key)
+            if entry and CacheService._age_seconds(entry) <= ttl_seconds:
+                return entry.payload
+
+        # The lease holder never delivered; compute it ourselves rather than fail.
+        data = compute()
+        CacheService.set(db, key, data)
+        return data
+
+    @staticmethod
+    def refresh(db: Session, key: str, compute: Callable[[], dict[str, Any] | list]) -> bool:
+        """Recompute and store ``key`` ahead of expiry. Returns False if another worker holds the lease."""
+        token = CacheService.acquire_lease(db, key)
+        if not token:
+            return False
+        try:
+            return CacheService.set(db, key, compute(), lease_token=token) is not None
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            CacheService.release_lease(db, key, token)
+
+    @staticmethod
+    def encode(key: str, payload: Any, accept_encoding: str | None) -> EncodedPayload:
+        """``payload`` as a JSON response body in the best encoding the client accepts.
+
+        When ``payload`` is the object cached locally under ``key`` (what ``get_or_compute``
+        returns), the body is encoded once per cached version and reused, so a cache hit
+        skips both JSON encoding and compression. Other payloads are encoded on the spot.
+        """
+        encoding = negotiate_encoding(accept_encoding)
+        entry = CacheService._local.get(key)
+        memo = entry.encoded if entry is not None and entry.payload is payload else {}
+
+        body = memo.get(encoding)
+        if body is None:
+            raw = memo.get("identity")
+            if raw is None:
+                raw = memo["identity"] = _encode_json(payload)
+            body = raw if encoding == "identity" else ENCODERS[encoding](raw)
+            memo[encoding] = body
+        return EncodedPayload(body=body, encoding=encoding)
+
+    @staticmethod
+    def access_scores() -> dict[str, float]:
+        """Recency-weighted ``get_or_compute`` reads per key in this process."""
+        return CacheService._access.scores()
+
+    @staticmethod
+    def updated_at(db: Session, keys: list[str]) -> dict[str, datetime]:
+        """When each of ``keys`` was last stored; missing keys are left out."""
+        if not keys:
+            return {}
+        rows = db.query(DataBlob.key, DataBlob.updated_at).filter(DataBlob.key.in_(keys)).all()
+        return {row.key: _as_utc(row.updated_at) for row in rows}
+
+    @staticmethod
+    def acquire_lease(db: Session, key: str) -> str | None:
+        """Try to take the recompute lease for ``key``. Returns a holder token or None."""
+        lease_key = f"{LEASE_PREFIX}{key}"
+        token = uuid4().hex
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        expired_before = now - timedelta(seconds=settings.cache_lease_seconds)
+
+        taken = (
+            db.query(DataBlob)
+            .filter(DataBlob.key == lease_key, DataBlob.updated_at < expired_before)
+            .update(
+                {DataBlob.description: token, DataBlob.updated_at: now},
+                synchronize_session=False,
+            )
+        )
+        if taken:
+            db.commit()
+            return token
+
+        try:
+            with db.begin_nested():
+                db.add(
+                    DataBlob(
+                        key=lease_key,
+                        description=token,
+                        payload={"lease": key},
+                        created_at=now,
+                        updated_at=now,
+                    )
+                )
+        except IntegrityError:
+            db.rollback()
+            return None
+        db.commit()
+        return token
+
+    @staticmethod
+    def release_lease(db: Session, key: str, token: str) -> None:
+        """Release a lease taken with ``acquire_lease``; a no-op if it was taken over."""
+        db.query(DataBlob).filter(
+            DataBlob.key == f"{LEASE_PREFIX}{key}", DataBlob.description == token
+        ).delete(synchronize_session=False)
+        db.commit()
+
+    @staticmethod
+    def _entries(db: Session):
+        """Query over cached payloads, leaving out lease rows."""
+        return db.query(DataBlob).filter(DataBlob.key.not_like(f"{LEASE_PREFIX}%"))
 
     @staticmethod
     def clear_all(db: Session) -> int:
-        """Clear all cache entries."""
-        count = db.query(DataBlob).delete()
+        """Clear all cache entries; leases held by in-flight recomputes are kept."""
+        CacheService._local.clear()
+        CacheService._memo.clear()
+        count = CacheService._entries(db).delete(synchronize_session=False)
         db.commit()
         return count
 
     @staticmethod
     def get_stats(db: Session) -> dict[str, Any]:
         """Get cache statistics."""
-        total = db.query(DataBlob).count()
-        sizes = db.query(DataBlob).all()
+        total = CacheService._entries(db).count()
+        sizes = CacheService._entries(db).all()
         total_size = sum(len(json.dumps(b.payload)) for b in sizes)
+        hot = CacheService.access_scores()
 
         return {
             "total_keys": total,
             "total_size_bytes": total_size,
             "total_size_mb": round(total_size / (1024 * 1024), 2),
+            "local_entries": len(CacheService._local),
+            "local_max_entries": CacheService._local.max_entries,
+            "memo_entries": len(CacheService._memo),
+            "lookups": metrics.cache_counts(),
+            "hot_keys": [
+                {"key": key, "score": round(score, 2)}
+                for key, score in sorted(hot.items(), key=lambda item: item[1], reverse=True)[:10]
+            ],
             "keys": [{"key": b.key, "updated_at": b.updated_at.isoformat()} for b in sizes],
         }
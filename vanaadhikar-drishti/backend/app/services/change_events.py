@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Literal
+
+from loguru import logger
+from sqlalchemy.orm import Session
+
+from app.services.aggregation_service import AggregationService
+from app.services.cache_service import CacheService
+
+# Snapshot counters keyed by the status they count.
+CLAIM_STATUS_COUNTERS = {"APPROVED": "approved", "PENDING": "pending", "REJECTED": "rejected"}
+DISTRICT_GRIEVANCE_COUNTERS = {"OPEN": "open", "RESOLVED": "resolved"}
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    """A committed claim or grievance write.
+
+    ``before`` and ``after`` carry the fields the dashboards aggregate (status, area);
+    ``before`` is empty for creations.
+    """
+
+    entity: Literal["claim", "grievance"]
+    action: Literal["created", "updated"]
+    state: str
+    district: str
+    before: dict[str, Any] = field(default_factory=dict)
+    after: dict[str, Any] = field(default_factory=dict)
+
+
+def _count(section: dict[str, Any], counters: dict[str, str], status: str | None, sign: int) -> None:
+    counter = counters.get(status or "")
+    if counter is not None:
+        section[counter] += sign
+
+
+class CacheInvalidationService:
+    """Keeps dashboard caches current on writes instead of waiting for their TTL.
+
+    State and district snapshots are plain counters, so they are patched in place
+    (keeping their age); if a concurrent write wins the race, a recompute holds the
+    key's lease, or a payload does not have the expected shape, the key is expired
+    instead, which also stops the recompute from storing its possibly older payload. The dashboard summary mixes
+    in recent-item lists and time series, so it is always expired: the next reader
+    recomputes it under the lease while the others are served the previous copy.
+    """
+
+    @staticmethod
+    def _claim_delta(event: ChangeEvent) -> tuple[Callable[[Any], None], Callable[[Any], None]]:
+        def district(payload: dict[str, Any]) -> None:
+            claims = payload["claims"]
+            _count(claims, CLAIM_STATUS_COUNTERS, event.before.get("status"), -1)
+            _count(claims, CLAIM_STATUS_COUNTERS, event.after.get("status"), 1)
+            if event.action == "created":
+                claims["total"] += 1
+            claims["total_area"] += float(event.after.get("area_acres") or 0) - float(
+                event.before.get("area_acres") or 0
+            )
+
+        def state(payload: dict[str, Any]) -> None:
+            claims = payload["claims"]
+            _count(claims, CLAIM_STATUS_COUNTERS, event.before.get("status"), -1)
+            _count(claims, CLAIM_STATUS_COUNTERS, event.after.get("status"), 1)
+            if event.action == "created":
+                claims["total"] += 1
+                claims["by_district"][event.district] = claims["by_district"].get(event.district, 0) + 1
+
+        return district, state
+
+    @staticmethod
+    def _grievance_delta(event: ChangeEvent) -> tuple[Callable[[Any], None], Callable[[Any], None]]:
+        def district(payload: dict[str, Any]) -> None:
+            grievances = payload["grievances"]
+            _count(grievances, DISTRICT_GRIEVANCE_COUNTERS, event.before.get("status"), -1)
+            _count(grievances, DISTRICT_GRIEVANCE_COUNTERS, event.after.get("status"), 1)
+            if event.action == "created":
+                grievances["total"] += 1
+
+        def state(payload: dict[str, Any]) -> None:
+            grievances = payload["grievances"]
+            _count(grievances, {"RESOLVED": "resolved"}, event.before.get("status"), -1)
+            _count(grievances, {"RESOLVED": "resolved"}, event.after.get("status"), 1)
+            if event.action == "created":
+                grievances["total"] += 1
+            grievances["open"] = grievances["total"] - grievances["resolved"]
+
+        return district, state
+
+    @staticmethod
+    def handle(db: Session, event: ChangeEvent) -> None:
+        if event.entity == "claim":
+            district_patch, state_patch = CacheInvalidationService._claim_delta(event)
+        else:
+            district_patch, state_patch = CacheInvalidationService._grievance_delta(event)
+
+        stale = [CacheService.CACHE_KEYS["dashboard_summary"]]
+        for key, mutate in (
+            (AggregationService.district_snapshot_key(event.state, event.district), district_patch),
+            (AggregationService.state_snapshot_key(event.state), state_patch),
+        ):
+            try:
+                patched = CacheService.patch(db, key, mutate)
+            except (KeyError, TypeError):
+                db.rollback()
+                patched = False
+            if not patched:
+                stale.append(key)
+        CacheService.expire(db, stale)
+
+
+class ChangeEventBus:
+    """In-process publish/subscribe for committed writes."""
+
+    _subscribers: list[Callable[[Session, ChangeEvent], None]] = [CacheInvalidationService.handle]
+
+    @classmethod
+    def subscribe(cls, handler: Callable[[Session, ChangeEvent], None]) -> None:
+        cls._subscribers.append(handler)
+
+    @classmethod
+    def publish(cls, db: Session, event: ChangeEvent) -> None:
+        """Deliver ``event`` to every subscriber. Call after the write is committed.
+
+        Subscriber failures are logged, never raised: the write itself already succeeded.
+        """
+        for handler in list(cls._subscribers):
+            try:
+                handler(db, event)
+            except Exception:
+                db.rollback()
+                logger.exception("Change event handler {} failed for {}", handler.__qualname__, event)
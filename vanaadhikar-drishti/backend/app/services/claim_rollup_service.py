@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import math
+from typing import Any, Iterable
+
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.claim import Claim
+from app.models.claim_rollup import ClaimRollup
+
+
+class ClaimRollupService:
+    """Maintains claim_rollups, the per (state, district, status, claim_type) claim totals."""
+
+    @staticmethod
+    def fetch(db: Session) -> list[ClaimRollup]:
+        """Return every non-empty rollup row."""
+        return db.query(ClaimRollup).filter(ClaimRollup.claim_count > 0).all()
+
+    @staticmethod
+    def record(
+        db: Session,
+        *,
+        state: str,
+        district: str,
+        status: str,
+        claim_type: str,
+        area_acres: float,
+        sign: int = 1,
+    ) -> None:
+        """Add (sign=1) or remove (sign=-1) one claim from its rollup bucket.
+
+        Does not commit; callers apply it in the same transaction as the claim write.
+        """
+        ClaimRollupService._apply(
+            db,
+            state=state,
+            district=district,
+            status=status,
+            claim_type=claim_type,
+            count=sign,
+            area_acres=sign * (area_acres or 0),
+        )
+
+    @staticmethod
+    def record_many(db: Session, claims: Iterable[Any]) -> int:
+        """Add a batch of new claims (ORM rows or ClaimCreate), one update per rollup bucket.
+
+        Does not commit. Returns the number of buckets touched.
+        """
+        buckets: dict[tuple[str, str, str, str], list[float]] = {}
+        for claim in claims:
+            totals = buckets.setdefault((claim.state, claim.district, claim.status, claim.claim_type), [0, 0.0])
+            totals[0] += 1
+            totals[1] += claim.area_acres or 0
+        for (state, district, status, claim_type), (count, area) in buckets.items():
+            ClaimRollupService._apply(
+                db,
+                state=state,
+                district=district,
+                status=status,
+                claim_type=claim_type,
+                count=int(count),
+                area_acres=area,
+            )
+        return len(buckets)
+
+    @staticmethod
+    def _apply(
+        db: Session,
+        *,
+        state: str,
+        district: str,
+        status: str,
+        claim_type: str,
+        count: int,
+        area_acres: float,
+    ) -> None:
+        key = (
+            ClaimRollup.state == state,
+            ClaimRollup.district == district,
+            ClaimRollup.status == status,
+            ClaimRollup.claim_type == claim_type,
+        )
+        values = {
+            ClaimRollup.claim_count: ClaimRollup.claim_count + count,
+            ClaimRollup.area_acres: ClaimRollup.area_acres + area_acres,
+        }
+        if db.query(ClaimRollup).filter(*key).update(values, synchronize_session=False):
+            return
+
+        try:
+            with db.begin_nested():
+                db.add(
+                    ClaimRollup(
+                        state=state,
+                        district=district,
+                        status=status,
+                        claim_type=claim_type,
+                        claim_count=count,
+                        area_acres=area_acres,
+                    )
+                )
+        except IntegrityError:
+            # Another writer created the bucket first; fall back to incrementing it.
+            db.query(ClaimRollup).filter(*key).update(values, synchronize_session=False)
+
+    @staticmethod
+    def record_claim(db: Session, claim: Claim, sign: int = 1) -> None:
+        """Add or remove ``claim`` from the rollups."""
+        ClaimRollupService.record(
+            db,
+            state=claim.state,
+            district=claim.district,
+            status=claim.status,
+            claim_type=claim.claim_type,
+            area_acres=claim.area_acres,
+            sign=sign,
+        )
+
+    @staticmethod
+    def _totals(db: Session) -> list[Any]:
+        return (
+            db.query(
+                Claim.state,
+                Claim.district,
+                Claim.status,
+                Claim.claim_type,
+                func.count(Claim.id).label("count"),
+                func.sum(Claim.area_acres).label("area"),
+            )
+            .group_by(Claim.state, Claim.district, Claim.status, Claim.claim_type)
+            .all()
+        )
+
+    @staticmethod
+    def rebuild(db: Session) -> int:
+        """Recompute all rollups from the claims table. Returns the number of buckets."""
+        rows = ClaimRollupService._totals(db)
+
+        db.query(ClaimRollup).delete(synchronize_session=False)
+        db.add_all(
+            ClaimRollup(
+                state=row.state,
+                district=row.district,
+                status=row.status,
+                claim_type=row.claim_type,
+                claim_count=int(row.count or 0),
+                area_acres=float(row.area or 0),
+            )
+            for row in rows
+        )
+        db.commit()
+        return len(rows)
+
+    @staticmethod
+    def reconcile(db: Session) -> int:
+        """Correct buckets that drifted from the claims table. Returns how many were corrected.
+
+        Claims written outside the API (seed files, scripts, direct SQL) never reach the
+        incremental updates. Only buckets whose totals differ are written. A claim committed
+        while this runs can be overwritten by the older totals; the next run corrects it.
+        """
+        expected = {
+            (row.state, row.district, row.status, row.claim_type): (int(row.count or 0), float(row.area or 0))
+            for row in ClaimRollupService._totals(db)
+        }
+        corrected = 0
+        for rollup in db.query(ClaimRollup).all():
+            count, area = expected.pop((rollup.state, rollup.district, rollup.status, rollup.claim_type), (0, 0.0))
+            if rollup.claim_count != count or not math.isclose(rollup.area_acres, area, abs_tol=1e-6):
+                rollup.claim_count, rollup.area_acres = count, area
+                corrected += 1
+        db.add_all(
+            ClaimRollup(
+                state=state,
+                district=district,
+                status=status,
+                claim_type=claim_type,
+                claim_count=count,
+                area_acres=area,
+            )
+            for (state, district, status, claim_type), (count, area) in expected.items()
+        )
+        db.commit()
+        return corrected + len(expected)
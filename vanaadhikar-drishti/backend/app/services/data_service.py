@@ -1,22 +1,180 @@
 from __future__ import annotations
 
-from typing import Any
+import base64
+import csv
+import io
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import IO, Any, Callable, Iterator
 
 from fastapi import HTTPException
-from sqlalchemy.orm import Session
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import and_, insert, or_, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Query, Session, load_only
 
+from app.core.config import settings
 from app.models.claim import Claim
 from app.models.data_blob import DataBlob
 from app.models.grievance import Grievance
 from app.models.officer import Officer
 from app.models.village import Village
-from app.schemas.domain import ClaimRead, VillageRead, OfficerRead, GrievanceRead
+from app.schemas.domain import (
+    ClaimCreate,
+    ClaimImportError,
+    ClaimImportResult,
+    ClaimRead,
+    NearbyVillage,
+    VillageRead,
+    OfficerRead,
+    GrievanceRead,
+)
 from app.schemas.pagination import (
     ClaimsPaginatedResponse,
+    ClaimsWithinBboxResponse,
+    NearbyVillagesResponse,
     VillagesPaginatedResponse,
     OfficersPaginatedResponse,
     GrievancesPaginatedResponse,
 )
+from app.services.aggregation_service import AggregationService
+from app.services.cache_service import CacheService
+from app.services.claim_rollup_service import ClaimRollupService
+from app.services.spatial_index import SpatialIndexService
+
+# Keyset columns per resource, with the parser that restores each cursor value.
+Keyset = tuple[tuple[Any, Callable[[Any], Any]], ...]
+
+CLAIM_KEYSET: Keyset = ((Claim.claim_date, date.fromisoformat), (Claim.id, int))
+GRIEVANCE_KEYSET: Keyset = ((Grievance.created_at, datetime.fromisoformat), (Grievance.id, int))
+VILLAGE_KEYSET: Keyset = ((Village.name, str), (Village.id, int))
+OFFICER_KEYSET: Keyset = ((Officer.last_active, datetime.fromisoformat), (Officer.id, int))
+
+
+def _encode_cursor(values: list[Any]) -> str:
+    raw = json.dumps(
+        [v.isoformat() if isinstance(v, (date, datetime)) else v for v in values],
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, keyset: Keyset) -> list[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+        if not isinstance(raw, list) or len(raw) != len(keyset):
+            raise ValueError("cursor shape mismatch")
+        return [parse(value) for (_, parse), value in zip(keyset, raw)]
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _after_keyset(columns: list[Any], values: list[Any], descending: bool) -> Any:
+    """Row-value comparison ``(c1, c2, ...) < (v1, v2, ...)`` (or ``>``) as OR/AND terms."""
+    column, value = columns[0], values[0]
+    beyond = column < value if descending else column > value
+    if len(columns) == 1:
+        return beyond
+    return or_(beyond, and_(column == value, _after_keyset(columns[1:], values[1:], descending)))
+
+
+def _keyset_page(
+    query: Query,
+    keyset: Keyset,
+    *,
+    cursor: str,
+    limit: int,
+    descending: bool = True,
+) -> tuple[list[Any], str | None]:
+    """Fetch one page after ``cursor`` (empty for the first page) and the next cursor."""
+    columns = [column for column, _ in keyset]
+    if cursor:
+        query = query.filter(_after_keyset(columns, _decode_cursor(cursor, keyset), descending))
+    ordering = [column.desc() if descending else column.asc() for column in columns]
+    rows = query.order_by(*ordering).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = _encode_cursor([getattr(rows[-1], column.key) for column in columns])
+    return rows, next_cursor
+
+
+def _gps_point(row: Any) -> dict[str, float] | None:
+    if row.gps_lat is None or row.gps_lng is None:
+        return None
+    return {"lat": row.gps_lat, "lng": row.gps_lng}
+
+
+# Computed response fields and the columns they are derived from.
+SPARSE_COMPUTED_FIELDS: dict[str, tuple[tuple[str, ...], Callable[[Any], Any]]] = {
+    "gpsCoordinates": (("gps_lat", "gps_lng"), _gps_point),
+    "gpsCenter": (("gps_lat", "gps_lng"), _gps_point),
+}
+
+
+@dataclass(frozen=True)
+class Fieldset:
+    """A ``fields=`` projection: the response keys asked for and the columns they need."""
+
+    keys: tuple[str, ...]
+    columns: tuple[Any, ...]
+    values: tuple[Callable[[Any], Any], ...]
+
+    def load_only(self) -> Any:
+        return load_only(*self.columns)
+
+    def rows(self, objects: list[Any]) -> list[dict[str, Any]]:
+        return [{key: value(obj) for key, value in zip(self.keys, self.values)} for obj in objects]
+
+
+def _parse_fieldset(fields: str | None, schema: type[BaseModel], model: Any, keyset: Keyset) -> Fieldset | None:
+    """Resolve a comma-separated ``fields`` value against ``schema``; None when not given.
+
+    Fields are named as the full response serializes them (``claim_id``) or by their
+    schema name (``id``); the response rows use the serialized names either way. Only
+    the requested columns, the primary key and the keyset columns are selected, so
+    unrequested JSON columns are never read from the database.
+    """
+    if not fields:
+        return None
+
+    available: dict[str, tuple[str, tuple[str, ...], Callable[[Any], Any]]] = {}
+    for name, info in schema.model_fields.items():
+        attribute = info.alias or name
+        entry = (attribute, (attribute,), lambda row, attribute=attribute: getattr(row, attribute))
+        available[name] = available[attribute] = entry
+    for name in schema.model_computed_fields:
+        if name in SPARSE_COMPUTED_FIELDS:
+            attributes, value = SPARSE_COMPUTED_FIELDS[name]
+            available[name] = (name, attributes, value)
+
+    requested = list(dict.fromkeys(part.strip() for part in fields.split(",") if part.strip()))
+    unknown = [name for name in requested if name not in available]
+    if unknown:
+        names = sorted({key for key, _, _ in available.values()})
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(unknown)}. Available: {', '.join(names)}",
+        )
+
+    entries = list({available[name][0]: available[name] for name in requested}.values())
+    attributes = dict.fromkeys(
+        [attribute for _, attrs, _ in entries for attribute in attrs] + [column.key for column, _ in keyset]
+    )
+    return Fieldset(
+        keys=tuple(key for key, _, _ in entries),
+        columns=tuple(getattr(model, attribute) for attribute in attributes),
+        values=tuple(value for _, _, value in entries),
+    )
+
+
+def _cached_count(query: Query, resource: str, filters: dict[str, Any]) -> int:
+    """Total for cursor mode, memoized briefly per filter set instead of counted per page."""
+    key = f"count:{resource}:{json.dumps(filters, sort_keys=True)}"
+    return CacheService.get_local(key, settings.list_count_cache_seconds, query.count)
 
 
 def get_blob_payload(db: Session, key: str) -> dict[str, Any] | list[dict[str, Any]]:
@@ -55,6 +213,219 @@ def dashboard_snapshot(db: Session) -> dict[str, Any]:
     }
 
 
+# Export columns keyed by the same names /claims serializes ClaimRead to (its aliases).
+CLAIM_EXPORT_COLUMNS = [
+    (field.alias or name, getattr(Claim, field.alias or name)) for name, field in ClaimRead.model_fields.items()
+]
+
+
+def _filter_claims(query: Any, *, state: str | None, status: str | None, district: str | None) -> Any:
+    """Apply the claim list filters to an ORM ``Query`` or a Core ``select``."""
+    if state:
+        query = query.filter(Claim.state == state)
+    if status:
+        query = query.filter(Claim.status == status)
+    if district:
+        query = query.filter(Claim.district == district)
+    return query
+
+
+def _export_value(value: Any) -> Any:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def export_claims(
+    db: Session,
+    *,
+    fmt: str = "ndjson",
+    state: str | None = None,
+    status: str | None = None,
+    district: str | None = None,
+    batch_size: int = 1000,
+) -> Iterator[str]:
+    """Yield filtered claims as NDJSON lines or CSV chunks from a server-side cursor.
+
+    Rows are read as plain column tuples in ``batch_size`` partitions, so memory
+    stays flat regardless of result size. The generator owns its own session on
+    the same bind because the request session may be closed while streaming.
+    """
+    names = [name for name, _ in CLAIM_EXPORT_COLUMNS]
+    stmt = _filter_claims(
+        select(*(column for _, column in CLAIM_EXPORT_COLUMNS)),
+        state=state,
+        status=status,
+        district=district,
+    ).order_by(Claim.id)
+
+    session = Session(bind=db.get_bind())
+    try:
+        result = session.execute(stmt.execution_options(yield_per=batch_size))
+        if fmt == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(names)
+            for partition in result.partitions():
+                for row in partition:
+                    writer.writerow(
+                        json.dumps(value) if isinstance(value, (dict, list)) else _export_value(value)
+                        for value in row
+                    )
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate(0)
+            if buffer.tell():
+                yield buffer.getvalue()
+        else:
+            for partition in result.partitions():
+                yield "".join(
+                    json.dumps(
+                        {name: _export_value(value) for name, value in zip(names, row)},
+                        ensure_ascii=False,
+                    )
+                    + "\n"
+                    for row in partition
+                )
+    finally:
+        session.close()
+
+
+def _read_import_records(stream: IO[bytes], fmt: str) -> Iterator[tuple[int, dict[str, Any] | None, str | None]]:
+    """Yield ``(row_number, record, parse_error)`` from an NDJSON or CSV byte stream."""
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    try:
+        if fmt == "csv":
+            for number, record in enumerate(csv.DictReader(text), start=1):
+                yield number, record, None
+            return
+        for number, line in enumerate(text, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as exc:
+                yield number, None, f"Invalid JSON: {exc.msg}"
+                continue
+            if not isinstance(record, dict):
+                yield number, None, "Expected a JSON object"
+                continue
+            yield number, record, None
+    finally:
+        text.detach()
+
+
+def _validation_messages(exc: ValidationError) -> list[str]:
+    return [f"{'.'.join(str(part) for part in error['loc']) or 'row'}: {error['msg']}" for error in exc.errors()]
+
+
+def import_claims(
+    db: Session,
+    stream: IO[bytes],
+    *,
+    fmt: str = "ndjson",
+    chunk_size: int = 1000,
+    max_errors: int = 1000,
+) -> ClaimImportResult:
+    """Validate and insert claims from an NDJSON or CSV stream in chunks.
+
+    Each chunk is validated, checked for existing claim ids with one query, inserted
+    with a single executemany and its rollups updated per bucket, then committed.
+    Bad rows are reported (up to ``max_errors``) without aborting the import. Cached
+    dashboard/state/district snapshots are invalidated once at the end.
+    """
+    errors: list[ClaimImportError] = []
+    received = inserted = failed = 0
+    seen: set[str] = set()
+    touched: set[tuple[str, str]] = set()
+    chunk: list[tuple[int, ClaimCreate]] = []
+
+    def reject(number: int, claim_id: str | None, messages: list[str]) -> None:
+        nonlocal failed
+        failed += 1
+        if len(errors) < max_errors:
+            errors.append(ClaimImportError(row=number, claimId=claim_id, errors=messages))
+
+    def insert_chunk() -> None:
+        nonlocal inserted
+        ids = [claim.claim_id for _, claim in chunk]
+        existing = set(db.scalars(select(Claim.claim_id).where(Claim.claim_id.in_(ids))))
+        rows = []
+        for number, claim in chunk:
+            if claim.claim_id in existing:
+                reject(number, claim.claim_id, ["claim_id: already exists"])
+            else:
+                rows.append((number, claim))
+
+        try:
+            with db.begin_nested():
+                if rows:
+                    # The ORM leaves None columns out and batches runs of rows with the same
+                    # columns, so order rows by their null pattern to keep statements few.
+                    params = sorted(
+                        (claim.model_dump() for _, claim in rows),
+                        key=lambda values: tuple(value is None for value in values.values()),
+                    )
+                    db.execute(insert(Claim), params)
+            written = [claim for _, claim in rows]
+        except IntegrityError:
+            # Some row clashed with a concurrent writer; isolate it row by row.
+            written = []
+            for number, claim in rows:
+                try:
+                    with db.begin_nested():
+                        db.execute(insert(Claim), [claim.model_dump()])
+                    written.append(claim)
+                except IntegrityError as exc:
+                    reject(number, claim.claim_id, [str(exc.orig)])
+
+        ClaimRollupService.record_many(db, written)
+        db.commit()
+        inserted += len(written)
+        touched.update((claim.state, claim.district) for claim in written)
+        chunk.clear()
+
+    for number, record, parse_error in _read_import_records(stream, fmt):
+        received += 1
+        if parse_error is not None:
+            reject(number, None, [parse_error])
+            continue
+        try:
+            claim = ClaimCreate.model_validate(record)
+        except ValidationError as exc:
+            claim_id = record.get("claim_id")
+            reject(number, str(claim_id) if claim_id else None, _validation_messages(exc))
+            continue
+        if claim.claim_id in seen:
+            reject(number, claim.claim_id, ["claim_id: duplicated in upload"])
+            continue
+        seen.add(claim.claim_id)
+        chunk.append((number, claim))
+        if len(chunk) >= chunk_size:
+            insert_chunk()
+    if chunk:
+        insert_chunk()
+
+    if inserted:
+        # Too many rows to patch snapshots one event at a time; expire what the import touched.
+        CacheService.expire(
+            db,
+            [
+                CacheService.CACHE_KEYS["dashboard_summary"],
+                *{AggregationService.state_snapshot_key(state) for state, _ in touched},
+                *(AggregationService.district_snapshot_key(state, district) for state, district in touched),
+            ],
+        )
+
+    return ClaimImportResult(
+        received=received,
+        inserted=inserted,
+        failed=failed,
+        errors=errors,
+        errorsTruncated=failed > len(errors),
+    )
+
+
 def search_claims(
     db: Session,
     *,
@@ -63,28 +434,36 @@ def search_claims(
     district: str | None = None,
     page: int = 1,
     limit: int = 20,
+    cursor: str | None = None,
+    fields: str | None = None,
 ) -> ClaimsPaginatedResponse:
-    """Search claims with pagination and filtering."""
-    try:
-        query = db.query(Claim)
-
-        # Apply filters
-        if state:
-            query = query.filter(Claim.state == state)
-        if status:
-            query = query.filter(Claim.status == status)
-        if district:
-            query = query.filter(Claim.district == district)
+    """Search claims with pagination and filtering.
 
-        # Get total count before pagination
-        total = query.count()
-
-        # Apply pagination
-        offset = (page - 1) * limit
-        claims = query.order_by(Claim.claim_date.desc()).offset(offset).limit(limit).all()
+    Passing ``cursor`` (empty for the first page) switches to keyset pagination on
+    ``(claim_date, id)``; ``total`` is then a briefly cached count. Passing ``fields``
+    returns plain rows with only those fields (see ``_parse_fieldset``).
+    """
+    try:
+        fieldset = _parse_fieldset(fields, ClaimRead, Claim, CLAIM_KEYSET)
+        query = _filter_claims(db.query(Claim), state=state, status=status, district=district)
+        if fieldset:
+            query = query.options(fieldset.load_only())
+
+        filters = {"state": state, "status": status, "district": district}
+        next_cursor = None
+        if cursor is not None:
+            total = _cached_count(query, "claims", filters)
+            claims, next_cursor = _keyset_page(query, CLAIM_KEYSET, cursor=cursor, limit=limit)
+        else:
+            # Get total count before pagination
+            total = query.count()
+
+            # Apply pagination
+            offset = (page - 1) * limit
+            claims = query.order_by(Claim.claim_date.desc()).offset(offset).limit(limit).all()
 
         # Convert to response models
-        data = [ClaimRead.model_validate(c) for c in claims]
+        data = fieldset.rows(claims) if fieldset else [ClaimRead.model_validate(c) for c in claims]
 
         # Calculate pages
         pages = (total + limit - 1) // limit
@@ -95,8 +474,11 @@ def search_claims(
             page=page,
             limit=limit,
             pages=pages,
-            filters={"state": state, "status": status, "district": district},
+            filters=filters,
+            next_cursor=next_cursor,
         )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error searching claims: {str(e)}")
 
@@ -110,10 +492,19 @@ def list_grievances(
     priority: str | None = None,
     page: int = 1,
     limit: int = 20,
+    cursor: str | None = None,
+    fields: str | None = None,
 ) -> GrievancesPaginatedResponse:
-    """List grievances with pagination and filtering."""
+    """List grievances with pagination and filtering.
+
+    Passing ``cursor`` switches to keyset pagination on ``(created_at, id)``; passing
+    ``fields`` returns plain rows with only those fields.
+    """
     try:
+        fieldset = _parse_fieldset(fields, GrievanceRead, Grievance, GRIEVANCE_KEYSET)
         query = db.query(Grievance)
+        if fieldset:
+            query = query.options(fieldset.load_only())
 
         # Apply filters
         if state:
@@ -125,20 +516,26 @@ def list_grievances(
         if priority:
             query = query.filter(Grievance.priority == priority)
 
-        # Get total count before pagination
-        total = query.count()
-
-        # Apply pagination
-        offset = (page - 1) * limit
-        grievances = (
-            query.order_by(Grievance.last_updated.desc().nullslast())
-            .offset(offset)
-            .limit(limit)
-            .all()
-        )
+        filters = {"state": state, "status": status, "district": district, "priority": priority}
+        next_cursor = None
+        if cursor is not None:
+            total = _cached_count(query, "grievances", filters)
+            grievances, next_cursor = _keyset_page(query, GRIEVANCE_KEYSET, cursor=cursor, limit=limit)
+        else:
+            # Get total count before pagination
+            total = query.count()
+
+            # Apply pagination
+            offset = (page - 1) * limit
+            grievances = (
+                query.order_by(Grievance.last_updated.desc().nullslast())
+                .offset(offset)
+                .limit(limit)
+                .all()
+            )
 
         # Convert to response models
-        data = [GrievanceRead.model_validate(g) for g in grievances]
+        data = fieldset.rows(grievances) if fieldset else [GrievanceRead.model_validate(g) for g in grievances]
 
         # Calculate pages
         pages = (total + limit - 1) // limit
@@ -149,8 +546,11 @@ def list_grievances(
             page=page,
             limit=limit,
             pages=pages,
-            filters={"state": state, "status": status, "district": district, "priority": priority},
+            filters=filters,
+            next_cursor=next_cursor,
         )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error listing grievances: {str(e)}")
 
@@ -162,10 +562,19 @@ def list_villages(
     district: str | None = None,
     page: int = 1,
     limit: int = 20,
+    cursor: str | None = None,
+    fields: str | None = None,
 ) -> VillagesPaginatedResponse:
-    """List villages with pagination and filtering."""
+    """List villages with pagination and filtering.
+
+    Passing ``cursor`` switches to keyset pagination on ``(name, id)``; passing
+    ``fields`` returns plain rows with only those fields.
+    """
     try:
+        fieldset = _parse_fieldset(fields, VillageRead, Village, VILLAGE_KEYSET)
         query = db.query(Village)
+        if fieldset:
+            query = query.options(fieldset.load_only())
 
         # Apply filters
         if state:
@@ -173,15 +582,23 @@ def list_villages(
         if district:
             query = query.filter(Village.district == district)
 
-        # Get total count before pagination
-        total = query.count()
-
-        # Apply pagination
-        offset = (page - 1) * limit
-        villages = query.order_by(Village.name.asc()).offset(offset).limit(limit).all()
+        filters = {"state": state, "district": district}
+        next_cursor = None
+        if cursor is not None:
+            total = _cached_count(query, "villages", filters)
+            villages, next_cursor = _keyset_page(
+                query, VILLAGE_KEYSET, cursor=cursor, limit=limit, descending=False
+            )
+        else:
+            # Get total count before pagination
+            total = query.count()
+
+            # Apply pagination
+            offset = (page - 1) * limit
+            villages = query.order_by(Village.name.asc()).offset(offset).limit(limit).all()
 
         # Convert to response models
-        data = [VillageRead.model_validate(v) for v in villages]
+        data = fieldset.rows(villages) if fieldset else [VillageRead.model_validate(v) for v in villages]
 
         # Calculate pages
         pages = (total + limit - 1) // limit
@@ -192,12 +609,67 @@ def list_villages(
             page=page,
             limit=limit,
             pages=pages,
-            filters={"state": state, "district": district},
+            filters=filters,
+            next_cursor=next_cursor,
         )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error listing villages: {str(e)}")
 
 
+def nearby_villages(
+    db: Session, *, lat: float, lng: float, k: int = 10, radius_km: float = 25.0
+) -> NearbyVillagesResponse:
+    """The ``k`` villages closest to (lat, lng) within ``radius_km``, nearest first.
+
+    Candidates come from the in-process spatial index; only the hits are loaded, by
+    primary key.
+    """
+    try:
+        hits = SpatialIndexService.index(db, "villages").nearest(lat, lng, k, radius_km)
+        villages = {}
+        if hits:
+            villages = {v.id: v for v in db.query(Village).filter(Village.id.in_([key for key, _ in hits]))}
+        data = [
+            NearbyVillage.model_validate(villages[key]).model_copy(update={"distanceKm": round(distance, 3)})
+            for key, distance in hits
+            if key in villages
+        ]
+        return NearbyVillagesResponse(data=data, center={"lat": lat, "lng": lng}, radius_km=radius_km, k=k)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error finding nearby villages: {str(e)}")
+
+
+def claims_within_bbox(
+    db: Session,
+    *,
+    min_lat: float,
+    min_lng: float,
+    max_lat: float,
+    max_lng: float,
+    limit: int = 100,
+) -> ClaimsWithinBboxResponse:
+    """Claims whose GPS point lies inside the box, at most ``limit``."""
+    try:
+        keys, truncated = SpatialIndexService.index(db, "claims").within_bbox(
+            min_lat, min_lng, max_lat, max_lng, limit
+        )
+        claims = db.query(Claim).filter(Claim.id.in_(keys)).order_by(Claim.id).all() if keys else []
+        return ClaimsWithinBboxResponse(
+            data=[ClaimRead.model_validate(c) for c in claims],
+            bbox={"min_lat": min_lat, "min_lng": min_lng, "max_lat": max_lat, "max_lng": max_lng},
+            limit=limit,
+            truncated=truncated,
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error searching claims by area: {str(e)}")
+
+
 def list_officers(
     db: Session,
     *,
@@ -205,10 +677,19 @@ def list_officers(
     district: str | None = None,
     page: int = 1,
     limit: int = 20,
+    cursor: str | None = None,
+    fields: str | None = None,
 ) -> OfficersPaginatedResponse:
-    """List officers with pagination and filtering."""
+    """List officers with pagination and filtering.
+
+    Passing ``cursor`` switches to keyset pagination on ``(last_active, id)``; passing
+    ``fields`` returns plain rows with only those fields.
+    """
     try:
+        fieldset = _parse_fieldset(fields, OfficerRead, Officer, OFFICER_KEYSET)
         query = db.query(Officer)
+        if fieldset:
+            query = query.options(fieldset.load_only())
 
         # Apply filters
         if state:
@@ -216,15 +697,21 @@ def list_officers(
         if district:
             query = query.filter(Officer.district == district)
 
-        # Get total count before pagination
-        total = query.count()
+        filters = {"state": state, "district": district}
+        next_cursor = None
+        if cursor is not None:
+            total = _cached_count(query, "officers", filters)
+            officers, next_cursor = _keyset_page(query, OFFICER_KEYSET, cursor=cursor, limit=limit)
+        else:
+            # Get total count before pagination
+            total = query.count()
 
-        # Apply pagination
-        offset = (page - 1) * limit
-        officers = query.order_by(Officer.last_active.desc()).offset(offset).limit(limit).all()
+            # Apply pagination
+            offset = (page - 1) * limit
+            officers = query.order_by(Officer.last_active.desc()).offset(offset).limit(limit).all()
 
         # Convert to response models
-        data = [OfficerRead.model_validate(o) for o in officers]
+        data = fieldset.rows(officers) if fieldset else [OfficerRead.model_validate(o) for o in officers]
 
         # Calculate pages
         pages = (total + limit - 1) // limit
@@ -235,7 +722,10 @@ def list_officers(
             page=page,
             limit=limit,
             pages=pages,
-            filters={"state": state, "district": district},
+            filters=filters,
+            next_cursor=next_cursor,
         )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error listing officers: {str(e)}")
\ No newline at end of file
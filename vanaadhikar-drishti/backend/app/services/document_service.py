@@ -1,19 +1,21 @@
 from __future__ import annotations
 
-import json
-import shutil
-import subprocess
-import tempfile
+import hashlib
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from uuid import uuid4
-from typing import Any
+from typing import Any, Callable
 
 import pdfplumber
 import pytesseract
 from fastapi import HTTPException, UploadFile
 from loguru import logger
 from PIL import Image
-from slugify import slugify
+from sqlalchemy import and_, or_, select, update
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
@@ -25,6 +27,9 @@ from app.models.doc_title_community_forest_rights import DocTitleCommunityForest
 from app.models.doc_title_under_occupation import DocTitleUnderOccupation
 from app.models.master_document import MasterDocument
 from app.schemas.document import DocumentMetadata, DocumentUploadResponse, RuleBasedPayload
+from app.services.rule_based_engine import rule_based_engine
+
+UPLOAD_CHUNK_BYTES = 1024 * 1024
 
 TEMPLATE_MODEL_MAP = {
   "DOC_CLAIM_FOREST_LAND": DocClaimForestLand,
@@ -35,29 +40,139 @@ TEMPLATE_MODEL_MAP = {
   "DOC_TITLE_COMMUNITY_FOREST_RESOURCES": DocTitleCommunityForestResources,
 }
 
+_ocr_executor: ProcessPoolExecutor | None = None
+_ocr_executor_lock = threading.Lock()
+
+
+def _ocr_pdf_page(file_path: str, page_index: int) -> str:
+  """Rasterize and OCR one PDF page (runs in an OCR worker process)."""
+  with pdfplumber.open(file_path) as pdf:
+    image = pdf.pages[page_index].to_image(resolution=settings.ocr_dpi).original
+  return pytesseract.image_to_string(image, lang=settings.ocr_language_hint).strip()
+
+
+def _ocr_image_frame(file_path: str, frame_index: int) -> str:
+  """OCR one frame of an image file (runs in an OCR worker process)."""
+  with Image.open(file_path) as image:
+    image.seek(frame_index)
+    frame = image.copy()
+  return pytesseract.image_to_string(frame, lang=settings.ocr_language_hint).strip()
+
+
+def _get_ocr_executor() -> ProcessPoolExecutor:
+  global _ocr_executor
+  if _ocr_executor is None:
+    with _ocr_executor_lock:
+      if _ocr_executor is None:
+        # spawn, not fork: the API process runs threads (ingestion workers, scheduler).
+        _ocr_executor = ProcessPoolExecutor(
+          max_workers=settings.ocr_workers or os.cpu_count() or 1,
+          mp_context=multiprocessing.get_context("spawn"),
+        )
+  return _ocr_executor
+
+
+def shutdown_ocr_executor() -> None:
+  global _ocr_executor
+  with _ocr_executor_lock:
+    if _ocr_executor is not None:
+      _ocr_executor.shutdown(cancel_futures=True)
+      _ocr_executor = None
+
+
+def _run_ocr_jobs(jobs: list[tuple[Callable[[str, int], str], str, int]]) -> list[str]:
+  """Run page/frame OCR jobs, in the shared process pool when there is more than one, in order."""
+  if len(jobs) == 1 or settings.ocr_workers == 1:
+    return [func(path, index) for func, path, index in jobs]
+  executor = _get_ocr_executor()
+  futures = [executor.submit(func, path, index) for func, path, index in jobs]
+  return [future.result() for future in futures]
+
 
 class DocumentIngestionService:
   @staticmethod
-  def _persist_upload(file: UploadFile) -> Path:
+  def _persist_upload(file: UploadFile) -> tuple[Path, str]:
+    """Stream the upload to disk while hashing it; files are stored by SHA-256.
+
+    Re-uploads of the same bytes land on the same path, so the content store holds
+    one copy per distinct file.
+    """
     uploads_dir = settings.uploads_path
-    safe_name = slugify(Path(file.filename or "document").stem)
-    dest_name = f"{safe_name}-{uuid4().hex}{Path(file.filename or '').suffix or '.bin'}"
-    destination = uploads_dir / dest_name
-    with destination.open("wb") as buffer:
-      shutil.copyfileobj(file.file, buffer)
-    return destination
+    suffix = (Path(file.filename or "").suffix or ".bin").lower()
+    digest = hashlib.sha256()
+    temp_path = uploads_dir / f".upload-{uuid4().hex}"
+    try:
+      with temp_path.open("wb") as buffer:
+        while chunk := file.file.read(UPLOAD_CHUNK_BYTES):
+          digest.update(chunk)
+          buffer.write(chunk)
+      content_hash = digest.hexdigest()
+      destination = uploads_dir / content_hash[:2] / f"{content_hash}{suffix}"
+      if destination.exists():
+        temp_path.unlink()
+      else:
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(temp_path, destination)
+    except BaseException:
+      temp_path.unlink(missing_ok=True)
+      raise
+    return destination, content_hash
+
+  @staticmethod
+  def _extraction_version() -> str | None:
+    """Template-set fingerprint (+ translation flag) that extraction results depend on."""
+    try:
+      version = rule_based_engine.template_version
+    except HTTPException:
+      return None
+    return f"{version}+en" if settings.enable_translation else version
+
+  @staticmethod
+  def _find_reusable(db: Session, document: MasterDocument, completed: bool) -> MasterDocument | None:
+    """Latest other document with the same content and OCR language.
+
+    With ``completed`` the template version must match too, so its extraction can be
+    reused; otherwise any document whose OCR text is stored qualifies.
+    """
+    if not document.content_hash:
+      return None
+    query = select(MasterDocument).where(
+      MasterDocument.content_hash == document.content_hash,
+      MasterDocument.ocr_language == document.ocr_language,
+      MasterDocument.id != document.id,
+    )
+    if completed:
+      if not document.template_version:
+        return None
+      query = query.where(
+        MasterDocument.processing_status == "COMPLETED",
+        MasterDocument.template_version == document.template_version,
+        MasterDocument.extracted_payload.is_not(None),
+      )
+    else:
+      query = query.where(MasterDocument.raw_text.is_not(None))
+    return db.execute(query.order_by(MasterDocument.id.desc()).limit(1)).scalars().first()
+
+  def _link_results(self, db: Session, document: MasterDocument, source: MasterDocument) -> None:
+    """Copy a finished duplicate's text and extraction instead of recomputing them."""
+    payload = RuleBasedPayload.model_validate_json(source.extracted_payload)
+    now = datetime.now(timezone.utc)
+    document.raw_text = source.raw_text
+    document.extracted_payload = source.extracted_payload
+    document.document_type = payload.template_id
+    document.processing_status = "COMPLETED"
+    document.started_at = document.started_at or now
+    document.completed_at = now
+    self._persist_entities(db, payload.template_id, document.id, payload.entities)
+    db.add(document)
+    logger.info("Document {} reuses results of document {}", document.id, source.id)
 
   @staticmethod
   def _extract_text(file_path: Path) -> str:
     suffix = file_path.suffix.lower()
     if suffix in {".pdf"}:
-      with pdfplumber.open(file_path) as pdf:
-        pages = [page.extract_text() or "" for page in pdf.pages]
-      text = "\n".join(pages).strip()
-      if text:
-        return text
-      return DocumentIngestionService._run_ocr(file_path)
-    if suffix in {".png", ".jpg", ".jpeg", ".tif"}:
+      return DocumentIngestionService._extract_pdf_text(file_path)
+    if suffix in {".png", ".jpg", ".jpeg", ".tif", ".tiff"}:
       return DocumentIngestionService._run_ocr(file_path)
     if suffix in {".txt"}:
       return file_path.read_text(encoding="utf-8", errors="ignore")
@@ -70,45 +185,31 @@ class DocumentIngestionService:
       return "\n".join(p.text for p in doc.paragraphs)
     return file_path.read_text(encoding="utf-8", errors="ignore")
 
+  @staticmethod
+  def _extract_pdf_text(file_path: Path) -> str:
+    """Use embedded text where pdfplumber finds it and OCR only the remaining (scanned) pages."""
+    with pdfplumber.open(file_path) as pdf:
+      pages = [(page.extract_text() or "").strip() for page in pdf.pages]
+
+    scanned = [index for index, text in enumerate(pages) if not text]
+    if scanned:
+      logger.info("OCR for {} of {} pages in {}", len(scanned), len(pages), file_path.name)
+      jobs = [(_ocr_pdf_page, str(file_path), index) for index in scanned]
+      for index, text in zip(scanned, _run_ocr_jobs(jobs)):
+        pages[index] = text
+    return "\n".join(pages).strip()
+
   @staticmethod
   def _run_ocr(file_path: Path) -> str:
-    image = Image.open(file_path)
-    return pytesseract.image_to_string(image, lang=settings.ocr_language_hint)
+    """OCR an image; every frame of a multi-page TIFF is OCR'd in parallel."""
+    with Image.open(file_path) as image:
+      frame_count = getattr(image, "n_frames", 1)
+    jobs = [(_ocr_image_frame, str(file_path), index) for index in range(frame_count)]
+    return "\n".join(_run_ocr_jobs(jobs)).strip()
 
   @staticmethod
   def _invoke_rule_based(text: str, enable_translation: bool) -> RuleBasedPayload:
-    script = settings.rule_based_script
-    if not script.exists():
-      raise HTTPException(status_code=500, detail="Rule-based module not found")
-
-    with tempfile.TemporaryDirectory() as tmpdir:
-      input_path = Path(tmpdir) / "input.txt"
-      output_path = Path(tmpdir) / "result.json"
-      input_path.write_text(text, encoding="utf-8")
-
-      cmd = [
-        "python",
-        str(script),
-        "--input",
-        str(input_path),
-        "--output",
-        str(output_path),
-      ]
-      if enable_translation:
-        cmd.append("--translate")
-
-      logger.info("Executing rule-based pipeline: {}", " ".join(cmd))
-      proc = subprocess.run(cmd, cwd=settings.rule_based_recog_dir, check=False, capture_output=True, text=True)
-      if proc.returncode != 0:
-        logger.error("Rule-based pipeline failed: {}", proc.stderr)
-        raise HTTPException(status_code=500, detail="Rule-based pipeline failed")
-
-      raw_payload = json.loads(output_path.read_text(encoding="utf-8"))
-      if isinstance(raw_payload, list):
-        if not raw_payload:
-          raise HTTPException(status_code=500, detail="Empty rule-based response")
-        raw_payload = raw_payload[0]
-      return RuleBasedPayload.model_validate(raw_payload)
+    return rule_based_engine.extract(text, enable_translation)
 
   @staticmethod
   def _persist_entities(db: Session, template_id: str, document_id: int, entities: dict[str, Any]):
@@ -120,45 +221,126 @@ class DocumentIngestionService:
     instance = model(document_id=document_id, **payload)
     db.add(instance)
 
-  def ingest(self, db: Session, file: UploadFile, metadata: DocumentMetadata) -> DocumentUploadResponse:
-    saved_path = self._persist_upload(file)
-    raw_text = self._extract_text(saved_path)
+  def enqueue(self, db: Session, file: UploadFile, metadata: DocumentMetadata) -> DocumentUploadResponse:
+    """Save the upload and queue it; OCR and extraction run in the ingestion workers.
+
+    An exact re-upload whose results already exist for the current OCR language and
+    template set completes immediately without being queued.
+    """
+    saved_path, content_hash = self._persist_upload(file)
 
     document = MasterDocument(
       file_name=file.filename or saved_path.name,
       file_path=str(saved_path),
       document_type=metadata.document_type,
       language=metadata.language,
-      raw_text=raw_text,
-      processing_status="PROCESSING",
+      processing_status="PENDING",
+      content_hash=content_hash,
+      ocr_language=settings.ocr_language_hint,
+      template_version=self._extraction_version(),
     )
 
     db.add(document)
+    db.flush()
+    source = self._find_reusable(db, document, completed=True)
+    if source is not None:
+      self._link_results(db, document, source)
     db.commit()
     db.refresh(document)
 
+    return DocumentUploadResponse(
+      document_id=document.id,
+      document_type=document.document_type,
+      processing_status=document.processing_status,
+      template_id=document.document_type if source is not None else None,
+      created_at=document.upload_timestamp,
+    )
+
+  @staticmethod
+  def claim_next(db: Session) -> MasterDocument | None:
+    """Atomically move the oldest queued document to PROCESSING and return it.
+
+    Documents stuck in PROCESSING longer than ``ingestion_job_timeout_seconds`` (a worker
+    died mid-job) are picked up again until ``ingestion_max_attempts`` is reached.
+    """
+    now = datetime.now(timezone.utc)
+    stale_before = now - timedelta(seconds=settings.ingestion_job_timeout_seconds)
+    claimable = or_(
+      MasterDocument.processing_status == "PENDING",
+      and_(MasterDocument.processing_status == "PROCESSING", MasterDocument.started_at < stale_before),
+    )
+    # Give up on documents whose workers kept dying mid-job.
+    db.execute(
+      update(MasterDocument)
+      .where(
+        MasterDocument.processing_status == "PROCESSING",
+        MasterDocument.started_at < stale_before,
+        MasterDocument.attempts >= settings.ingestion_max_attempts,
+      )
+      .values(processing_status="FAILED", error_message="Processing timed out", completed_at=now)
+      .execution_options(synchronize_session=False)
+    )
+    db.commit()
+
+    candidates = db.execute(
+      select(MasterDocument.id)
+      .where(claimable, MasterDocument.attempts < settings.ingestion_max_attempts)
+      .order_by(MasterDocument.id)
+      .limit(5)
+    ).scalars().all()
+
+    for document_id in candidates:
+      # Conditional update: only one worker wins each row.
+      claimed = db.execute(
+        update(MasterDocument)
+        .where(MasterDocument.id == document_id, claimable)
+        .values(
+          processing_status="PROCESSING",
+          started_at=now,
+          attempts=MasterDocument.attempts + 1,
+          error_message=None,
+        )
+        .execution_options(synchronize_session=False)
+      ).rowcount
+      db.commit()
+      if claimed:
+        return db.get(MasterDocument, document_id)
+    return None
+
+  def process(self, db: Session, document: MasterDocument) -> MasterDocument:
+    """Run OCR + rule-based extraction for a claimed document and record the outcome."""
+    raw_text: str | None = None
     try:
+      document.template_version = self._extraction_version()
+      # A duplicate queued before its twin finished may have results by now.
+      source = self._find_reusable(db, document, completed=True)
+      if source is not None:
+        self._link_results(db, document, source)
+        db.commit()
+        return document
+
+      text_source = self._find_reusable(db, document, completed=False)
+      raw_text = text_source.raw_text if text_source is not None else self._extract_text(Path(document.file_path))
+      document.raw_text = raw_text
       payload = self._invoke_rule_based(raw_text, settings.enable_translation)
       document.processing_status = "COMPLETED"
       document.document_type = payload.template_id
       document.extracted_payload = payload.model_dump_json()
+      document.completed_at = datetime.now(timezone.utc)
       self._persist_entities(db, payload.template_id, document.id, payload.entities)
       db.add(document)
       db.commit()
-    except Exception:
+    except Exception as exc:
       db.rollback()
       document.processing_status = "FAILED"
+      if raw_text is not None:
+        document.raw_text = raw_text
+      document.error_message = exc.detail if isinstance(exc, HTTPException) else str(exc)
+      document.completed_at = datetime.now(timezone.utc)
       db.add(document)
       db.commit()
-      raise
-
-    return DocumentUploadResponse(
-      document_id=document.id,
-      document_type=document.document_type,
-      processing_status=document.processing_status,
-      template_id=document.document_type,
-      created_at=document.upload_timestamp,
-    )
+      logger.exception("Ingestion failed for document {}", document.id)
+    return document
 
 
 document_ingestion_service = DocumentIngestionService()
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import importlib.util
+import threading
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from fastapi import HTTPException
+from loguru import logger
+
+from app.core.config import settings
+from app.schemas.document import RuleBasedPayload
+
+
+class RuleBasedEngine:
+  """Long-lived, in-process wrapper around rule_based_recog/extract_entities.py.
+
+  The extraction module and its compiled TemplateIndex are loaded once per process
+  (lazily, on first use) and shared by all requests; the memoized translator from
+  rule_based_recog/translation.py is built once as well. Call ``reload()`` after editing template files.
+  """
+
+  def __init__(self, recog_dir: Path | None = None) -> None:
+    self._recog_dir = recog_dir
+    self._lock = threading.Lock()
+    self._module: ModuleType | None = None
+    self._index: Any = None
+    self._template_version: str | None = None
+    self._translator: Any = None
+
+  @property
+  def recog_dir(self) -> Path:
+    return (self._recog_dir or settings.rule_based_recog_dir).resolve()
+
+  def _load_module(self, name: str = "extract_entities") -> ModuleType:
+    module_path = self.recog_dir / f"{name}.py"
+    if not module_path.exists():
+      raise HTTPException(status_code=500, detail="Rule-based module not found")
+    spec = importlib.util.spec_from_file_location(f"rule_based_{name}", module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)  # type: ignore[union-attr]
+    return module
+
+  def _ensure_loaded(self) -> tuple[ModuleType, Any]:
+    if self._index is None:
+      with self._lock:
+        if self._index is None:
+          module = self._load_module()
+          template_paths = sorted(self.recog_dir.glob("template_*.txt"))
+          index = module.TemplateIndex.load(template_paths)
+          logger.info("Loaded {} rule-based templates from {}", len(index.templates), self.recog_dir)
+          self._module = module
+          self._template_version = module.TemplateIndex.fingerprint(template_paths)
+          self._index = index
+    return self._module, self._index  # type: ignore[return-value]
+
+  @property
+  def template_version(self) -> str:
+    """Fingerprint of the loaded template set; changes whenever a template file does."""
+    self._ensure_loaded()
+    return self._template_version  # type: ignore[return-value]
+
+  def warm(self) -> None:
+    """Load the module and templates ahead of the first upload."""
+    self._ensure_loaded()
+
+  def reload(self) -> None:
+    with self._lock:
+      self._module = None
+      self._index = None
+    self._ensure_loaded()
+
+  def _get_translator(self) -> Any:
+    if self._translator is None:
+      with self._lock:
+        if self._translator is None:
+          translation = self._load_module("translation")
+          memo_path = settings.translation_memo_path or translation.DEFAULT_MEMO_PATH
+          self._translator = translation.Translator(
+            translation.get_backend(settings.translation_backend),
+            translation.TranslationMemo(memo_path),
+          )
+    return self._translator
+
+  def extract(self, text: str, enable_translation: bool) -> RuleBasedPayload:
+    """Match ``text`` against the loaded templates and return the first match."""
+    module, index = self._ensure_loaded()
+    matches = module.extract_entities(index, text)
+    if not matches:
+      raise HTTPException(status_code=500, detail="Empty rule-based response")
+
+    match = matches[0]
+    if enable_translation:
+      match = self._get_translator().translate_matches([match])[0]
+    return RuleBasedPayload(template_id=match["template_id"], entities=match["entities"])
+
+
+rule_based_engine = RuleBasedEngine()
@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import math
+import threading
+from array import array
+from datetime import datetime, timedelta
+from typing import Iterable
+
+from loguru import logger
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.claim import Claim
+from app.models.village import Village
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+# Rows committed slightly out of updated_at order are re-read by the next refresh.
+WATERMARK_OVERLAP = timedelta(seconds=60)
+
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlmb = math.radians(lng2 - lng1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlmb / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+class _Cell:
+    """Points of one grid cell in parallel arrays (24 bytes per point)."""
+
+    __slots__ = ("ids", "lats", "lngs")
+
+    def __init__(self, ids: array | None = None, lats: array | None = None, lngs: array | None = None):
+        self.ids = ids if ids is not None else array("q")
+        self.lats = lats if lats is not None else array("d")
+        self.lngs = lngs if lngs is not None else array("d")
+
+    def add(self, key: int, lat: float, lng: float) -> None:
+        self.ids.append(key)
+        self.lats.append(lat)
+        self.lngs.append(lng)
+
+    def with_point(self, key: int, lat: float, lng: float) -> _Cell:
+        cell = _Cell(array("q", self.ids), array("d", self.lats), array("d", self.lngs))
+        cell.add(key, lat, lng)
+        return cell
+
+    def without(self, key: int) -> _Cell:
+        i = self.ids.index(key)
+        return _Cell(
+            self.ids[:i] + self.ids[i + 1:],
+            self.lats[:i] + self.lats[i + 1:],
+            self.lngs[:i] + self.lngs[i + 1:],
+        )
+
+
+class GridIndex:
+    """Points bucketed into a uniform latitude/longitude grid.
+
+    Keys are table primary keys. Box queries visit only the cells overlapping the
+    box; nearest-neighbour queries visit rings of cells around the query point and
+    stop once no unvisited cell can hold anything closer than the k-th hit. Readers
+    never take the lock: writers replace whole cells (copy-on-write, cells are small),
+    readers only use ``get`` or a snapshot of the cell dict, and ``replace`` swaps in a
+    complete new grid at once.
+    """
+
+    def __init__(self, cell_degrees: float):
+        self.cell_degrees = cell_degrees
+        self._lock = threading.Lock()
+        self._cells: dict[tuple[int, int], _Cell] = {}
+        self._locations: dict[int, tuple[int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._locations)
+
+    def _cell_of(self, lat: float, lng: float) -> tuple[int, int]:
+        return math.floor(lat / self.cell_degrees), math.floor(lng / self.cell_degrees)
+
+    def upsert(self, key: int, lat: float | None, lng: float | None) -> None:
+        """Insert or move ``key``; a missing coordinate removes it."""
+        with self._lock:
+            cells = self._cells
+            location = self._locations.pop(key, None)
+            if location is not None:
+                cell = cells[location].without(key)
+                if cell.ids:
+                    cells[location] = cell
+                else:
+                    del cells[location]
+            if lat is None or lng is None:
+                return
+            location = self._cell_of(lat, lng)
+            cells[location] = cells.get(location, _Cell()).with_point(key, lat, lng)
+            self._locations[key] = location
+
+    def replace(self, points: Iterable[tuple[int, float | None, float | None]]) -> None:
+        """Swap in a grid holding exactly ``points``."""
+        cells: dict[tuple[int, int], _Cell] = {}
+        locations: dict[int, tuple[int, int]] = {}
+        for key, lat, lng in points:
+            if lat is None or lng is None:
+                continue
+            location = self._cell_of(lat, lng)
+            cells.setdefault(location, _Cell()).add(key, lat, lng)
+            locations[key] = location
+        with self._lock:
+            self._cells, self._locations = cells, locations
+
+    def within_bbox(
+        self, min_lat: float, min_lng: float, max_lat: float, max_lng: float, limit: int
+    ) -> tuple[list[int], bool]:
+        """Keys inside the box, at most ``limit``, and whether more were left out."""
+        # Writers add and remove cells concurrently, so read through get() and a snapshot
+        # of the items rather than iterating the live dict.
+        cells = self._cells
+        lo_i, lo_j = self._cell_of(min_lat, min_lng)
+        hi_i, hi_j = self._cell_of(max_lat, max_lng)
+        if (hi_i - lo_i + 1) * (hi_j - lo_j + 1) <= len(cells):
+            candidates = (
+                cell
+                for i in range(lo_i, hi_i + 1)
+                for j in range(lo_j, hi_j + 1)
+                if (cell := cells.get((i, j))) is not None
+            )
+        else:
+            # A box wider than the occupied area: walking the occupied cells is cheaper.
+            candidates = (
+                cell for (i, j), cell in list(cells.items())
+                if lo_i <= i <= hi_i and lo_j <= j <= hi_j
+            )
+
+        keys: list[int] = []
+        for cell in candidates:
+            for key, lat, lng in zip(cell.ids, cell.lats, cell.lngs):
+                if min_lat <= lat <= max_lat and min_lng <= lng <= max_lng:
+                    if len(keys) == limit:
+                        return keys, True
+                    keys.append(key)
+        return keys, False
+
+    def nearest(self, lat: float, lng: float, k: int, radius_km: float) -> list[tuple[int, float]]:
+        """Up to ``k`` (key, distance_km) pairs within ``radius_km``, closest first."""
+        cells = self._cells
+        if not cells:
+            return []
+        ci, cj = self._cell_of(lat, lng)
+        # Cells are narrowest in km at the highest latitude the search can reach.
+        reach = radius_km / KM_PER_DEGREE + self.cell_degrees
+        min_cos = math.cos(math.radians(min(abs(lat) + reach, 89.0)))
+        cell_km = self.cell_degrees * KM_PER_DEGREE * min_cos
+        max_ring = math.ceil(radius_km / cell_km) + 1
+
+        hits: list[tuple[float, int]] = []
+        for ring in range(max_ring + 1):
+            for i in range(ci - ring, ci + ring + 1):
+                step = 1 if abs(i - ci) == ring else 2 * ring
+                for j in range(cj - ring, cj + ring + 1, max(step, 1)):
+                    cell = cells.get((i, j))
+                    if cell is None:
+                        continue
+                    for key, plat, plng in zip(cell.ids, cell.lats, cell.lngs):
+                        distance = haversine_km(lat, lng, plat, plng)
+                        if distance <= radius_km:
+                            hits.append((distance, key))
+            # Anything in ring + 1 or beyond is at least ``ring`` whole cells away.
+            if len(hits) >= k:
+                hits.sort()
+                del hits[k:]
+                if hits[-1][0] <= ring * cell_km:
+                    break
+        hits.sort()
+        return [(key, distance) for distance, key in hits[:k]]
+
+
+class SpatialIndexService:
+    """Process-wide grid indexes over village and claim GPS points.
+
+    Built from the database on first use (or by the background refresher at startup).
+    Writes made through this process are applied immediately via ``record``; writes
+    from other workers, bulk imports and scripts are picked up by ``refresh``, which
+    re-reads rows whose ``updated_at`` moved past the last watermark.
+    """
+
+    _SOURCES = {"villages": Village, "claims": Claim}
+    _indexes = {
+        "villages": GridIndex(settings.spatial_index_cell_degrees),
+        "claims": GridIndex(settings.spatial_index_cell_degrees),
+    }
+    _watermarks: dict[str, datetime | None] = {}
+    _load_lock = threading.Lock()
+
+    @classmethod
+    def index(cls, db: Session, name: str) -> GridIndex:
+        """The named index, loading it first if this process has not yet."""
+        if name not in cls._watermarks:
+            with cls._load_lock:
+                if name not in cls._watermarks:
+                    cls._rebuild(db, name)
+        return cls._indexes[name]
+
+    @classmethod
+    def _rebuild(cls, db: Session, name: str) -> None:
+        model = cls._SOURCES[name]
+        # Read the watermark first: rows updated during the scan are re-read by the next refresh.
+        watermark = db.execute(select(func.max(model.updated_at))).scalar()
+        rows = db.execute(
+            select(model.id, model.gps_lat, model.gps_lng).execution_options(yield_per=10000)
+        )
+        cls._indexes[name].replace((row.id, row.gps_lat, row.gps_lng) for row in rows)
+        cls._watermarks[name] = watermark
+        logger.info("Spatial index {} loaded with {} points", name, len(cls._indexes[name]))
+
+    @classmethod
+    def rebuild(cls, db: Session) -> None:
+        with cls._load_lock:
+            for name in cls._SOURCES:
+                cls._rebuild(db, name)
+
+    @classmethod
+    def refresh(cls, db: Session) -> int:
+        """Apply rows changed since the last load or refresh. Returns how many were re-read."""
+        changed = 0
+        for name, model in cls._SOURCES.items():
+            if name not in cls._watermarks:
+                cls.index(db, name)
+                continue
+            watermark = cls._watermarks[name]
+            query = select(model.id, model.gps_lat, model.gps_lng, model.updated_at)
+            if watermark is not None:
+                query = query.where(model.updated_at >= watermark - WATERMARK_OVERLAP)
+            index = cls._indexes[name]
+            for row in db.execute(query):
+                index.upsert(row.id, row.gps_lat, row.gps_lng)
+                if watermark is None or row.updated_at > watermark:
+                    watermark = row.updated_at
+                changed += 1
+            cls._watermarks[name] = watermark
+        return changed
+
+    @classmethod
+    def record(cls, name: str, key: int, lat: float | None, lng: float | None) -> None:
+        """Apply a write made by this process without waiting for the next refresh."""
+        if name in cls._watermarks:
+            cls._indexes[name].upsert(key, lat, lng)
@@ -1,21 +1,52 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from typing import Any, Callable
 
+from apscheduler.executors.pool import ThreadPoolExecutor as SchedulerThreadPool
 from apscheduler.schedulers.background import BackgroundScheduler
-from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session, sessionmaker
 
+from app.core.config import settings
 from app.db.session import SessionLocal
+from app.models.claim_rollup import ClaimRollup
 from app.services.aggregation_service import AggregationService
 from app.services.cache_service import CacheService
+from app.services.claim_rollup_service import ClaimRollupService
+from app.services.spatial_index import SpatialIndexService
 
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class WarmTarget:
+    """A cache key the refresher knows how to recompute on its own session."""
+
+    key: str
+    compute: Callable[[Session], dict[str, Any] | list]
+    # Claims behind the key; ranks keys nobody has read yet in this process.
+    weight: float = 0.0
+
+
 class CacheRefresher:
-    """Background task scheduler for cache refresh."""
+    """Background task scheduler for cache refresh.
+
+    Every ``cache_warm_interval_seconds`` the refresher discovers the cacheable keys
+    from the data (the dashboard summary plus a snapshot per state and district that
+    has claims), ranks them by how often this process read them recently (claim volume
+    breaks ties, so a fresh process warms the biggest districts first), and recomputes
+    the top ``cache_warm_top_k`` that are missing or will expire before the next run.
+    Keys are refreshed in parallel, ``cache_warm_concurrency`` at a time, each on its own
+    session; the data_blobs lease keeps workers from recomputing the same key twice.
+    Key discovery reads claim_rollups, which is reconciled against the claims table at
+    startup and every ``claim_rollup_reconcile_minutes``.
+    """
 
     _scheduler: BackgroundScheduler | None = None
 
@@ -25,25 +56,41 @@ class CacheRefresher:
         if cls._scheduler is not None:
             return
 
-        cls._scheduler = BackgroundScheduler()
+        cls._scheduler = BackgroundScheduler(
+            executors={"default": SchedulerThreadPool(3)},
+            job_defaults={"coalesce": True, "max_instances": 1},
+        )
+
+        # Recompute hot keys shortly before they expire
+        cls._scheduler.add_job(
+            cls._warm_hot_keys,
+            "interval",
+            seconds=settings.cache_warm_interval_seconds,
+            id="warm_hot_keys",
+            name="Warm Hot Cache Keys",
+            next_run_time=datetime.now(timezone.utc),
+            replace_existing=True,
+        )
 
-        # Refresh dashboard summary every 15 minutes
+        # Fix claim_rollups for claims written outside the API, at startup and periodically
         cls._scheduler.add_job(
-            cls._refresh_dashboard_summary,
+            cls._reconcile_claim_rollups,
             "interval",
-            minutes=15,
-            id="refresh_dashboard_summary",
-            name="Refresh Dashboard Summary",
+            minutes=settings.claim_rollup_reconcile_minutes,
+            id="reconcile_claim_rollups",
+            name="Reconcile Claim Rollups",
+            next_run_time=datetime.now(timezone.utc),
             replace_existing=True,
         )
 
-        # Refresh state snapshots every 15 minutes
+        # Load the spatial index at startup, then pick up rows changed by other workers
         cls._scheduler.add_job(
-            cls._refresh_state_snapshots,
+            cls._refresh_spatial_index,
             "interval",
-            minutes=15,
-            id="refresh_state_snapshots",
-            name="Refresh State Snapshots",
+            seconds=settings.spatial_index_refresh_seconds,
+            id="refresh_spatial_index",
+            name="Refresh Spatial Index",
+            next_run_time=datetime.now(timezone.utc),
             replace_existing=True,
         )
 
@@ -69,33 +116,136 @@ class CacheRefresher:
             logger.info("Cache refresh scheduler stopped")
 
     @staticmethod
-    def _refresh_dashboard_summary():
-        """Refresh dashboard summary cache."""
+    def discover_targets(db: Session) -> list[WarmTarget]:
+        """Every key worth warming, derived from the states and districts present in claim_rollups."""
+        rows = (
+            db.query(
+                ClaimRollup.state,
+                ClaimRollup.district,
+                func.sum(ClaimRollup.claim_count).label("claims"),
+            )
+            .filter(ClaimRollup.claim_count > 0)
+            .group_by(ClaimRollup.state, ClaimRollup.district)
+            .all()
+        )
+
+        state_claims: dict[str, float] = {}
+        targets = []
+        for row in rows:
+            claims = float(row.claims or 0)
+            state_claims[row.state] = state_claims.get(row.state, 0.0) + claims
+            targets.append(
+                WarmTarget(
+                    key=AggregationService.district_snapshot_key(row.state, row.district),
+                    compute=lambda session, state=row.state, district=row.district: (
+                        AggregationService._compute_district_snapshot(session, state, district)
+                    ),
+                    weight=claims,
+                )
+            )
+        targets.extend(
+            WarmTarget(
+                key=AggregationService.state_snapshot_key(state),
+                compute=lambda session, state=state: AggregationService._compute_state_snapshot(session, state),
+                weight=claims,
+            )
+            for state, claims in state_claims.items()
+        )
+        targets.append(
+            WarmTarget(
+                key=CacheService.CACHE_KEYS["dashboard_summary"],
+                compute=AggregationService._compute_dashboard_summary,
+                weight=sum(state_claims.values()),
+            )
+        )
+        return targets
+
+    @staticmethod
+    def select_hot(db: Session, targets: list[WarmTarget]) -> list[WarmTarget]:
+        """The top-K targets by recent reads that are missing or expire before the next run."""
+        scores = CacheService.access_scores()
+        ranked = sorted(targets, key=lambda t: (scores.get(t.key, 0.0), t.weight), reverse=True)
+        top = ranked[: settings.cache_warm_top_k]
+
+        updated = CacheService.updated_at(db, [t.key for t in top])
+        now = datetime.now(timezone.utc)
+        # Refresh once less than two intervals of life remain, so a slow run still lands in time.
+        refresh_after = settings.dashboard_cache_ttl_minutes * 60 - 2 * settings.cache_warm_interval_seconds
+        return [
+            t for t in top
+            if t.key not in updated or (now - updated[t.key]).total_seconds() >= refresh_after
+        ]
+
+    @staticmethod
+    def _refresh_target(target: WarmTarget, session_factory: Callable[[], Session] = SessionLocal) -> bool:
+        db = session_factory()
         try:
-            db = SessionLocal()
-            AggregationService.get_dashboard_summary(db)
-            logger.info("Dashboard summary cache refreshed successfully")
+            return CacheService.refresh(db, target.key, lambda: target.compute(db))
+        except Exception as e:
+            logger.warning(f"Error refreshing cache key {target.key}: {str(e)}")
+            return False
+        finally:
             db.close()
+
+    @classmethod
+    def refresh_targets(
+        cls, targets: list[WarmTarget], session_factory: Callable[[], Session] = SessionLocal
+    ) -> int:
+        """Recompute ``targets`` with bounded parallelism. Returns how many were refreshed here."""
+        if not targets:
+            return 0
+        workers = max(1, min(settings.cache_warm_concurrency, len(targets)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cache-warm") as pool:
+            return sum(pool.map(lambda target: cls._refresh_target(target, session_factory), targets))
+
+    @classmethod
+    def refresh_all(cls, targets: list[WarmTarget], bind: Engine | Connection) -> int:
+        """Recompute ``targets`` on fresh sessions bound to ``bind``. Returns how many were refreshed here."""
+        session_factory = sessionmaker(bind=bind, autocommit=False, autoflush=False)
+        refreshed = cls.refresh_targets(targets, session_factory)
+        logger.info(f"Refreshed {refreshed} of {len(targets)} cache keys on request")
+        return refreshed
+
+    @classmethod
+    def _warm_hot_keys(cls):
+        """Pre-compute the hottest keys before they expire."""
+        try:
+            db = SessionLocal()
+            try:
+                targets = cls.select_hot(db, cls.discover_targets(db))
+            finally:
+                db.close()
+            refreshed = cls.refresh_targets(targets)
+            if targets:
+                logger.info(f"Warmed {refreshed} of {len(targets)} hot cache keys")
         except Exception as e:
-            logger.error(f"Error refreshing dashboard summary: {str(e)}")
+            logger.error(f"Error warming hot cache keys: {str(e)}")
 
     @staticmethod
-    def _refresh_state_snapshots():
-        """Refresh state snapshot caches."""
+    def _reconcile_claim_rollups():
+        """Bring claim_rollups back in line with the claims table."""
         try:
             db = SessionLocal()
-            states = ["MP", "CG", "MH", "OD", "JH", "TS", "VN", "GJ"]
-            
-            for state in states:
-                try:
-                    AggregationService.get_state_snapshot(db, state)
-                except Exception as e:
-                    logger.warning(f"Error refreshing snapshot for state {state}: {str(e)}")
-            
-            logger.info("State snapshots cache refreshed successfully")
-            db.close()
+            try:
+                corrected = ClaimRollupService.reconcile(db)
+            finally:
+                db.close()
+            if corrected:
+                logger.info(f"Corrected {corrected} claim rollup buckets")
+        except Exception as e:
+            logger.error(f"Error reconciling claim rollups: {str(e)}")
+
+    @staticmethod
+    def _refresh_spatial_index():
+        """Apply village and claim coordinate changes to the in-process spatial index."""
+        try:
+            db = SessionLocal()
+            try:
+                SpatialIndexService.refresh(db)
+            finally:
+                db.close()
         except Exception as e:
-            logger.error(f"Error refreshing state snapshots: {str(e)}")
+            logger.error(f"Error refreshing spatial index: {str(e)}")
 
     @staticmethod
     def _cleanup_stale_cache():
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import logging
+import threading
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.services.document_service import document_ingestion_service
+
+
+logger = logging.getLogger(__name__)
+
+
+class IngestionWorkerPool:
+    """Background threads that drain the master_documents ingestion queue.
+
+    Uploads are stored as PENDING rows; each worker claims one with a conditional
+    UPDATE (so several processes can share the table), runs OCR and rule-based
+    extraction, and records COMPLETED or FAILED. Workers poll every
+    ``ingestion_poll_seconds`` and are woken early by ``notify()`` after an upload.
+    """
+
+    _threads: list[threading.Thread] = []
+    _stop_event: threading.Event | None = None
+    _wake_event = threading.Event()
+
+    @classmethod
+    def start(cls, workers: int | None = None):
+        """Start the worker threads."""
+        if cls._stop_event is not None:
+            return
+
+        count = settings.ingestion_workers if workers is None else workers
+        if count <= 0:
+            logger.info("Document ingestion workers disabled")
+            return
+
+        cls._stop_event = threading.Event()
+        cls._threads = [
+            threading.Thread(
+                target=cls._run,
+                args=(cls._stop_event,),
+                name=f"ingestion-worker-{i}",
+                daemon=True,
+            )
+            for i in range(count)
+        ]
+        for thread in cls._threads:
+            thread.start()
+        logger.info(f"Started {count} document ingestion workers")
+
+    @classmethod
+    def stop(cls, timeout: float = 10.0):
+        """Signal workers to exit after their current document."""
+        if cls._stop_event is None:
+            return
+        cls._stop_event.set()
+        cls._wake_event.set()
+        for thread in cls._threads:
+            thread.join(timeout=timeout)
+        cls._threads = []
+        cls._stop_event = None
+        logger.info("Document ingestion workers stopped")
+
+    @classmethod
+    def notify(cls):
+        """Wake idle workers so a fresh upload is picked up without waiting for the poll."""
+        cls._wake_event.set()
+
+    @classmethod
+    def run_once(cls) -> bool:
+        """Claim and process a single queued document. Returns False if the queue was empty."""
+        db = SessionLocal()
+        try:
+            document = document_ingestion_service.claim_next(db)
+            if document is None:
+                return False
+            document_ingestion_service.process(db, document)
+            return True
+        finally:
+            db.close()
+
+    @classmethod
+    def _run(cls, stop_event: threading.Event):
+        while not stop_event.is_set():
+            try:
+                if cls.run_once():
+                    continue
+            except Exception as e:
+                logger.error(f"Ingestion worker error: {str(e)}")
+
+            cls._wake_event.wait(timeout=settings.ingestion_poll_seconds)
+            cls._wake_event.clear()
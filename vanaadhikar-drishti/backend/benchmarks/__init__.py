@@ -0,0 +1,4 @@
+"""Reproducible performance benchmarks for the aggregation, list and ingestion paths.
+
+Run ``python -m benchmarks.run --help`` from the backend directory.
+"""
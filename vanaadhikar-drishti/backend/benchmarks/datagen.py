@@ -0,0 +1,329 @@
+"""Synthetic FRA data at realistic volumes.
+
+Builds on the hand-written rows in ``backend/seed_database.py`` (same four states, real
+FRA districts, the same claim/grievance vocabularies) but generates millions of rows with
+the skew seen in production: a few states and, within each state, a few districts hold
+most of the claims. Generation is deterministic for a given seed and dataset size, so two
+runs against empty databases produce identical tables.
+"""
+
+from __future__ import annotations
+
+import itertools
+import random
+import time
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, Iterator
+
+from loguru import logger
+from sqlalchemy import func, insert, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+from app.models.claim import Claim
+from app.models.grievance import Grievance
+from app.models.officer import Officer
+from app.models.village import Village
+from app.services.claim_rollup_service import ClaimRollupService
+
+# Share of claims per state, roughly following national FRA claim counts.
+STATE_WEIGHTS = {"MP": 0.46, "OD": 0.31, "TG": 0.15, "TR": 0.08}
+
+STATE_DISTRICTS = {
+    "MP": [
+        "Mandla", "Dindori", "Balaghat", "Betul", "Chhindwara", "Seoni", "Shahdol", "Jhabua",
+        "Alirajpur", "Barwani", "Khargone", "Umaria", "Anuppur", "Sidhi", "Singrauli", "Harda",
+    ],
+    "OD": [
+        "Kalahandi", "Mayurbhanj", "Koraput", "Rayagada", "Sundargarh", "Kandhamal", "Keonjhar",
+        "Malkangiri", "Nabarangpur", "Gajapati", "Nuapada", "Sambalpur",
+    ],
+    "TG": [
+        "Adilabad", "Bhadradri Kothagudem", "Mulugu", "Kumuram Bheem Asifabad", "Khammam",
+        "Nagarkurnool", "Mahabubabad", "Jayashankar Bhupalpally",
+    ],
+    "TR": [
+        "West Tripura", "Dhalai", "Gomati", "North Tripura", "South Tripura", "Khowai",
+        "Sepahijala", "Unakoti",
+    ],
+}
+
+# Zipf exponent for districts within a state: the first district gets ~4x the fifth.
+DISTRICT_SKEW = 1.1
+
+CLAIM_TYPES = ["IFR", "CR", "CFR"]
+CLAIM_TYPE_WEIGHTS = [0.78, 0.14, 0.08]
+CLAIM_STATUSES = [
+    "RECEIVED", "FRC_VERIFIED", "SDLC_APPROVED", "DLC_APPROVED", "APPROVED", "PENDING", "REJECTED",
+]
+CLAIM_STATUS_WEIGHTS = [0.12, 0.08, 0.06, 0.05, 0.42, 0.12, 0.15]
+TRIBAL_GROUPS = ["Gond", "Baiga", "Bhil", "Santhal", "Kondh", "Juang", "Koya", "Chenchu", "Reang", "Tripuri"]
+PVTG_GROUPS = {"Baiga", "Juang", "Chenchu", "Reang"}
+REJECTION_REASONS = [
+    "Insufficient evidence of occupation before 13-12-2005",
+    "Land under dispute",
+    "Duplicate claim",
+]
+
+DESIGNATIONS = ["District Collector", "SDLC Officer", "DLC Member", "FRC Member", "Range Officer", "State Commissioner"]
+
+GRIEVANCE_CATEGORIES = ["Delay in processing", "Boundary dispute", "Rejection appeal", "Encroachment", "Patta correction"]
+GRIEVANCE_STATUSES = ["OPEN", "IN_PROGRESS", "PENDING", "RESOLVED", "CLOSED"]
+GRIEVANCE_STATUS_WEIGHTS = [0.25, 0.2, 0.15, 0.3, 0.1]
+PRIORITIES = ["LOW", "MEDIUM", "HIGH", "CRITICAL"]
+PRIORITY_WEIGHTS = [0.3, 0.4, 0.22, 0.08]
+
+FIRST_NAMES = ["Ramesh", "Sunita", "Birsa", "Lakshmi", "Mangal", "Phoolmati", "Sukra", "Kamla", "Jagannath", "Rupa"]
+LAST_NAMES = ["Marko", "Dhurve", "Majhi", "Soren", "Gond", "Naik", "Hembram", "Debbarma", "Kumram", "Uikey"]
+
+# Claims are filed over this many days before the generation date.
+CLAIM_WINDOW_DAYS = 6 * 365
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    """Size and seed of a synthetic dataset; other row counts scale with ``claims``."""
+
+    claims: int
+    seed: int = 42
+    claims_per_village: int = 40
+    claims_per_grievance: int = 25
+    villages_per_officer: int = 20
+
+    @property
+    def villages(self) -> int:
+        return max(self.claims // self.claims_per_village, 50)
+
+    @property
+    def grievances(self) -> int:
+        return max(self.claims // self.claims_per_grievance, 10)
+
+    @property
+    def officers(self) -> int:
+        return max(self.villages // self.villages_per_officer, 10)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            **asdict(self),
+            "villages": self.villages,
+            "grievances": self.grievances,
+            "officers": self.officers,
+        }
+
+
+def _district_weights(state: str) -> list[float]:
+    return [1 / (rank ** DISTRICT_SKEW) for rank in range(1, len(STATE_DISTRICTS[state]) + 1)]
+
+
+def _name(rnd: random.Random) -> str:
+    return f"{rnd.choice(FIRST_NAMES)} {rnd.choice(LAST_NAMES)}"
+
+
+class DataGenerator:
+    """Yields plain row dicts for bulk ``INSERT``; nothing goes through the ORM unit of work."""
+
+    def __init__(self, spec: DatasetSpec, now: datetime | None = None) -> None:
+        self.spec = spec
+        # Pin "now" to midnight so reruns on the same day generate identical rows.
+        current = now or datetime.now(timezone.utc)
+        self.now = current.replace(hour=0, minute=0, second=0, microsecond=0)
+        self._states = list(STATE_WEIGHTS)
+        self._state_weights = list(STATE_WEIGHTS.values())
+        self._district_weights = {state: _district_weights(state) for state in STATE_DISTRICTS}
+
+    def _rng(self, table: str) -> random.Random:
+        # One stream per table keeps each table stable when the others change size.
+        return random.Random(f"{self.spec.seed}:{table}")
+
+    def _place(self, rnd: random.Random) -> tuple[str, str]:
+        state = rnd.choices(self._states, self._state_weights)[0]
+        district = rnd.choices(STATE_DISTRICTS[state], self._district_weights[state])[0]
+        return state, district
+
+    def villages(self) -> Iterator[dict[str, Any]]:
+        rnd = self._rng("villages")
+        for i in range(1, self.spec.villages + 1):
+            state, district = self._place(rnd)
+            population = int(rnd.lognormvariate(6.8, 0.6))
+            tribal_groups = rnd.sample(TRIBAL_GROUPS, rnd.randint(1, 3))
+            yield {
+                "id": i,
+                "code": f"{state}-V{i:07d}",
+                "name": f"{district} Village {i}",
+                "block": f"{district} Block {rnd.randint(1, 6)}",
+                "district": district,
+                "state": state,
+                "population": population,
+                "st_population": int(population * rnd.uniform(0.4, 0.95)),
+                "total_households": max(population // 5, 1),
+                "pvtg_present": any(group in PVTG_GROUPS for group in tribal_groups),
+                "tribal_groups": tribal_groups,
+                "saturation_score": rnd.randint(0, 100),
+                "gps_lat": round(rnd.uniform(18.0, 26.0), 6),
+                "gps_lng": round(rnd.uniform(76.0, 92.0), 6),
+                "created_at": self.now,
+                "updated_at": self.now,
+            }
+
+    def claims(self, villages: list[tuple[str, str, str]]) -> Iterator[dict[str, Any]]:
+        """Claims are spread over ``villages`` ((code, state, district)); larger villages file more."""
+        rnd = self._rng("claims")
+        # A village's claim volume follows a heavy tail as well.
+        village_weights = list(itertools.accumulate(rnd.paretovariate(1.5) for _ in villages))
+        start = self.now.date() - timedelta(days=CLAIM_WINDOW_DAYS)
+        for i in range(1, self.spec.claims + 1):
+            code, state, district = rnd.choices(villages, cum_weights=village_weights)[0]
+            claim_type = rnd.choices(CLAIM_TYPES, CLAIM_TYPE_WEIGHTS)[0]
+            status = rnd.choices(CLAIM_STATUSES, CLAIM_STATUS_WEIGHTS)[0]
+            claim_date = start + timedelta(days=int(CLAIM_WINDOW_DAYS * rnd.random() ** 0.7))
+            tribal_group = rnd.choice(TRIBAL_GROUPS)
+            decided = status in {"APPROVED", "REJECTED"}
+            created_at = datetime.combine(claim_date, datetime.min.time(), tzinfo=timezone.utc)
+            yield {
+                "id": i,
+                "claim_id": f"FRA-{claim_date.year}-{state}-{i:08d}",
+                "claimant_name": _name(rnd),
+                "village_name": f"{district} Village",
+                "village_code": code,
+                "block": f"{district} Block",
+                "district": district,
+                "state": state,
+                "claim_type": claim_type,
+                "area_acres": round(
+                    rnd.lognormvariate(0.8, 0.7) if claim_type == "IFR" else rnd.lognormvariate(4.5, 1.0), 2
+                ),
+                "claim_date": claim_date,
+                "decision_date": claim_date + timedelta(days=rnd.randint(30, 540)) if decided else None,
+                "status": status,
+                "rejection_reason": rnd.choice(REJECTION_REASONS) if status == "REJECTED" else None,
+                "patte_number": f"PT-{state}-{i:08d}" if status == "APPROVED" else None,
+                "tribal_group": tribal_group,
+                "is_pvtg": tribal_group in PVTG_GROUPS,
+                "created_at": created_at,
+                "updated_at": created_at,
+            }
+
+    def officers(self) -> Iterator[dict[str, Any]]:
+        rnd = self._rng("officers")
+        for i in range(1, self.spec.officers + 1):
+            state, district = self._place(rnd)
+            designation = rnd.choice(DESIGNATIONS)
+            yield {
+                "id": i,
+                "officer_id": f"OFF-{state}-{i:06d}",
+                "name": _name(rnd),
+                "designation": designation,
+                "state": state,
+                "district": None if designation == "State Commissioner" else district,
+                "mobile": f"9{rnd.randint(100000000, 999999999)}",
+                "email": f"officer{i}@{state.lower()}.gov.in",
+                "last_active": (self.now - timedelta(minutes=rnd.randint(0, 60 * 24 * 30))).replace(tzinfo=None),
+                "total_claims_handled": rnd.randint(0, 2000),
+                "pending_actions": rnd.randint(0, 60),
+                "created_at": self.now,
+                "updated_at": self.now,
+            }
+
+    def grievances(self) -> Iterator[dict[str, Any]]:
+        rnd = self._rng("grievances")
+        for i in range(1, self.spec.grievances + 1):
+            state, district = self._place(rnd)
+            days_open = int(rnd.expovariate(1 / 45))
+            created_at = self.now - timedelta(days=days_open)
+            yield {
+                "id": i,
+                "grievance_id": f"GRV-{state}-{i:07d}",
+                "claimant_name": _name(rnd),
+                "claim_id": f"FRA-{created_at.year}-{state}-{rnd.randint(1, self.spec.claims):08d}",
+                "village_name": f"{district} Village",
+                "district": district,
+                "state": state,
+                "category": rnd.choice(GRIEVANCE_CATEGORIES),
+                "status": rnd.choices(GRIEVANCE_STATUSES, GRIEVANCE_STATUS_WEIGHTS)[0],
+                "priority": rnd.choices(PRIORITIES, PRIORITY_WEIGHTS)[0],
+                "description": "Synthetic grievance generated for benchmarking.",
+                "filed_date": created_at.date(),
+                "days_open": days_open,
+                "created_at": created_at,
+                "updated_at": created_at,
+            }
+
+
+def _bulk_insert(
+    engine: Engine,
+    model: type,
+    rows: Iterator[dict[str, Any]],
+    total: int,
+    batch_size: int,
+    progress: Callable[[str, int, int], None] | None,
+) -> None:
+    table = model.__table__
+    done = 0
+    while batch := list(itertools.islice(rows, batch_size)):
+        with engine.begin() as conn:
+            conn.execute(insert(table), batch)
+        done += len(batch)
+        if progress is not None:
+            progress(table.name, done, total)
+
+
+def _log_progress(table: str, done: int, total: int) -> None:
+    if done == total or done % 100_000 < 5_000:
+        logger.info("{}: {:,}/{:,} rows", table, done, total)
+
+
+def generate(
+    engine: Engine,
+    spec: DatasetSpec,
+    *,
+    batch_size: int = 5_000,
+    progress: Callable[[str, int, int], None] | None = _log_progress,
+) -> dict[str, float]:
+    """Create the schema and load a synthetic dataset. Returns seconds spent per table.
+
+    The target tables must be empty; claim rollups are rebuilt from the generated claims.
+    """
+    Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        for model in (Village, Claim, Officer, Grievance):
+            if db.execute(select(func.count()).select_from(model)).scalar():
+                raise RuntimeError(f"{model.__tablename__} is not empty; benchmark data needs a fresh database")
+
+    generator = DataGenerator(spec)
+    timings: dict[str, float] = {}
+
+    started = time.perf_counter()
+    villages = []
+
+    def remember(rows: Iterator[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+        for row in rows:
+            villages.append((row["code"], row["state"], row["district"]))
+            yield row
+
+    _bulk_insert(engine, Village, remember(generator.villages()), spec.villages, batch_size, progress)
+    timings["villages"] = time.perf_counter() - started
+
+    for name, model, rows, total in (
+        ("claims", Claim, generator.claims(villages), spec.claims),
+        ("officers", Officer, generator.officers(), spec.officers),
+        ("grievances", Grievance, generator.grievances(), spec.grievances),
+    ):
+        started = time.perf_counter()
+        _bulk_insert(engine, model, rows, total, batch_size, progress)
+        timings[name] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    with Session(engine) as db:
+        ClaimRollupService.rebuild(db)
+    timings["claim_rollups"] = time.perf_counter() - started
+    return timings
+
+
+def row_counts(engine: Engine) -> dict[str, int]:
+    with Session(engine) as db:
+        return {
+            model.__tablename__: db.execute(select(func.count()).select_from(model)).scalar() or 0
+            for model in (Claim, Village, Officer, Grievance)
+        }
@@ -0,0 +1,303 @@
+"""Timed benchmark scenarios.
+
+Each scenario has an untimed ``setup`` that runs before every repetition (to put caches
+in the state being measured) and a timed ``run``. "Cold" means the application caches
+(data_blobs and the in-process LRU) are empty; the database's own buffer pool is not
+flushed, so cold numbers measure query work rather than disk reads.
+"""
+
+from __future__ import annotations
+
+import io
+import itertools
+import statistics
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+from loguru import logger
+from sqlalchemy import event, func, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+from starlette.datastructures import UploadFile
+
+from app.core.config import settings
+from app.models.claim import Claim
+from app.models.claim_rollup import ClaimRollup
+from app.schemas.document import DocumentMetadata
+from app.services.aggregation_service import AggregationService
+from app.services.cache_service import CacheService
+from app.services.data_service import _encode_cursor, search_claims
+from app.services.document_service import document_ingestion_service
+
+
+@dataclass
+class BenchContext:
+    """Shared state for one benchmark run; scenarios open sessions from ``session_factory``."""
+
+    engine: Engine
+    session_factory: sessionmaker
+    page_size: int = 50
+    deep_fraction: float = 0.9
+    ingestion_batch: int = 20
+    ingestion_sample: Path | None = None
+    db: Session = field(init=False)
+    state: dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self.db = self.session_factory()
+
+    def new_session(self) -> None:
+        """Start each repetition with an empty identity map, like a fresh request."""
+        self.db.close()
+        self.db = self.session_factory()
+
+    def close(self) -> None:
+        self.db.close()
+
+
+@dataclass
+class Scenario:
+    name: str
+    description: str
+    run: Callable[[BenchContext], dict[str, Any] | None]
+    setup: Callable[[BenchContext], Any] | None = None
+
+
+class _StatementCounter:
+    def __init__(self, engine: Engine) -> None:
+        self.engine = engine
+        self.count = 0
+
+    def _on_execute(self, *args: Any) -> None:
+        self.count += 1
+
+    def __enter__(self) -> "_StatementCounter":
+        event.listen(self.engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        event.remove(self.engine, "before_cursor_execute", self._on_execute)
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    index = min(int(round(fraction * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+def time_scenario(ctx: BenchContext, scenario: Scenario, repeat: int, warmup: int) -> dict[str, Any]:
+    """Run ``scenario`` ``warmup + repeat`` times and summarise the timed repetitions."""
+    samples: list[float] = []
+    statements: list[int] = []
+    extra: dict[str, Any] = {}
+    for iteration in range(warmup + repeat):
+        ctx.new_session()
+        if scenario.setup is not None:
+            scenario.setup(ctx)
+        with _StatementCounter(ctx.engine) as counter:
+            started = time.perf_counter()
+            result = scenario.run(ctx)
+            elapsed = time.perf_counter() - started
+        if iteration < warmup:
+            continue
+        samples.append(elapsed)
+        statements.append(counter.count)
+        for key, value in (result or {}).items():
+            extra.setdefault(key, []).append(value)
+
+    return {
+        "description": scenario.description,
+        "repeat": repeat,
+        "seconds": {
+            "min": min(samples),
+            "median": statistics.median(samples),
+            "p95": _percentile(samples, 0.95),
+            "mean": statistics.fmean(samples),
+            "max": max(samples),
+        },
+        "samples": samples,
+        "sql_statements": int(statistics.median(statements)),
+        "extra": {key: statistics.median(values) for key, values in extra.items()},
+    }
+
+
+def _clear_caches(ctx: BenchContext) -> None:
+    CacheService.clear_all(ctx.db)
+
+
+def _summary(ctx: BenchContext) -> None:
+    AggregationService.get_dashboard_summary(ctx.db)
+
+
+def _prime_summary(ctx: BenchContext) -> None:
+    if "summary_primed" not in ctx.state:
+        CacheService.clear_all(ctx.db)
+        AggregationService.get_dashboard_summary(ctx.db)
+        ctx.state["summary_primed"] = True
+
+
+def _prime_summary_in_db_only(ctx: BenchContext) -> None:
+    _prime_summary(ctx)
+    CacheService._local.clear()
+
+
+def _claim_total(ctx: BenchContext) -> int:
+    if "claim_total" not in ctx.state:
+        ctx.state["claim_total"] = ctx.db.execute(select(func.count()).select_from(Claim)).scalar() or 0
+    return ctx.state["claim_total"]
+
+
+def _deep_page(ctx: BenchContext) -> int:
+    return max(int(_claim_total(ctx) * ctx.deep_fraction) // ctx.page_size, 1)
+
+
+def _first_page(ctx: BenchContext) -> None:
+    search_claims(ctx.db, page=1, limit=ctx.page_size)
+
+
+def _deep_offset_page(ctx: BenchContext) -> dict[str, Any]:
+    page = _deep_page(ctx)
+    search_claims(ctx.db, page=page, limit=ctx.page_size)
+    return {"page": page}
+
+
+def _deep_cursor(ctx: BenchContext) -> str:
+    """Cursor pointing just before the deep offset page, built from the row ending the previous page."""
+    if "deep_cursor" not in ctx.state:
+        offset = (_deep_page(ctx) - 1) * ctx.page_size - 1
+        row = ctx.db.execute(
+            select(Claim.claim_date, Claim.id)
+            .order_by(Claim.claim_date.desc(), Claim.id.desc())
+            .offset(max(offset, 0))
+            .limit(1)
+        ).one()
+        ctx.state["deep_cursor"] = _encode_cursor([row.claim_date, row.id])
+    return ctx.state["deep_cursor"]
+
+
+def _deep_keyset_page(ctx: BenchContext) -> dict[str, Any]:
+    search_claims(ctx.db, limit=ctx.page_size, cursor=_deep_cursor(ctx))
+    return {"page": _deep_page(ctx)}
+
+
+def _districts(ctx: BenchContext) -> tuple[tuple[str, str], tuple[str, str]]:
+    """The districts with the most and the fewest claims."""
+    if "districts" not in ctx.state:
+        rows = ctx.db.execute(
+            select(ClaimRollup.state, ClaimRollup.district, func.sum(ClaimRollup.claim_count).label("claims"))
+            .group_by(ClaimRollup.state, ClaimRollup.district)
+            .order_by(func.sum(ClaimRollup.claim_count).desc())
+        ).all()
+        if not rows:
+            raise RuntimeError("claim_rollups is empty; generate the dataset first")
+        ctx.state["districts"] = ((rows[0].state, rows[0].district), (rows[-1].state, rows[-1].district))
+    return ctx.state["districts"]
+
+
+def _prepare_district_snapshot(ctx: BenchContext) -> None:
+    _districts(ctx)
+    _clear_caches(ctx)
+
+
+def _district_snapshot(largest: bool) -> Callable[[BenchContext], dict[str, Any]]:
+    def run(ctx: BenchContext) -> dict[str, Any]:
+        state, district = _districts(ctx)[0 if largest else 1]
+        snapshot = AggregationService.get_district_snapshot(ctx.db, state, district)
+        return {"claims": snapshot["claims"]["total"]}
+
+    return run
+
+
+_document_counter = itertools.count(1)
+
+
+def _ingest_batch(ctx: BenchContext) -> dict[str, Any]:
+    """Upload ``ingestion_batch`` distinct text documents and drain the queue in-process."""
+    sample = ctx.ingestion_sample or settings.rule_based_recog_dir / "input.txt"
+    body = Path(sample).read_text(encoding="utf-8")
+
+    for _ in range(ctx.ingestion_batch):
+        # A unique trailer defeats content-hash deduplication so every upload is processed.
+        number = next(_document_counter)
+        content = f"{body}\n\nReference: BENCH-{time.time_ns()}-{number}\n".encode("utf-8")
+        upload = UploadFile(io.BytesIO(content), filename=f"bench-{number}.txt")
+        document_ingestion_service.enqueue(ctx.db, upload, DocumentMetadata())
+
+    started = time.perf_counter()
+    completed = failed = 0
+    error: str | None = None
+    while (document := document_ingestion_service.claim_next(ctx.db)) is not None:
+        document = document_ingestion_service.process(ctx.db, document)
+        if document.processing_status == "COMPLETED":
+            completed += 1
+        else:
+            failed += 1
+            error = error or document.error_message
+    processing = time.perf_counter() - started
+    if not completed:
+        # Failures return early, so their timings would read as fast ingestion.
+        raise RuntimeError(f"No document was ingested ({failed} failed): {error}")
+    if failed:
+        logger.error("{} of {} benchmark documents failed: {}", failed, completed + failed, error)
+    return {
+        "completed": completed,
+        "failed": failed,
+        "documents_per_second": (completed + failed) / processing if processing else 0.0,
+    }
+
+
+SCENARIOS: dict[str, Scenario] = {
+    scenario.name: scenario
+    for scenario in (
+        Scenario(
+            "summary_cold",
+            "Dashboard summary with data_blobs and the local cache emptied",
+            _summary,
+            setup=_clear_caches,
+        ),
+        Scenario(
+            "summary_db_cached",
+            "Dashboard summary served from data_blobs (another worker computed it)",
+            _summary,
+            setup=_prime_summary_in_db_only,
+        ),
+        Scenario(
+            "summary_warm",
+            "Dashboard summary served from the in-process cache",
+            _summary,
+            setup=_prime_summary,
+        ),
+        Scenario("claims_first_page", "search_claims, first offset page", _first_page),
+        Scenario(
+            "claims_deep_offset",
+            "search_claims, offset page at deep_fraction of all claims",
+            _deep_offset_page,
+            setup=_deep_cursor,
+        ),
+        Scenario(
+            "claims_deep_keyset",
+            "search_claims, cursor page at the same depth as claims_deep_offset",
+            _deep_keyset_page,
+            setup=_deep_cursor,
+        ),
+        Scenario(
+            "district_snapshot_largest_cold",
+            "District snapshot of the district with the most claims, caches emptied",
+            _district_snapshot(largest=True),
+            setup=_prepare_district_snapshot,
+        ),
+        Scenario(
+            "district_snapshot_smallest_cold",
+            "District snapshot of the district with the fewest claims, caches emptied",
+            _district_snapshot(largest=False),
+            setup=_prepare_district_snapshot,
+        ),
+        Scenario(
+            "document_ingestion",
+            "Enqueue and process a batch of text uploads (persist, dedup lookup, extraction)",
+            _ingest_batch,
+        ),
+    )
+}
@@ -196,6 +196,31 @@ class TestAuthServiceMethods:
             AuthService.get_current_user(db, "invalid.token.format")
         db.close()
 
+    def test_verified_token_is_cached_until_invalidated(self):
+        db = TestingSessionLocal()
+        user = User(
+            email="cached@example.com",
+            name="Cached User",
+            provider="google",
+        )
+        db.add(user)
+        db.commit()
+        db.refresh(user)
+
+        token, _ = AuthService.generate_access_token(user)
+        first = AuthService.get_current_user_profile(db, token)
+        with patch("app.services.auth_service.jwt.decode") as mock_decode:
+            again = AuthService.get_current_user_profile(db, token)
+            mock_decode.assert_not_called()
+        assert again.email == first.email == "cached@example.com"
+
+        AuthService.invalidate_token(token)
+        with patch("app.services.auth_service.jwt.decode", side_effect=Exception("expired")):
+            with pytest.raises(ValueError):
+                AuthService.verify_token(token)
+
+        db.close()
+
 
 class TestProtectedEndpoints:
     @patch("httpx.Client.post")
@@ -4,6 +4,12 @@ Production Services - API Endpoint Tests
 Test paginated endpoints with filtering
 """
 
+import csv
+import io
+import json
+import threading
+from datetime import date, datetime, timedelta, timezone
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
@@ -12,16 +18,31 @@ from sqlalchemy.orm import sessionmaker
 from app.main import app
 from app.db.base_class import Base
 from app.db.session import get_db
+from app.api.dependencies import get_current_user
+from app.api.endpoints.claims import create_claim
+from app.schemas.auth import UserResponse
 from app.models.claim import Claim
 from app.models.village import Village
 from app.models.officer import Officer
 from app.models.grievance import Grievance
+from app.models.claim_rollup import ClaimRollup
+from app.models.master_document import MasterDocument
+from app.schemas.document import RuleBasedPayload
+from app.services.document_service import DocumentIngestionService, document_ingestion_service
+from app.core.config import settings
+from app.core.metrics import instrument_engine, metrics
+from app.services.aggregation_service import AggregationService
+from app.services.cache_service import CacheService
+from app.services.claim_rollup_service import ClaimRollupService
+from app.services.spatial_index import GridIndex, SpatialIndexService
+from app.tasks.cache_refresher import CacheRefresher
 
 
 # Test database setup
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test_services.db"
 engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+instrument_engine(engine)
 
 
 def override_get_db():
@@ -113,6 +134,15 @@ def setup_database():
     db.drop_all()
 
 
+@pytest.fixture
+def authenticated():
+    now = datetime(2026, 2, 23)
+    user = UserResponse(id=1, email="tester@gov.in", name="Tester", created_at=now, updated_at=now)
+    app.dependency_overrides[get_current_user] = lambda: user
+    yield user
+    del app.dependency_overrides[get_current_user]
+
+
 class TestClaimsEndpoint:
     def test_get_claims_default_pagination(self):
         response = client.get("/api/v1/claims")
@@ -165,6 +195,227 @@ class TestClaimsEndpoint:
         response = client.get("/api/v1/claims/NONEXISTENT")
         assert response.status_code == 404
 
+    def test_get_claims_cursor_pagination(self):
+        seen = []
+        cursor = ""
+        while cursor is not None:
+            response = client.get("/api/v1/claims", params={"cursor": cursor, "limit": 7})
+            assert response.status_code == 200
+            data = response.json()
+            assert data["total"] == 30
+            seen.extend(claim["claim_id"] for claim in data["data"])
+            cursor = data["next_cursor"]
+        assert len(seen) == 30
+        assert len(set(seen)) == 30
+
+    def test_get_claims_invalid_cursor(self):
+        response = client.get("/api/v1/claims?cursor=not-a-cursor")
+        assert response.status_code == 400
+
+    def test_export_claims_requires_auth(self):
+        response = client.get("/api/v1/claims/export?format=csv")
+        assert response.status_code == 401
+
+    def test_export_claims_uses_list_keys(self, authenticated):
+        listed = client.get("/api/v1/claims?limit=1").json()["data"][0]
+
+        response = client.get("/api/v1/claims/export?format=ndjson&status=PENDING")
+        assert response.status_code == 200
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert len(rows) == 10
+        assert set(rows[0]) <= set(listed)
+        assert {"claim_id", "claimant_name", "is_pvtg", "area_acres"} <= set(rows[0])
+        assert rows[0]["claim_id"] == "FRA-2026-MP-00003"
+        assert rows[0]["claim_date"] == "2025-11-15"
+        assert all(row["status"] == "PENDING" for row in rows)
+
+        response = client.get("/api/v1/claims/export?format=csv&status=PENDING")
+        assert response.status_code == 200
+        reader = csv.DictReader(io.StringIO(response.text))
+        assert reader.fieldnames == list(rows[0])
+        records = list(reader)
+        assert [record["claim_id"] for record in records] == [row["claim_id"] for row in rows]
+        assert records[0]["claimant_name"] == "Claimant 3"
+
+    def test_bulk_import_claims_requires_auth(self):
+        files = {"file": ("claims.ndjson", b'{"claim_id": "C-1"}\n', "application/x-ndjson")}
+        response = client.post("/api/v1/claims/bulk", files=files)
+        assert response.status_code == 401
+
+    def test_get_claims_sparse_fields(self):
+        response = client.get("/api/v1/claims?limit=5&fields=claim_id,status,areaAcres")
+        assert response.status_code == 200
+        for row in response.json()["data"]:
+            assert set(row) == {"claim_id", "status", "area_acres"}
+
+        response = client.get("/api/v1/claims?fields=claim_id,not_a_field")
+        assert response.status_code == 400
+
+    def test_get_claims_within_bbox(self):
+        db = TestingSessionLocal()
+        for claim in db.query(Claim):
+            claim.gps_lat, claim.gps_lng = 22.0 + int(claim.claim_id[-5:]) * 0.01, 80.0
+        db.commit()
+        SpatialIndexService.rebuild(db)
+        db.close()
+
+        response = client.get(
+            "/api/v1/claims/within-bbox?min_lat=22.005&min_lng=79.9&max_lat=22.055&max_lng=80.1&limit=3"
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["data"]) == 3
+        assert data["truncated"] is True
+
+
+def _import_row(number, **overrides):
+    row = {
+        "claim_id": f"FRA-2026-MP-{number:05d}",
+        "claimant_name": f"Imported {number}",
+        "village_name": "Village 1",
+        "village_code": "VIL-MP-001",
+        "district": "Mandla",
+        "state": "MP",
+        "claim_type": "IFR",
+        "area_acres": 1.5,
+        "claim_date": "2026-01-10",
+        "status": "PENDING",
+    }
+    row.update(overrides)
+    return row
+
+
+def _bulk_import(body, filename="claims.ndjson"):
+    response = client.post("/api/v1/claims/bulk", files={"file": (filename, body)})
+    assert response.status_code == 200
+    return response.json()
+
+
+class TestClaimImport:
+    def test_reports_bad_rows_by_line(self, authenticated):
+        lines = [
+            json.dumps(_import_row(101)),
+            "{not json",
+            json.dumps(_import_row(102, area_acres="lots")),
+            json.dumps(_import_row(101, claimant_name="Again")),
+            json.dumps(_import_row(1)),
+            json.dumps(_import_row(103)),
+        ]
+        result = _bulk_import("\n".join(lines).encode())
+
+        assert result["received"] == 6
+        assert result["inserted"] == 2
+        assert result["failed"] == 4
+        errors = {error["row"]: error for error in result["errors"]}
+        assert set(errors) == {2, 3, 4, 5}
+        assert errors[2]["claimId"] is None
+        assert errors[2]["errors"][0].startswith("Invalid JSON")
+        assert errors[3]["claimId"] == "FRA-2026-MP-00102"
+        assert errors[3]["errors"][0].startswith("area_acres:")
+        assert errors[4]["errors"] == ["claim_id: duplicated in upload"]
+        assert errors[5]["errors"] == ["claim_id: already exists"]
+
+        db = TestingSessionLocal()
+        imported = {claim.claim_id: claim for claim in db.query(Claim).filter(Claim.claimant_name.like("Imported%"))}
+        db.close()
+        assert set(imported) == {"FRA-2026-MP-00101", "FRA-2026-MP-00103"}
+
+    def test_round_trips_export_csv(self, authenticated):
+        exported = client.get("/api/v1/claims/export?format=csv&status=PENDING").text
+        renamed = exported.replace("FRA-2026-MP-", "FRA-2027-MP-")
+        result = _bulk_import(renamed.encode(), filename="claims.csv")
+        assert result["received"] == 10
+        assert result["inserted"] == 10
+        assert result["errors"] == []
+
+    def test_updates_rollups_and_expires_snapshots(self, authenticated):
+        db = TestingSessionLocal()
+        ClaimRollupService.rebuild(db)
+        db.close()
+        before = client.get("/api/v1/dashboard/district/MP/Mandla").json()["claims"]
+
+        rows = [_import_row(200 + i, status="APPROVED" if i % 2 else "PENDING") for i in range(4)]
+        result = _bulk_import("\n".join(json.dumps(row) for row in rows).encode())
+        assert result["inserted"] == 4
+
+        after = client.get("/api/v1/dashboard/district/MP/Mandla").json()["claims"]
+        assert after["total"] == before["total"] + 4
+        assert after["pending"] == before["pending"] + 2
+        assert after["approved"] == before["approved"] + 2
+
+        db = TestingSessionLocal()
+        pending = (
+            db.query(ClaimRollup)
+            .filter_by(state="MP", district="Mandla", status="PENDING", claim_type="IFR")
+            .one()
+        )
+        ifr_pending = db.query(Claim).filter_by(status="PENDING", claim_type="IFR").count()
+        db.close()
+        assert pending.claim_count == ifr_pending
+
+    def test_inserts_in_chunks(self, authenticated, monkeypatch):
+        monkeypatch.setattr(settings, "claim_import_chunk_size", 2)
+        chunks = []
+        record_many = ClaimRollupService.record_many
+
+        def spy(db, claims):
+            claims = list(claims)
+            chunks.append([claim.claim_id for claim in claims])
+            return record_many(db, claims)
+
+        monkeypatch.setattr(ClaimRollupService, "record_many", spy)
+
+        rows = [_import_row(300 + i) for i in range(4)] + [_import_row(5), _import_row(304)]
+        result = _bulk_import("\n".join(json.dumps(row) for row in rows).encode())
+
+        assert result["inserted"] == 5
+        assert result["failed"] == 1
+        assert result["errors"][0]["row"] == 5
+        assert chunks == [
+            ["FRA-2026-MP-00300", "FRA-2026-MP-00301"],
+            ["FRA-2026-MP-00302", "FRA-2026-MP-00303"],
+            ["FRA-2026-MP-00304"],
+        ]
+
+
+class TestSpatialIndex:
+    def test_queries_run_while_points_move(self):
+        index = GridIndex(0.05)
+        index.replace((key, 20.0 + key * 0.01, 80.0) for key in range(500))
+        stop = threading.Event()
+        errors = []
+
+        def write():
+            step = 0
+            while not stop.is_set():
+                key = step % 500
+                # Alternate between moving a point into a fresh cell and removing it.
+                if step % 2:
+                    index.upsert(key, None, None)
+                else:
+                    index.upsert(key, 30.0 + step * 0.1, 90.0)
+                step += 1
+
+        def read():
+            try:
+                for _ in range(300):
+                    index.within_bbox(-90, -180, 90, 180, 10_000)
+                    index.within_bbox(20.0, 79.9, 22.0, 80.1, 10_000)
+                    index.nearest(21.0, 80.0, 5, 50)
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+        writer = threading.Thread(target=write)
+        readers = [threading.Thread(target=read) for _ in range(2)]
+        writer.start()
+        for reader in readers:
+            reader.start()
+        for reader in readers:
+            reader.join()
+        stop.set()
+        writer.join()
+        assert errors == []
+
 
 class TestVillagesEndpoint:
     def test_get_villages_default_pagination(self):
@@ -196,6 +447,33 @@ class TestVillagesEndpoint:
         for village in data["data"]:
             assert village["district"] == "Mandla"
 
+    def test_get_villages_cursor_pagination(self):
+        response = client.get("/api/v1/villages?cursor=&limit=10")
+        assert response.status_code == 200
+        first = response.json()
+        assert len(first["data"]) == 10
+        assert first["next_cursor"]
+
+        response = client.get("/api/v1/villages", params={"cursor": first["next_cursor"], "limit": 10})
+        second = response.json()
+        first_codes = {village["code"] for village in first["data"]}
+        assert not first_codes & {village["code"] for village in second["data"]}
+
+    def test_get_nearby_villages(self):
+        db = TestingSessionLocal()
+        for village in db.query(Village):
+            index = int(village.code[-3:])
+            village.gps_lat, village.gps_lng = 22.0 + index * 0.01, 80.0
+        db.commit()
+        SpatialIndexService.rebuild(db)
+        db.close()
+
+        response = client.get("/api/v1/villages/nearby?lat=22.0&lng=80.0&k=3&radius_km=10")
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert [v["code"] for v in data] == ["VIL-MP-001", "VIL-MP-002", "VIL-MP-003"]
+        assert data[0]["distanceKm"] < data[1]["distanceKm"] < data[2]["distanceKm"]
+
     def test_get_single_village(self):
         response = client.get("/api/v1/villages/VIL-MP-001")
         assert response.status_code == 200
@@ -314,5 +592,292 @@ class TestGrievancesEndpoint:
         assert data["priority"] == "CRITICAL"
 
 
+class TestDocumentsEndpoint:
+    @pytest.fixture(autouse=True)
+    def uploads(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(settings, "upload_dir", tmp_path)
+
+    @staticmethod
+    def _upload(content=b"Claim for forest land by Claimant 1"):
+        response = client.post(
+            "/api/v1/documents/upload-document", files={"file": ("claim.txt", content, "text/plain")}
+        )
+        assert response.status_code == 202
+        data = response.json()
+        assert data["processing_status"] == "PENDING"
+        return data["document_id"]
+
+    @staticmethod
+    def _extract(monkeypatch, result):
+        def invoke(text, enable_translation):
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        monkeypatch.setattr(DocumentIngestionService, "_invoke_rule_based", staticmethod(invoke))
+
+    def test_get_document_status_not_found(self):
+        response = client.get("/api/v1/documents/999999")
+        assert response.status_code == 404
+
+    def test_upload_is_processed_by_worker(self, monkeypatch):
+        payload = RuleBasedPayload(template_id="DOC_CLAIM_FOREST_LAND", entities={"claimant_name": "Claimant 1"})
+        self._extract(monkeypatch, payload)
+        document_id = self._upload()
+        assert client.get(f"/api/v1/documents/{document_id}").json()["processing_status"] == "PENDING"
+
+        db = TestingSessionLocal()
+        document = document_ingestion_service.claim_next(db)
+        assert document.id == document_id
+        assert document.processing_status == "PROCESSING"
+        document_ingestion_service.process(db, document)
+        assert document_ingestion_service.claim_next(db) is None
+        db.close()
+
+        data = client.get(f"/api/v1/documents/{document_id}").json()
+        assert data["processing_status"] == "COMPLETED"
+        assert data["attempts"] == 1
+        assert data["template_id"] == "DOC_CLAIM_FOREST_LAND"
+        assert data["payload"]["entities"] == {"claimant_name": "Claimant 1"}
+
+    def test_extraction_error_marks_document_failed(self, monkeypatch):
+        self._extract(monkeypatch, ValueError("no template matched"))
+        document_id = self._upload()
+
+        db = TestingSessionLocal()
+        document_ingestion_service.process(db, document_ingestion_service.claim_next(db))
+        db.close()
+
+        data = client.get(f"/api/v1/documents/{document_id}").json()
+        assert data["processing_status"] == "FAILED"
+        assert data["error_message"] == "no template matched"
+
+    def test_stuck_document_is_retried_until_max_attempts(self, monkeypatch):
+        monkeypatch.setattr(settings, "ingestion_max_attempts", 2)
+        document_id = self._upload()
+
+        def abandon(db):
+            # The worker holding the document died: its lease outlives the job timeout.
+            stale = datetime.now(timezone.utc) - timedelta(seconds=settings.ingestion_job_timeout_seconds + 60)
+            db.query(MasterDocument).filter_by(id=document_id).update({"started_at": stale})
+            db.commit()
+
+        db = TestingSessionLocal()
+        assert document_ingestion_service.claim_next(db).id == document_id
+        assert document_ingestion_service.claim_next(db) is None
+
+        abandon(db)
+        document = document_ingestion_service.claim_next(db)
+        assert document.id == document_id
+        assert document.attempts == 2
+
+        abandon(db)
+        assert document_ingestion_service.claim_next(db) is None
+        db.close()
+
+        data = client.get(f"/api/v1/documents/{document_id}").json()
+        assert data["processing_status"] == "FAILED"
+        assert data["attempts"] == 2
+        assert data["error_message"] == "Processing timed out"
+
+
+class TestDashboardCache:
+    def test_cache_refresh_discovers_states_and_districts_from_data(self):
+        db = TestingSessionLocal()
+        ClaimRollupService.rebuild(db)
+        db.close()
+
+        response = client.post("/api/v1/dashboard/cache/refresh")
+        assert response.status_code == 202
+        # Dashboard summary + state MP + district MP/Mandla
+        assert response.json()["discovered_keys"] == 3
+
+        # The test client runs background tasks before returning.
+        stats = client.get("/api/v1/dashboard/cache/stats").json()
+        assert {entry["key"] for entry in stats["keys"]} == {
+            "dashboard_summary",
+            "state_snapshot_MP",
+            "district_snapshot_MP_Mandla",
+        }
+
+    def test_grievance_writes_update_cached_snapshots(self):
+        before = client.get("/api/v1/dashboard/district/MP/Mandla").json()["grievances"]
+
+        client.post(
+            "/api/v1/grievances",
+            json={
+                "grievance_id": "GRV-2026-MP-99001",
+                "claimant_name": "Cache Test",
+                "village_name": "Village 1",
+                "district": "Mandla",
+                "state": "MP",
+                "category": "Slow Processing",
+                "status": "OPEN",
+                "priority": "LOW",
+                "description": "Snapshot should count this",
+            },
+        )
+        created = client.get("/api/v1/dashboard/district/MP/Mandla").json()["grievances"]
+        assert created["total"] == before["total"] + 1
+        assert created["open"] == before["open"] + 1
+
+        client.patch("/api/v1/grievances/GRV-2026-MP-99001", json={"status": "RESOLVED"})
+        resolved = client.get("/api/v1/dashboard/district/MP/Mandla").json()["grievances"]
+        assert resolved["open"] == before["open"]
+        assert resolved["resolved"] == before["resolved"] + 1
+
+    def test_claim_writes_update_cached_snapshots(self, authenticated):
+        district_before = client.get("/api/v1/dashboard/district/MP/Mandla").json()["claims"]
+        state_before = client.get("/api/v1/dashboard/state/MP").json()["claims"]
+
+        db = TestingSessionLocal()
+        create_claim(
+            authenticated,
+            db,
+            {
+                "claim_id": "FRA-2026-MP-99001",
+                "claimant_name": "Cache Test",
+                "village_name": "Village 1",
+                "village_code": "VIL-MP-001",
+                "district": "Mandla",
+                "state": "MP",
+                "claim_type": "IFR",
+                "area_acres": 4.0,
+                "claim_date": date(2026, 1, 10),
+                "status": "PENDING",
+            },
+        )
+        db.close()
+
+        district = client.get("/api/v1/dashboard/district/MP/Mandla").json()["claims"]
+        assert district["total"] == district_before["total"] + 1
+        assert district["pending"] == district_before["pending"] + 1
+        assert district["approved"] == district_before["approved"]
+        assert district["total_area"] == pytest.approx(district_before["total_area"] + 4.0)
+
+        state = client.get("/api/v1/dashboard/state/MP").json()["claims"]
+        assert state["total"] == state_before["total"] + 1
+        assert state["pending"] == state_before["pending"] + 1
+        assert state["by_district"]["Mandla"] == state_before["by_district"]["Mandla"] + 1
+
+    def test_write_during_recompute_is_not_overwritten(self):
+        key = AggregationService.district_snapshot_key("MP", "Mandla")
+        before = client.get("/api/v1/dashboard/district/MP/Mandla").json()["grievances"]
+
+        # Another worker starts recomputing the snapshot before the write lands.
+        db = TestingSessionLocal()
+        token = CacheService.acquire_lease(db, key)
+        stale = AggregationService._compute_district_snapshot(db, "MP", "Mandla")
+
+        client.post(
+            "/api/v1/grievances",
+            json={
+                "grievance_id": "GRV-2026-MP-99002",
+                "claimant_name": "Race Test",
+                "village_name": "Village 1",
+                "district": "Mandla",
+                "state": "MP",
+                "category": "Slow Processing",
+                "status": "OPEN",
+                "priority": "LOW",
+                "description": "Written while the snapshot was being recomputed",
+            },
+        )
+
+        assert CacheService.set(db, key, stale, lease_token=token) is None
+        CacheService.release_lease(db, key, token)
+        db.close()
+
+        after = client.get("/api/v1/dashboard/district/MP/Mandla").json()["grievances"]
+        assert after["total"] == before["total"] + 1
+
+    def test_reconcile_picks_up_claims_written_outside_the_api(self):
+        db = TestingSessionLocal()
+        assert CacheRefresher.discover_targets(db)[:-1] == []
+        # The fixture inserts claims directly, as seed files and scripts do.
+        assert ClaimRollupService.reconcile(db) == 4
+        assert ClaimRollupService.reconcile(db) == 0
+
+        db.query(Claim).filter_by(claim_id="FRA-2026-MP-00003").update({"status": "REJECTED"})
+        db.commit()
+        assert ClaimRollupService.reconcile(db) == 2
+        totals = {(r.status, r.claim_type): r.claim_count for r in ClaimRollupService.fetch(db)}
+        keys = [target.key for target in CacheRefresher.discover_targets(db)]
+        db.close()
+
+        assert totals[("REJECTED", "CFR")] == 1
+        assert totals[("PENDING", "CFR")] == 4
+        assert sum(totals.values()) == 30
+        assert "district_snapshot_MP_Mandla" in keys
+
+    def test_cache_stats_and_clear_leave_leases_alone(self):
+        db = TestingSessionLocal()
+        CacheService.clear_all(db)
+        client.get("/api/v1/dashboard/district/MP/Mandla")
+        token = CacheService.acquire_lease(db, "dashboard_summary")
+        assert token
+
+        stats = client.get("/api/v1/dashboard/cache/stats").json()
+        assert stats["total_keys"] == 1
+        assert [entry["key"] for entry in stats["keys"]] == ["district_snapshot_MP_Mandla"]
+
+        assert client.delete("/api/v1/dashboard/cache/clear").json()["cleared_count"] == 1
+        assert CacheService.acquire_lease(db, "dashboard_summary") is None
+        CacheService.release_lease(db, "dashboard_summary", token)
+        db.close()
+
+    def test_district_snapshot_counts(self):
+        db = TestingSessionLocal()
+        snapshot = AggregationService._compute_district_snapshot(db, "MP", "Mandla")
+        db.close()
+        assert snapshot["claims"] == {
+            "total": 30,
+            "approved": 20,
+            "pending": 10,
+            "rejected": 0,
+            "total_area": pytest.approx(sum(2.5 + i * 0.1 for i in range(1, 31))),
+        }
+        assert snapshot["villages"] == {"total": 25, "population": sum(2000 + i * 100 for i in range(1, 26))}
+        assert snapshot["grievances"] == {"total": 10, "open": 5, "resolved": 5}
+
+    def test_dashboard_summary_is_served_pre_encoded(self):
+        plain = client.get("/api/v1/dashboard/summary", headers={"Accept-Encoding": "identity"})
+        assert plain.status_code == 200
+        assert "content-encoding" not in plain.headers
+
+        compressed = client.get("/api/v1/dashboard/summary", headers={"Accept-Encoding": "gzip"})
+        assert compressed.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in compressed.headers["vary"]
+        assert compressed.json() == plain.json()
+
+
+class TestMetricsEndpoint:
+    def test_metrics_exposes_route_latency_and_sql_counts(self):
+        metrics.reset()
+        client.get("/api/v1/claims?limit=1")
+        client.get("/api/v1/claims/FRA-2026-MP-00001")
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        lines = dict(line.rsplit(" ", 1) for line in response.text.splitlines() if not line.startswith("#"))
+        assert lines['http_requests_total{method="GET",route="/api/v1/claims",status="200"}'] == "1"
+        assert 'http_requests_total{method="GET",route="/api/v1/claims/{claim_id}",status="200"}' in lines
+        assert float(lines['http_request_sql_statements_sum{method="GET",route="/api/v1/claims"}']) > 0
+
+    def test_list_counts_are_memoized_apart_from_cached_payloads(self):
+        db = TestingSessionLocal()
+        CacheService.clear_all(db)
+        db.close()
+        metrics.reset()
+
+        first = client.get("/api/v1/claims?cursor=&limit=5&state=MP").json()
+        client.get(f"/api/v1/claims?cursor={first['next_cursor']}&limit=5&state=MP")
+
+        lookups = metrics.cache_counts()
+        assert lookups["memo_miss"] == 1
+        assert lookups["memo_hit"] == 1
+        assert "miss" not in lookups
+        assert client.get("/api/v1/dashboard/cache/stats").json()["local_entries"] == 0
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])